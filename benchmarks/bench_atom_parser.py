@@ -0,0 +1,61 @@
+"""Micro-benchmark of arXiv Atom feed parsing.
+
+Compares the streaming parser in ``arxiv_mcp_server.clients.atom`` with the
+previous ``feedparser`` + ``arxiv.Result._from_feed_entry`` path on recorded
+feeds. Run from the repository root:
+
+    python benchmarks/bench_atom_parser.py [feed.xml ...]
+
+Without arguments the feed in ``tests/fixtures`` is used.
+"""
+
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import arxiv
+import feedparser
+
+from arxiv_mcp_server.clients.atom import parse_feed
+
+DEFAULT_FEEDS = [Path(__file__).parent.parent / "tests/fixtures/arxiv_feed.xml"]
+
+
+def parse_with_feedparser(content: bytes):
+    return [arxiv.Result._from_feed_entry(e) for e in feedparser.parse(content).entries]
+
+
+def parse_with_atom(content: bytes):
+    return parse_feed(content).entries
+
+
+def peak_memory(func, content: bytes) -> int:
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(paths):
+    for path in paths:
+        content = Path(path).read_bytes()
+        print(f"{path} ({len(content) / 1024:.0f} KiB)")
+        timings = {}
+        for name, func in (
+            ("feedparser", parse_with_feedparser),
+            ("atom", parse_with_atom),
+        ):
+            number = 20
+            best = min(timeit.repeat(lambda: func(content), number=number, repeat=5))
+            timings[name] = best / number
+            print(
+                f"  {name:<11} {timings[name] * 1000:8.2f} ms/feed"
+                f"  peak {peak_memory(func, content) / 1024:8.0f} KiB"
+            )
+        print(f"  speed-up    {timings['feedparser'] / timings['atom']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or DEFAULT_FEEDS)
@@ -0,0 +1,91 @@
+"""Benchmark of page-parallel PDF to Markdown conversion.
+
+Converts PDFs of growing page counts once in a single pass and once split into
+page ranges on the conversion engine's worker processes, and checks that both
+give the same Markdown. Run from the repository root:
+
+    python benchmarks/bench_conversion.py [--workers N] [paper.pdf ...]
+
+Without PDF arguments, synthetic papers of 20 to 200 pages are generated.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pymupdf
+import pymupdf4llm
+
+from arxiv_mcp_server import conversion
+from arxiv_mcp_server.conversion import ConversionEngine, page_count
+
+PAGE_COUNTS = [20, 50, 100, 200]
+
+
+def make_pdf(path: Path, pages: int) -> Path:
+    """Write a paper-like PDF with sections, subsections and body text."""
+    doc = pymupdf.open()
+    for number in range(pages):
+        page = doc.new_page()
+        y = 72
+        if number % 6 == 0:
+            page.insert_text((72, y), f"{number // 6 + 1} Section", fontsize=18)
+            y += 32
+        elif number % 6 == 3:
+            page.insert_text((72, y), f"{number // 6 + 1}.1 Subsection", fontsize=14)
+            y += 26
+        for line in range(45):
+            text = f"Page {number}, line {line}: attention layers scale with context."
+            page.insert_text((72, y), text, fontsize=10)
+            y += 14
+    doc.save(path)
+    return path
+
+
+async def main(paths, workers: int):
+    engine = ConversionEngine(workers)
+    # Start the worker processes before timing anything
+    await asyncio.gather(*(engine.run("warm-up", os.getpid) for _ in range(workers)))
+    min_pages = conversion.settings.CONVERSION_MIN_CHUNK_PAGES
+    print(f"{workers} workers, ranges of at least {min_pages} pages")
+    print(f"{'pages':>6} {'serial s':>9} {'parallel s':>11} {'speed-up':>9}  same")
+    try:
+        for pdf_path in paths:
+            serial_md = pdf_path.with_suffix(".serial.md")
+            parallel_md = pdf_path.with_suffix(".parallel.md")
+
+            started = time.perf_counter()
+            serial_md.write_text(
+                pymupdf4llm.to_markdown(str(pdf_path), show_progress=False),
+                encoding="utf-8",
+            )
+            serial = time.perf_counter() - started
+
+            started = time.perf_counter()
+            await engine.convert(pdf_path.stem, pdf_path, parallel_md)
+            parallel = time.perf_counter() - started
+
+            same = serial_md.read_bytes() == parallel_md.read_bytes()
+            print(
+                f"{page_count(pdf_path):>6} {serial:>9.2f} {parallel:>11.2f}"
+                f" {serial / parallel:>8.1f}x  {same}"
+            )
+    finally:
+        engine.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", type=Path)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdfs = args.pdfs or [
+            make_pdf(Path(tmp) / f"synthetic-{pages}.pdf", pages)
+            for pages in PAGE_COUNTS
+        ]
+        asyncio.run(main(pdfs, args.workers))
@@ -0,0 +1,112 @@
+"""Benchmark of peak memory use of PDF to Markdown conversion.
+
+Converts every PDF of a fixed corpus in a fresh process, once as a whole
+document with ``pymupdf4llm.to_markdown`` and once page by page the way the
+conversion workers do, and reports the peak resident memory of each. Run from
+the repository root:
+
+    python benchmarks/bench_memory.py [paper.pdf ...]
+
+Without PDF arguments, a synthetic corpus of image-heavy papers is generated;
+it is the same on every run.
+"""
+
+import argparse
+import multiprocessing
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pymupdf
+import pymupdf4llm
+
+from arxiv_mcp_server.conversion import convert_pages, page_count, part_paths
+
+# Pages per synthetic paper
+CORPUS = [20, 60, 120]
+IMAGE_SIZE = 480
+
+
+def make_pdf(path: Path, pages: int, seed: int) -> Path:
+    """Write a paper with a large incompressible figure and text on every page."""
+    rng = random.Random(seed)
+    doc = pymupdf.open()
+    for number in range(pages):
+        page = doc.new_page()
+        if number % 5 == 0:
+            page.insert_text((72, 72), f"{number // 5 + 1} Section", fontsize=18)
+        pixels = bytes(rng.getrandbits(8) for _ in range(IMAGE_SIZE * IMAGE_SIZE * 3))
+        figure = pymupdf.Pixmap(pymupdf.csRGB, IMAGE_SIZE, IMAGE_SIZE, pixels, False)
+        page.insert_image(pymupdf.Rect(72, 90, 540, 558), pixmap=figure)
+        y = 580
+        for line in range(14):
+            text = f"Page {number}, line {line}: the figure shows attention maps."
+            page.insert_text((72, y), text, fontsize=10)
+            y += 14
+    doc.save(path)
+    return path
+
+
+def _peak_rss() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def whole_document(pdf_path: Path, md_path: Path):
+    """Convert in one call and write the Markdown at once."""
+    started = time.perf_counter()
+    md_path.write_text(
+        pymupdf4llm.to_markdown(str(pdf_path), show_progress=False), encoding="utf-8"
+    )
+    return time.perf_counter() - started, _peak_rss()
+
+
+def page_by_page(pdf_path: Path, md_path: Path):
+    """Convert the way the conversion workers do, flushing every page."""
+    started = time.perf_counter()
+    convert_pages(pdf_path, 0, page_count(pdf_path), *part_paths(md_path, 0))
+    return time.perf_counter() - started, _peak_rss()
+
+
+def measure(mode, pdf_path: Path, md_path: Path):
+    """Run a conversion in a freshly spawned process."""
+    with ProcessPoolExecutor(
+        1, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        return pool.submit(mode, pdf_path, md_path).result()
+
+
+def main(paths) -> None:
+    print(
+        f"{'pages':>6} {'PDF MiB':>8} {'whole MiB':>10} {'paged MiB':>10}"
+        f" {'whole s':>8} {'paged s':>8}"
+    )
+    for pdf_path in paths:
+        whole_s, whole_rss = measure(
+            whole_document, pdf_path, pdf_path.with_suffix(".whole.md")
+        )
+        paged_s, paged_rss = measure(
+            page_by_page, pdf_path, pdf_path.with_suffix(".paged.md")
+        )
+        print(
+            f"{page_count(pdf_path):>6} {pdf_path.stat().st_size / 2**20:>8.1f}"
+            f" {whole_rss / 2**20:>10.0f} {paged_rss / 2**20:>10.0f}"
+            f" {whole_s:>8.2f} {paged_s:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdfs = args.pdfs or [
+            make_pdf(Path(tmp) / f"figures-{pages}.pdf", pages, seed=pages)
+            for pages in CORPUS
+        ]
+        main(pdfs)
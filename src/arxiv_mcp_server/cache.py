@@ -0,0 +1,184 @@
+"""Result caching for the arXiv MCP server."""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("arxiv-mcp-server")
+
+
+@dataclass
+class _Entry:
+    """A cached value with its expiry time and approximate size."""
+
+    value: Any
+    expires_at: float
+    size: int
+
+
+class ResultCache:
+    """LRU cache with per-entry TTL, a memory budget and optional disk persistence.
+
+    Values must be JSON-serialisable. Their serialised length is used as the
+    size estimate for the memory budget and as the on-disk representation.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl: float = 3600,
+        persist_dir: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries held in memory.
+            max_bytes: Maximum total serialised size of entries held in memory.
+            ttl: Default time-to-live of an entry in seconds.
+            persist_dir: Directory for on-disk persistence; disabled if None.
+            clock: Time source returning seconds since the epoch.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.persist_dir = persist_dir
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        if persist_dir is not None:
+            persist_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_disk()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key`` or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None:
+                self._insert(key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        payload = json.dumps(value)
+        entry = _Entry(
+            value=value,
+            expires_at=self._clock() + (self.ttl if ttl is None else ttl),
+            size=len(payload),
+        )
+        if entry.size > self.max_bytes:
+            logger.debug(f"Not caching oversized entry ({entry.size} bytes)")
+            return
+        self._insert(key, entry)
+        self._store(key, entry, payload)
+
+    def clear(self) -> None:
+        """Remove all entries from memory and disk."""
+        self._entries.clear()
+        self._bytes = 0
+        if self.persist_dir is not None:
+            for path in self.persist_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def _insert(self, key: str, entry: _Entry) -> None:
+        """Insert an entry and evict least recently used ones over budget."""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+            logger.debug(f"Evicted cache entry {evicted_key}")
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry from memory."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _path(self, key: str) -> Path:
+        """Get the on-disk location of an entry."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.persist_dir / f"{digest}.json"
+
+    def _store(self, key: str, entry: _Entry, payload: str) -> None:
+        """Persist an entry to disk if persistence is enabled."""
+        if self.persist_dir is None:
+            return
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({"key": key, "expires_at": entry.expires_at})
+                + "\n"
+                + payload,
+                encoding="utf-8",
+            )
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not persist cache entry: {e}")
+
+    def _load(self, key: str) -> Optional[_Entry]:
+        """Load an unexpired entry from disk if persistence is enabled."""
+        if self.persist_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            header, payload = path.read_text(encoding="utf-8").split("\n", 1)
+            meta = json.loads(header)
+        except (OSError, ValueError):
+            return None
+        if meta.get("key") != key:
+            return None
+        if meta["expires_at"] <= self._clock():
+            path.unlink(missing_ok=True)
+            self.expirations += 1
+            return None
+        return _Entry(json.loads(payload), meta["expires_at"], len(payload))
+
+    def _prune_disk(self) -> None:
+        """Delete expired entries left on disk by earlier runs."""
+        now = self._clock()
+        for path in self.persist_dir.glob("*.json"):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    meta = json.loads(f.readline())
+                if meta["expires_at"] <= now:
+                    path.unlink(missing_ok=True)
+            except (OSError, ValueError, KeyError):
+                path.unlink(missing_ok=True)
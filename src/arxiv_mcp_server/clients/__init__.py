@@ -0,0 +1,21 @@
+"""Clients for external services used by the arXiv MCP server."""
+
+from .arxiv_client import ArxivClient, ResultPage, get_arxiv_client
+from .atom import Paper, parse_feed
+from .coalesce import SingleFlight
+from .http import get_http_client, close_http_client
+from .rate_limit import Priority, RateLimiter, get_rate_limiter
+
+__all__ = [
+    "ArxivClient",
+    "get_arxiv_client",
+    "ResultPage",
+    "Paper",
+    "parse_feed",
+    "get_http_client",
+    "close_http_client",
+    "Priority",
+    "RateLimiter",
+    "get_rate_limiter",
+    "SingleFlight",
+]
@@ -0,0 +1,288 @@
+"""Asynchronous arXiv API client for the arXiv MCP server."""
+
+import logging
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import AsyncIterator, List, Optional
+from urllib.parse import urlparse
+
+import arxiv
+import httpx
+from .atom import AtomFeedParser, FeedPage, Paper
+from .coalesce import SingleFlight
+from .http import get_http_client
+from .rate_limit import Priority, RateLimiter, get_rate_limiter
+from .resumable import DownloadProgress, IncompleteDownloadError, PartialDownload
+
+logger = logging.getLogger("arxiv-mcp-server")
+
+
+class ResultPage(List[Paper]):
+    """One page of search results with its position in the full result list.
+
+    ``start`` is the arXiv ``start`` offset the page was requested at and
+    ``end`` the offset of the next page, counting entries the parser skipped.
+    """
+
+    def __init__(
+        self,
+        entries: List[Paper],
+        start: int = 0,
+        total_results: Optional[int] = None,
+        skipped: int = 0,
+    ):
+        super().__init__(entries)
+        self.start = start
+        self.end = start + len(entries) + skipped
+        self.total_results = total_results
+
+
+class ArxivClient:
+    """Asynchronous counterpart of ``arxiv.Client`` built on ``httpx``.
+
+    Pages are fetched without blocking the event loop, so concurrent tool calls
+    overlap instead of queueing behind each other. Every request goes through
+    the global rate limiter, which keeps all tools together within the arXiv
+    API terms of use, and identical concurrent requests share one round trip.
+    """
+
+    query_url = "https://export.arxiv.org/api/query"
+    download_scheme = "https"
+    download_domain = "export.arxiv.org"
+
+    def __init__(
+        self,
+        page_size: int = 100,
+        num_retries: int = 3,
+        session: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            page_size: Maximum number of results requested per API page.
+            num_retries: Number of retries for failed or unexpectedly empty pages.
+            session: Optional HTTP session; defaults to the shared pool.
+            rate_limiter: Optional rate limiter; defaults to the global one.
+        """
+        self.page_size = page_size
+        self.num_retries = num_retries
+        self._session = session
+        self._rate_limiter = rate_limiter
+        self._flights = SingleFlight()
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """Return the injected session or the process-wide connection pool."""
+        return self._session if self._session is not None else get_http_client()
+
+    async def _acquire_slot(self, priority: Priority) -> None:
+        """Wait for the rate limiter to grant a request slot."""
+        limiter = self._rate_limiter or get_rate_limiter()
+        await limiter.acquire(priority)
+
+    async def results(
+        self,
+        search: arxiv.Search,
+        offset: int = 0,
+        priority: Priority = Priority.NORMAL,
+        page_size: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[Paper]:
+        """Yield the results of a search one at a time.
+
+        Mirrors ``arxiv.Client.results``: stops after ``search.max_results``
+        results, after ``max_pages`` pages or when the result set is exhausted.
+        """
+        async for page in self.pages(
+            search, offset, priority, page_size=page_size, max_pages=max_pages
+        ):
+            for paper in page:
+                yield paper
+
+    async def pages(
+        self,
+        search: arxiv.Search,
+        offset: int = 0,
+        priority: Priority = Priority.NORMAL,
+        page_size: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        first_page_size: Optional[int] = None,
+    ) -> AsyncIterator[ResultPage]:
+        """Yield the results of a search one parsed page at a time.
+
+        Pages are only requested once the previous one has been consumed. A
+        smaller ``first_page_size`` shortens the time to the first results.
+        """
+        limit = search.max_results - offset if search.max_results else None
+        if limit is not None and limit <= 0:
+            return
+
+        page_size = page_size or self.page_size
+        size = first_page_size or page_size
+        total_results = None
+        yielded = 0
+        fetched = 0
+        while True:
+            if limit is not None:
+                size = min(size, limit - yielded)
+            feed = await self._fetch_page(
+                search, offset, size, total_results is None, priority
+            )
+            fetched += 1
+            if total_results is None:
+                if not feed.entries:
+                    logger.debug("Got empty first page; stopping")
+                    return
+                total_results = feed.total_results
+
+            page = ResultPage(feed.entries, offset, total_results, feed.skipped)
+            yielded += len(page)
+            yield page
+
+            offset += len(feed.entries) + feed.skipped
+            if offset >= total_results or not feed.entries:
+                return
+            if limit is not None and yielded >= limit:
+                return
+            if max_pages is not None and fetched >= max_pages:
+                logger.debug(f"Page budget of {max_pages} exhausted")
+                return
+            size = page_size
+
+    async def get_papers(
+        self, paper_ids: List[str], priority: Priority = Priority.NORMAL
+    ) -> List[Paper]:
+        """Fetch metadata for a list of arXiv IDs."""
+        if not paper_ids:
+            return []
+        search = arxiv.Search(id_list=paper_ids, max_results=len(paper_ids))
+        return [paper async for paper in self.results(search, priority=priority)]
+
+    async def get_paper(
+        self, paper_id: str, priority: Priority = Priority.NORMAL
+    ) -> Optional[Paper]:
+        """Fetch metadata for a single arXiv ID, or None if it does not exist."""
+        papers = await self.get_papers([paper_id], priority)
+        return papers[0] if papers else None
+
+    async def download_pdf(
+        self,
+        paper: Paper,
+        path: Path,
+        priority: Priority = Priority.NORMAL,
+        progress: Optional[DownloadProgress] = None,
+    ) -> Path:
+        """Download the PDF of a paper to ``path``.
+
+        Concurrent downloads to the same path share a single transfer; only
+        the caller that started it receives ``progress`` updates.
+        """
+        return await self._flights.do(
+            ("pdf", str(path)),
+            lambda: self._download_pdf(paper, path, priority, progress),
+        )
+
+    async def _download_pdf(
+        self,
+        paper: Paper,
+        path: Path,
+        priority: Priority,
+        progress: Optional[DownloadProgress],
+    ) -> Path:
+        """Perform a single PDF transfer, resuming it if it breaks off.
+
+        Interrupted transfers are retried with ``Range`` requests for the
+        missing bytes. Their part file is kept when all retries fail, so a
+        later download of the same paper resumes it as well.
+        """
+        if paper.pdf_url is None:
+            raise ValueError("No PDF URL available for this result")
+        url = urlparse(paper.pdf_url)._replace(
+            scheme=self.download_scheme, netloc=self.download_domain
+        )
+        download = PartialDownload(path)
+        for try_index in range(self.num_retries + 1):
+            await self._acquire_slot(priority)
+            try:
+                return await download.fetch(self._get_session(), url.geturl(), progress)
+            except (httpx.TransportError, IncompleteDownloadError) as e:
+                if try_index >= self.num_retries:
+                    logger.debug(f"Giving up PDF transfer (try {try_index}): {e}")
+                    raise
+                logger.debug(f"PDF transfer interrupted (try {try_index}): {e}")
+
+    async def _fetch_page(
+        self,
+        search: arxiv.Search,
+        start: int,
+        page_size: int,
+        first_page: bool,
+        priority: Priority,
+    ) -> FeedPage:
+        """Fetch and parse one page of results, sharing identical requests."""
+        params = search._url_args()
+        params.update({"start": str(start), "max_results": str(page_size)})
+        key = ("page", tuple(sorted(params.items())), first_page)
+        return await self._flights.do(
+            key, lambda: self._request_page(params, first_page, priority)
+        )
+
+    async def _request_page(
+        self, params: dict, first_page: bool, priority: Priority
+    ) -> FeedPage:
+        """Fetch and parse one page of results, retrying on failure."""
+        for try_index in range(self.num_retries + 1):
+            try:
+                return await self._try_fetch_page(
+                    params, first_page, try_index, priority
+                )
+            except (
+                arxiv.HTTPError,
+                arxiv.UnexpectedEmptyPageError,
+                httpx.TransportError,
+                ET.ParseError,
+            ) as e:
+                if try_index >= self.num_retries:
+                    logger.debug(f"Giving up (try {try_index}): {e}")
+                    if isinstance(e, (httpx.TransportError, ET.ParseError)):
+                        url = self.query_url
+                        raise arxiv.ArxivError(url, try_index, str(e)) from e
+                    raise
+                logger.debug(f"Got error (try {try_index}): {e}")
+
+    async def _try_fetch_page(
+        self, params: dict, first_page: bool, try_index: int, priority: Priority
+    ) -> FeedPage:
+        """Perform a single page request.
+
+        The feed is parsed incrementally while the response body streams in.
+        """
+        await self._acquire_slot(priority)
+        logger.debug(
+            f"Requesting page (first: {first_page}, try: {try_index}): {params}"
+        )
+
+        parser = AtomFeedParser()
+        session = self._get_session()
+        async with session.stream("GET", self.query_url, params=params) as response:
+            url = str(response.url)
+            if response.status_code != 200:
+                raise arxiv.HTTPError(url, try_index, response.status_code)
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+        feed = parser.close()
+
+        if not feed.entries and not first_page:
+            raise arxiv.UnexpectedEmptyPageError(url, try_index, feed)
+        return feed
+
+
+_client: Optional[ArxivClient] = None
+
+
+def get_arxiv_client() -> ArxivClient:
+    """Return the process-wide arXiv client shared by all tools."""
+    global _client
+    if _client is None:
+        _client = ArxivClient()
+    return _client
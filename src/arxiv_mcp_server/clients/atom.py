@@ -0,0 +1,194 @@
+"""Streaming parser for arXiv API Atom feeds."""
+
+import logging
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+logger = logging.getLogger("arxiv-mcp-server")
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(slots=True)
+class Author:
+    """An author of a paper."""
+
+    name: str
+
+
+@dataclass(slots=True)
+class Link:
+    """A link attached to a paper entry."""
+
+    href: str
+    title: Optional[str] = None
+    rel: str = ""
+    content_type: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Paper:
+    """Metadata of one arXiv paper as returned by the API.
+
+    Exposes the same attributes as ``arxiv.Result`` that the tools rely on, so
+    either can be passed to code that processes search results.
+    """
+
+    entry_id: str
+    title: str
+    summary: str
+    published: datetime
+    updated: datetime
+    authors: List[Author] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    primary_category: Optional[str] = None
+    links: List[Link] = field(default_factory=list)
+    pdf_url: Optional[str] = None
+    comment: Optional[str] = None
+    journal_ref: Optional[str] = None
+    doi: Optional[str] = None
+
+    def get_short_id(self) -> str:
+        """Return the short ID, e.g. ``2107.05580v1`` or ``quant-ph/0201082v1``."""
+        return self.entry_id.split("arxiv.org/abs/")[-1]
+
+
+@dataclass(slots=True)
+class FeedPage:
+    """One parsed page of an arXiv API response."""
+
+    total_results: int = 0
+    start_index: int = 0
+    items_per_page: int = 0
+    entries: List[Paper] = field(default_factory=list)
+    skipped: int = 0  # entries dropped for missing required fields
+
+
+def _text(element: Optional[ET.Element]) -> Optional[str]:
+    """Return the stripped text of an element, or None if it is absent."""
+    if element is None or element.text is None:
+        return None
+    return element.text.strip()
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an Atom timestamp such as ``2023-01-01T00:00:00Z``."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value)
+
+
+def _parse_entry(entry: ET.Element) -> Optional[Paper]:
+    """Convert an ``<entry>`` element into a Paper, or None if incomplete."""
+    entry_id = _text(entry.find(f"{_ATOM}id"))
+    published = _parse_datetime(_text(entry.find(f"{_ATOM}published")))
+    if not entry_id or published is None:
+        logger.warning(f"Skipping partial result: {entry_id or 'missing id'}")
+        return None
+
+    title = _text(entry.find(f"{_ATOM}title"))
+    if title is None:
+        # Mirrors the arxiv library, which has observed "0" as a missing title
+        title = "0"
+
+    links = []
+    pdf_url = None
+    for link in entry.iterfind(f"{_ATOM}link"):
+        href = link.get("href")
+        if href is None:
+            continue
+        link_title = link.get("title")
+        links.append(Link(href, link_title, link.get("rel", ""), link.get("type")))
+        if link_title == "pdf" and pdf_url is None:
+            pdf_url = href
+
+    primary = entry.find(f"{_ARXIV}primary_category")
+    return Paper(
+        entry_id=entry_id,
+        title=_WHITESPACE.sub(" ", title),
+        summary=_text(entry.find(f"{_ATOM}summary")) or "",
+        published=published,
+        updated=_parse_datetime(_text(entry.find(f"{_ATOM}updated"))) or published,
+        authors=[
+            Author(_text(author.find(f"{_ATOM}name")) or "")
+            for author in entry.iterfind(f"{_ATOM}author")
+        ],
+        categories=[
+            term
+            for category in entry.iterfind(f"{_ATOM}category")
+            if (term := category.get("term"))
+        ],
+        primary_category=primary.get("term") if primary is not None else None,
+        links=links,
+        pdf_url=pdf_url,
+        comment=_text(entry.find(f"{_ARXIV}comment")),
+        journal_ref=_text(entry.find(f"{_ARXIV}journal_ref")),
+        doi=_text(entry.find(f"{_ARXIV}doi")),
+    )
+
+
+class AtomFeedParser:
+    """Incremental parser that turns response chunks into papers as they arrive.
+
+    Each ``<entry>`` element is converted and discarded as soon as it is
+    complete, so memory stays proportional to a single entry and parsing can
+    overlap with the network transfer.
+    """
+
+    def __init__(self):
+        """Initialize an empty parser."""
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._depth = 0
+        self.page = FeedPage()
+
+    def feed(self, data: bytes) -> List[Paper]:
+        """Feed a chunk of the response and return the papers it completed."""
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> FeedPage:
+        """Finish parsing and return the complete page."""
+        self._parser.close()
+        self._drain()
+        return self.page
+
+    def _drain(self) -> List[Paper]:
+        """Process pending parser events."""
+        completed = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._depth += 1
+                continue
+            self._depth -= 1
+            tag = element.tag
+            if tag == f"{_ATOM}entry":
+                paper = _parse_entry(element)
+                if paper is None:
+                    self.page.skipped += 1
+                else:
+                    completed.append(paper)
+                element.clear()
+            elif self._depth == 1:
+                # Feed-level elements; entry children are read in _parse_entry
+                if tag == f"{_OPENSEARCH}totalResults":
+                    self.page.total_results = int(element.text or 0)
+                elif tag == f"{_OPENSEARCH}startIndex":
+                    self.page.start_index = int(element.text or 0)
+                elif tag == f"{_OPENSEARCH}itemsPerPage":
+                    self.page.items_per_page = int(element.text or 0)
+        self.page.entries.extend(completed)
+        return completed
+
+
+def parse_feed(content: bytes) -> FeedPage:
+    """Parse a complete arXiv API response."""
+    parser = AtomFeedParser()
+    parser.feed(content)
+    return parser.close()
@@ -0,0 +1,57 @@
+"""Coalescing of identical in-flight requests."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger("arxiv-mcp-server")
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its result.
+
+    Callers that arrive while a call with the same key is in flight await the
+    same future instead of starting their own. Cancelling one caller does not
+    cancel the shared call for the others.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls."""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await the in-flight call for ``key``, starting it if needed."""
+        future = self._calls.get(key)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            future = asyncio.ensure_future(factory())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight request for {key!r}")
+        return await asyncio.shield(future)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Return True if a call for ``key`` is currently running."""
+        return key in self._calls
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of started and coalesced calls."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        """Drop a finished call so the next request starts a fresh one."""
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved when every caller went away
+            future.exception()
@@ -0,0 +1,50 @@
+"""Process-wide HTTP connection pool for arXiv traffic."""
+
+import logging
+from typing import Optional
+
+import httpx
+from ..config import Settings
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an HTTP/2 keep-alive client configured from settings."""
+    return httpx.AsyncClient(
+        http2=settings.HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.REQUEST_TIMEOUT, connect=settings.CONNECT_TIMEOUT
+        ),
+        headers={"User-Agent": f"{settings.APP_NAME}/{settings.APP_VERSION}"},
+        follow_redirects=True,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+        logger.info(
+            f"Opened HTTP pool (http2={settings.HTTP2}, "
+            f"max_connections={settings.HTTP_MAX_CONNECTIONS})"
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("Closed HTTP pool")
@@ -0,0 +1,143 @@
+"""Global rate limiting for arXiv requests."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+
+from ..config import Settings
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+
+class Priority(IntEnum):
+    """Scheduling priority of an arXiv request; lower values are served first."""
+
+    INTERACTIVE = 0  # searches an agent is waiting on
+    NORMAL = 1  # explicit paper downloads and lookups
+    BACKGROUND = 2  # bulk downloads, prefetching and metadata refresh
+
+
+class RateLimiter:
+    """Token-bucket scheduler that grants request slots in priority order.
+
+    Tokens refill at ``rate`` per second up to ``burst``. When no token is
+    available, waiters queue and are released highest priority first, FIFO
+    within the same priority.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the limiter.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Maximum number of tokens that can accumulate.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated: Optional[float] = None
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[Priority, Dict[str, float]] = {}
+
+    async def acquire(self, priority: Priority = Priority.NORMAL) -> float:
+        """Wait for a request slot.
+
+        Returns:
+            float: Seconds spent waiting in the queue.
+        """
+        loop = self._bind_loop()
+        started = loop.time()
+
+        self._refill(started)
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self._record(priority, 0.0)
+            return 0.0
+
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+        await future
+
+        waited = loop.time() - started
+        self._record(priority, waited)
+        return waited
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return per-priority request counts and queue-wait statistics."""
+        return {
+            priority.name.lower(): {
+                **values,
+                "avg_wait": values["total_wait"] / values["requests"],
+            }
+            for priority, values in self._stats.items()
+        }
+
+    @property
+    def queue_length(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Reset loop-bound state when used from a different event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._waiters = []
+            self._dispatcher = None
+            self._updated = None
+        return loop
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last update."""
+        if self._updated is not None:
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    async def _dispatch(self) -> None:
+        """Release queued waiters as tokens become available."""
+        loop = asyncio.get_running_loop()
+        while self._waiters:
+            self._refill(loop.time())
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+    def _record(self, priority: Priority, waited: float) -> None:
+        """Update queue-wait statistics for a granted request."""
+        values = self._stats.setdefault(
+            priority, {"requests": 0, "total_wait": 0.0, "max_wait": 0.0}
+        )
+        values["requests"] += 1
+        values["total_wait"] += waited
+        values["max_wait"] = max(values["max_wait"], waited)
+        if waited:
+            logger.debug(f"arXiv request ({priority.name}) waited {waited:.2f}s")
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide arXiv rate limiter."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(
+            rate=1 / settings.ARXIV_REQUEST_INTERVAL,
+            burst=settings.ARXIV_REQUEST_BURST,
+        )
+    return _rate_limiter
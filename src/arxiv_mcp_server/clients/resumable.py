@@ -0,0 +1,152 @@
+"""Resumable file downloads over HTTP ``Range`` requests."""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger("arxiv-mcp-server")
+
+# Called with the bytes received so far and the expected total, if known
+DownloadProgress = Callable[[int, Optional[int]], None]
+
+_CONTENT_RANGE = re.compile(r"^bytes (\d+)-\d+/(\d+|\*)$")
+
+
+class IncompleteDownloadError(Exception):
+    """A transfer ended early or the file changed on the server.
+
+    The download can be retried; it resumes or restarts as appropriate.
+    """
+
+
+def _parse_content_range(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """Return the first byte and total length of a ``Content-Range`` header."""
+    match = _CONTENT_RANGE.match((value or "").strip())
+    if match is None:
+        return None, None
+    total = match.group(2)
+    return int(match.group(1)), int(total) if total != "*" else None
+
+
+class PartialDownload:
+    """A download kept in ``<path>.part`` until it is complete.
+
+    The expected length and ETag of the file are stored next to it in
+    ``<path>.part.json``. A transfer that breaks off, in this process or an
+    earlier one, continues with a ``Range`` request for the missing bytes
+    instead of starting over, as long as the server still reports the same
+    length and ETag. The part file is renamed to ``path`` once all bytes are in.
+    """
+
+    def __init__(self, path: Path):
+        """Prepare a download to ``path``, picking up an earlier part file."""
+        self.path = path
+        self.part_path = path.with_name(f"{path.name}.part")
+        self.meta_path = path.with_name(f"{path.name}.part.json")
+        self.etag: Optional[str] = None
+        self.total: Optional[int] = None
+        try:
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+            self.etag, self.total = meta.get("etag"), meta.get("total")
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def offset(self) -> int:
+        """Number of bytes already received that a transfer can resume from."""
+        if self.total is None or not self.part_path.exists():
+            return 0
+        size = self.part_path.stat().st_size
+        return size if size <= self.total else 0
+
+    def discard(self) -> None:
+        """Delete the part file and what is known about it."""
+        self.part_path.unlink(missing_ok=True)
+        self.meta_path.unlink(missing_ok=True)
+        self.etag = self.total = None
+
+    def _begin(self, etag: Optional[str], total: Optional[int]) -> None:
+        """Start the part file over for a file of the given ETag and length."""
+        self.etag, self.total = etag, total
+        self.part_path.write_bytes(b"")
+        self.meta_path.write_text(
+            json.dumps({"etag": etag, "total": total}), encoding="utf-8"
+        )
+
+    def _finish(self) -> Path:
+        """Move the completed part file into place."""
+        self.part_path.replace(self.path)
+        self.meta_path.unlink(missing_ok=True)
+        return self.path
+
+    async def fetch(
+        self,
+        session: httpx.AsyncClient,
+        url: str,
+        progress: Optional[DownloadProgress] = None,
+    ) -> Path:
+        """Request the missing bytes of the file and append them to the part.
+
+        Returns:
+            Path: The completed file.
+
+        Raises:
+            IncompleteDownloadError: If the transfer ended early or the file
+                changed on the server.
+            httpx.TransportError: If the connection failed.
+            httpx.HTTPStatusError: If the server refused the request.
+        """
+        offset = self.offset
+        # Lengths and ranges count the bytes on the wire, which are only the
+        # bytes of the file if the server does not compress them
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if self.etag:
+                # The server sends the whole file instead if it has changed
+                headers["If-Range"] = self.etag
+
+        async with session.stream("GET", url, headers=headers) as response:
+            if response.status_code == 416 and offset:
+                if offset == self.total:
+                    return self._finish()
+                self.discard()
+                raise IncompleteDownloadError("Stored part does not match the file")
+            response.raise_for_status()
+            if response.headers.get("Content-Encoding", "identity") != "identity":
+                self.discard()
+                raise IncompleteDownloadError("Server sent an encoded response")
+
+            etag = response.headers.get("ETag")
+            if response.status_code == 206:
+                start, total = _parse_content_range(
+                    response.headers.get("Content-Range")
+                )
+                if start != offset or total != self.total or etag != self.etag:
+                    self.discard()
+                    raise IncompleteDownloadError("File changed on the server")
+                logger.debug(f"Resuming download of {url} at byte {offset}")
+            else:
+                offset = 0
+                length = response.headers.get("Content-Length")
+                self._begin(etag, int(length) if length and length.isdigit() else None)
+
+            received = offset
+            if progress is not None:
+                progress(received, self.total)
+            # Chunks are written as they arrive so that nothing received
+            # before a connection drops is lost
+            with open(self.part_path, "ab") as f:
+                async for chunk in response.aiter_raw():
+                    f.write(chunk)
+                    received += len(chunk)
+                    if progress is not None:
+                        progress(received, self.total)
+
+        if self.total is not None and received != self.total:
+            raise IncompleteDownloadError(f"Received {received} of {self.total} bytes")
+        return self._finish()
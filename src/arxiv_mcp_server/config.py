@@ -4,6 +4,7 @@ import sys
 import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
+from typing import Literal
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,35 @@ class Settings(BaseSettings):
     MAX_RESULTS: int = 50
     BATCH_SIZE: int = 20
     REQUEST_TIMEOUT: int = 60
+    CONNECT_TIMEOUT: float = 10.0
+    HTTP2: bool = True
+    HTTP_MAX_CONNECTIONS: int = 10
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 5
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    ARXIV_REQUEST_INTERVAL: float = 3.0
+    ARXIV_REQUEST_BURST: int = 1
+    SEARCH_MAX_PAGES: int = 5
+    SEARCH_STREAM_FIRST_PAGE_SIZE: int = 10
+    SEARCH_CACHE_TTL: int = 3600
+    SEARCH_CACHE_MAX_ENTRIES: int = 256
+    SEARCH_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    SEARCH_CACHE_PERSIST: bool = False
+    SEARCH_PAGE_TTL: int = 600
+    SEARCH_SPLIT_OR: bool = False
+    SEARCH_SPLIT_MIN_ALTERNATIVES: int = 3
+    SEARCH_SPLIT_MAX_QUERIES: int = 6
+    METADATA_MAX_AGE: int = 7 * 24 * 3600
+    SEARCH_MODE: Literal["remote", "offline", "local_first"] = "remote"
+    SIMILARITY_DIMENSIONS: int = 4096
+    PREFETCH_ENABLED: bool = False
+    PREFETCH_TOP_K: int = 3
+    PREFETCH_MAX_CONCURRENT: int = 2
+    PREFETCH_MAX_BYTES: int = 512 * 1024 * 1024
+    CONVERSION_WORKERS: int = 0  # 0 uses one worker per CPU core
+    CONVERSION_MIN_CHUNK_PAGES: int = 20
+    CONVERSION_WORKER_MAX_RSS_MB: int = 1024  # 0 never recycles workers
+    JOB_MAX_ATTEMPTS: int = 3
+    OUTPUT_FORMAT: Literal["compact", "pretty", "ndjson"] = "pretty"
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     model_config = SettingsConfigDict(extra="allow")
@@ -0,0 +1,635 @@
+"""Bounded pool of worker processes for PDF to Markdown conversion.
+
+pymupdf4llm is CPU-bound and holds the GIL for long stretches, so conversions
+run in worker processes rather than on the event loop's thread pool. At most
+``max_workers`` conversions run at once; further jobs wait in a queue served
+highest priority first, FIFO within the same priority. Each worker reports its
+resident memory after every job and is replaced by a fresh process once that
+exceeds ``CONVERSION_WORKER_MAX_RSS_MB``, since memory MuPDF and the allocator
+hold on to is seldom returned to the system.
+
+Pages are converted one at a time and appended to a part file, next to which a
+JSON progress marker records where each page ends. Only one page's Markdown is
+held in memory at a time, and MuPDF's cache of decoded images and fonts is
+emptied after every page. Readers can serve the pages
+converted so far while the rest is still in progress (see ``PartialMarkdown``).
+Large PDFs are split into page ranges converted in parallel, each into a part
+file of its own.
+
+pymupdf4llm renders every page on its own and concatenates the results, so
+joining pages in order gives the same Markdown as a single pass, provided all
+pages agree on the heading levels. Those depend on font sizes across the whole
+document: the classic engine is handed heading levels counted over all pages
+up front, and the headings of the layout engine, which ranks heading font sizes
+among the pages it is given, are re-levelled against the whole document when
+the part files are joined.
+"""
+
+import asyncio
+import glob
+import heapq
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pymupdf
+import pymupdf4llm
+
+from .clients import Priority
+from .config import Settings
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+try:
+    from pymupdf4llm.helpers import document_layout
+except ImportError:  # pymupdf4llm without the layout engine
+    document_layout = None
+
+_HEADING = re.compile(r"^(#{1,6}) ")
+
+# Heading font sizes ranked by the layout engine for the page being converted
+_layout_levels = threading.local()
+
+
+class HeaderLevels:
+    """Maps font sizes to Markdown heading prefixes, like pymupdf4llm does.
+
+    The most common font size (at least ``body_limit``) is body text; up to
+    six larger sizes become heading levels, largest first.
+    """
+
+    def __init__(self, font_sizes: Dict[int, int], body_limit: float = 12):
+        """Derive heading levels from character counts per rounded font size."""
+        self.body_limit = body_limit
+        if font_sizes:
+            most_common = max(font_sizes.items(), key=lambda item: (item[1], item[0]))
+            self.body_limit = max(body_limit, most_common[0])
+        sizes = sorted(
+            (size for size in font_sizes if size > self.body_limit), reverse=True
+        )
+        self.header_id = {
+            size: "#" * level + " " for level, size in enumerate(sizes[:6], 1)
+        }
+        if self.header_id:
+            self.body_limit = min(self.header_id) - 1
+
+    def get_header_id(self, span: dict, page=None) -> str:
+        """Return the heading prefix for a text span, or "" for body text."""
+        size = round(span["size"])
+        if size <= self.body_limit:
+            return ""
+        return self.header_id.get(size, "")
+
+
+def _record_layout_levels() -> None:
+    """Make the layout engine report the heading font sizes it ranks.
+
+    The layout engine numbers headings by the rank of their font size among
+    the converted pages and ignores ``hdr_info``. Knowing the ranked sizes of
+    each page lets headings be re-levelled against the whole document.
+    """
+    update = getattr(document_layout, "update_header_tags", None)
+    if update is None or getattr(update, "records_levels", False):
+        return
+
+    def update_header_tags(pages, header_fontsizes):
+        _layout_levels.sizes = sorted(header_fontsizes, reverse=True)[:6]
+        return update(pages, header_fontsizes)
+
+    update_header_tags.records_levels = True
+    document_layout.update_header_tags = update_header_tags
+
+
+def relevel_headings(
+    markdown: str, page_levels: List[int], document_levels: List[int]
+) -> str:
+    """Renumber layout-engine headings ranked on one page for a whole document.
+
+    Args:
+        markdown: Markdown of the page.
+        page_levels: Heading font sizes the page was ranked by, largest first.
+        document_levels: The six largest heading font sizes of the document.
+    """
+    lines = markdown.split("\n")
+    in_code = False
+    for i, line in enumerate(lines):
+        if line.startswith("```"):
+            in_code = not in_code
+        match = None if in_code else _HEADING.match(line)
+        if match is None:
+            continue
+        level = len(match.group(1))
+        if level < 6 and level <= len(page_levels):
+            size = page_levels[level - 1]
+            new_level = (
+                document_levels.index(size) + 1 if size in document_levels else 6
+            )
+            lines[i] = "#" * new_level + line[level:]
+    return "\n".join(lines)
+
+
+def page_count(pdf_path: Path) -> int:
+    """Return the number of pages of a PDF, or 0 if it cannot be opened."""
+    try:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def split_pages(pages: int, parts: int, min_pages: int) -> List[Tuple[int, int]]:
+    """Split ``pages`` into at most ``parts`` contiguous ``(start, end)`` ranges.
+
+    Every range but a lone one holds at least ``min_pages`` pages.
+    """
+    parts = max(1, min(parts, pages // max(1, min_pages)))
+    size, extra = divmod(pages, parts)
+    ranges, start = [], 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _font_sizes(doc: pymupdf.Document, start: int, end: int) -> Dict[int, int]:
+    sizes: Counter = Counter()
+    for number in range(start, end):
+        blocks = doc[number].get_text("dict", flags=pymupdf.TEXTFLAGS_TEXT)
+        for block in blocks["blocks"]:
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    text = span["text"].strip()
+                    if text:
+                        sizes[round(span["size"])] += len(text)
+    return dict(sizes)
+
+
+def count_font_sizes(pdf_path: Path, start: int, end: int) -> Dict[int, int]:
+    """Count the characters per rounded font size on a page range.
+
+    Runs in a worker process.
+    """
+    with pymupdf.open(pdf_path) as doc:
+        return _font_sizes(doc, start, end)
+
+
+def part_paths(md_path: Path, index: int) -> Tuple[Path, Path]:
+    """Return the part file and progress marker of a page range."""
+    part_path = md_path.with_name(f"{md_path.name}.part.{index}")
+    return part_path, part_path.with_name(f"{part_path.name}.json")
+
+
+def _write_marker(path: Path, marker: Dict[str, Any]) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(marker), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def convert_pages(
+    pdf_path: Path,
+    start: int,
+    end: int,
+    part_path: Path,
+    marker_path: Path,
+    headers: Optional[HeaderLevels] = None,
+) -> int:
+    """Convert a page range to Markdown page by page; runs in a worker process.
+
+    Each page is appended to ``part_path`` as soon as it is converted, after
+    which ``marker_path`` is updated with the offset the page ends at and, for
+    the layout engine, the heading font sizes it was ranked by.
+
+    Returns:
+        int: Number of pages converted.
+    """
+    _record_layout_levels()
+    with pymupdf.open(pdf_path) as doc:
+        if headers is None:
+            headers = HeaderLevels(_font_sizes(doc, 0, doc.page_count))
+        marker = {"start": start, "end": end, "page_count": doc.page_count}
+        marker["pages"] = []
+        _write_marker(marker_path, marker)
+        with open(part_path, "wb") as f:
+            for number in range(start, end):
+                _layout_levels.sizes = None
+                markdown = pymupdf4llm.to_markdown(
+                    doc, pages=[number], hdr_info=headers, show_progress=False
+                )
+                f.write(markdown.encode("utf-8"))
+                f.flush()
+                del markdown
+                pymupdf.TOOLS.store_shrink(100)
+                marker["pages"].append([f.tell(), _layout_levels.sizes])
+                _write_marker(marker_path, marker)
+    return end - start
+
+
+class PartialMarkdown:
+    """The part files of a conversion, read as one document.
+
+    Pages are read in order up to the first one not converted yet.
+    """
+
+    def __init__(self, md_path: Path):
+        """Read the progress markers of the conversion to ``md_path``."""
+        self.md_path = md_path
+        self.ranges: List[Tuple[Path, Dict[str, Any]]] = []
+        index = 0
+        while True:
+            part_path, marker_path = part_paths(md_path, index)
+            try:
+                marker = json.loads(marker_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                break
+            self.ranges.append((part_path, marker))
+            index += 1
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages of the PDF."""
+        return self.ranges[0][1]["page_count"] if self.ranges else 0
+
+    @property
+    def pages_converted(self) -> int:
+        """Number of pages converted in any range."""
+        return sum(len(marker["pages"]) for _, marker in self.ranges)
+
+    def _pages(self, complete: bool):
+        """Yield the Markdown and heading sizes of the leading converted pages."""
+        for part_path, marker in self.ranges:
+            with open(part_path, "rb") as f:
+                offset = 0
+                for end, levels in marker["pages"]:
+                    yield f.read(end - offset).decode("utf-8"), levels
+                    offset = end
+            finished = len(marker["pages"]) == marker["end"] - marker["start"]
+            if not finished:
+                if complete:
+                    raise ValueError(f"{part_path.name} is incomplete")
+                return
+
+    def document_levels(self) -> List[int]:
+        """Return the six largest heading font sizes of the converted pages."""
+        sizes = {
+            size
+            for _, marker in self.ranges
+            for _, levels in marker["pages"]
+            for size in levels or []
+        }
+        return sorted(sizes, reverse=True)[:6]
+
+    def read(self) -> Tuple[str, int]:
+        """Return the Markdown of the leading converted pages and their number."""
+        document_levels = self.document_levels()
+        pages = [
+            relevel_headings(markdown, levels, document_levels) if levels else markdown
+            for markdown, levels in self._pages(complete=False)
+        ]
+        return "".join(pages), len(pages)
+
+    def write(self, md_path: Path) -> int:
+        """Join the completed part files into ``md_path``, page by page.
+
+        Returns:
+            int: Number of characters written.
+        """
+        document_levels = self.document_levels()
+        written = 0
+        tmp_path = md_path.with_name(f"{md_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for markdown, levels in self._pages(complete=True):
+                if levels:
+                    markdown = relevel_headings(markdown, levels, document_levels)
+                written += f.write(markdown)
+        tmp_path.replace(md_path)
+        return written
+
+    def discard(self) -> None:
+        """Delete the part files and progress markers.
+
+        Parts after a range that never started are deleted too.
+        """
+        pattern = f"{glob.escape(self.md_path.name)}.part.*"
+        for path in self.md_path.parent.glob(pattern):
+            path.unlink(missing_ok=True)
+        self.ranges = []
+
+
+def resident_memory() -> int:
+    """Return the resident set size of this process in bytes, or 0 if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Peak rather than current size; kilobytes except on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _measured(func: Callable[..., Any], *args: Any) -> Tuple[Any, int]:
+    """Run a job in a worker and report the worker's memory afterwards."""
+    return func(*args), resident_memory()
+
+
+def _process_pool(max_workers: int) -> Executor:
+    """Create a pool of freshly spawned worker processes.
+
+    Forking would copy the server's threads and open database handles into
+    the workers, so they are spawned instead.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    sequence: int
+    job_id: str = field(compare=False)
+    func: Callable[..., Any] = field(compare=False)
+    args: Tuple[Any, ...] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    worker: int = field(default=-1, compare=False)
+
+
+class ConversionEngine:
+    """Runs conversion jobs on a bounded set of workers in priority order.
+
+    Every worker is an executor of its own with a single process, so that a
+    worker can be replaced without disturbing the jobs of the others.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        executor_factory: Callable[[int], Executor] = _process_pool,
+        max_rss: Optional[int] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            max_workers: Number of conversions run at once; defaults to the
+                number of CPU cores.
+            executor_factory: Creates the executor for a given number of
+                workers; defaults to a pool of spawned processes.
+            max_rss: Resident memory in bytes above which a worker is
+                replaced after its job; defaults to
+                ``CONVERSION_WORKER_MAX_RSS_MB``, 0 never replaces workers.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if max_rss is None:
+            max_rss = settings.CONVERSION_WORKER_MAX_RSS_MB * 1024 * 1024
+        self.max_rss = max_rss
+        self._executor_factory = executor_factory
+        self._workers: List[Optional[Executor]] = [None] * self.max_workers
+        self._queue: List[_Job] = []
+        self._counter = itertools.count()
+        self._running: Dict[int, str] = {}
+        self._idle = list(range(self.max_workers))
+        self.completed = 0
+        self.failed = 0
+        self.recycled = 0
+
+    def _get_worker(self, worker: int) -> Executor:
+        if self._workers[worker] is None:
+            self._workers[worker] = self._executor_factory(1)
+        return self._workers[worker]
+
+    async def run(
+        self,
+        job_id: str,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: Priority = Priority.NORMAL,
+    ) -> Any:
+        """Queue ``func(*args)`` and wait for its result.
+
+        ``func`` and its arguments must be picklable. Cancelling a queued job
+        removes it from the queue.
+        """
+        future = asyncio.get_running_loop().create_future()
+        job = _Job(int(priority), next(self._counter), job_id, func, args, future)
+        heapq.heappush(self._queue, job)
+        self._dispatch()
+        return await future
+
+    async def convert(
+        self,
+        job_id: str,
+        pdf_path: Path,
+        md_path: Path,
+        priority: Priority = Priority.NORMAL,
+    ) -> int:
+        """Convert a PDF to Markdown at ``md_path``.
+
+        PDFs of at least twice ``CONVERSION_MIN_CHUNK_PAGES`` pages are split
+        into page ranges converted in parallel. Until the conversion finishes,
+        ``PartialMarkdown(md_path)`` reads the pages converted so far.
+
+        Returns:
+            int: Number of characters written.
+        """
+        pages = await asyncio.to_thread(page_count, pdf_path)
+        ranges = split_pages(
+            pages, self.max_workers, settings.CONVERSION_MIN_CHUNK_PAGES
+        )
+        # Parts of an interrupted earlier run may be split differently
+        PartialMarkdown(md_path).discard()
+
+        headers = None
+        if len(ranges) > 1:
+            logger.info(f"Converting {job_id} in {len(ranges)} parts of {pages} pages")
+            counts = await asyncio.gather(
+                *(
+                    self.run(
+                        job_id,
+                        count_font_sizes,
+                        pdf_path,
+                        start,
+                        end,
+                        priority=priority,
+                    )
+                    for start, end in ranges
+                )
+            )
+            headers = HeaderLevels(sum((Counter(c) for c in counts), Counter()))
+
+        async def convert_range(index: int, start: int, end: int) -> int:
+            try:
+                return await self.run(
+                    job_id,
+                    convert_pages,
+                    pdf_path,
+                    start,
+                    end,
+                    *part_paths(md_path, index),
+                    headers,
+                    priority=priority,
+                )
+            except Exception:
+                # The other ranges are of no use any more
+                self.cancel_queued(job_id)
+                raise
+
+        try:
+            # Wait for every range, so that no worker still writes its part
+            # file when the parts are discarded
+            results = await asyncio.gather(
+                *(
+                    convert_range(index, start, end)
+                    for index, (start, end) in enumerate(ranges)
+                ),
+                return_exceptions=True,
+            )
+            errors = [error for error in results if isinstance(error, BaseException)]
+            if errors:
+                raise next(
+                    (e for e in errors if not isinstance(e, asyncio.CancelledError)),
+                    errors[0],
+                )
+            return await asyncio.to_thread(PartialMarkdown(md_path).write, md_path)
+        finally:
+            PartialMarkdown(md_path).discard()
+
+    def cancel_queued(self, job_id: str) -> int:
+        """Cancel the jobs of ``job_id`` that have not started yet.
+
+        Returns:
+            int: Number of jobs cancelled.
+        """
+        cancelled = 0
+        for job in self._queue:
+            if job.job_id == job_id and not job.future.done():
+                job.future.cancel()
+                cancelled += 1
+        return cancelled
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while workers are free."""
+        while self._queue and self._idle:
+            job = heapq.heappop(self._queue)
+            if job.future.done():
+                continue
+            job.worker = self._idle.pop()
+            loop = asyncio.get_running_loop()
+            try:
+                pending = loop.run_in_executor(
+                    self._get_worker(job.worker), _measured, job.func, *job.args
+                )
+            except BrokenProcessPool:
+                self._retire_worker(job.worker)
+                pending = loop.run_in_executor(
+                    self._get_worker(job.worker), _measured, job.func, *job.args
+                )
+            self._running[job.sequence] = job.job_id
+            pending.add_done_callback(lambda done, job=job: self._finish(job, done))
+
+    def _finish(self, job: _Job, done: asyncio.Future) -> None:
+        """Hand a job's outcome to its caller and start the next one."""
+        self._running.pop(job.sequence, None)
+        if done.cancelled():
+            job.future.cancel()
+        elif done.exception() is not None:
+            error = done.exception()
+            self.failed += 1
+            if isinstance(error, BrokenProcessPool):
+                logger.warning(f"Conversion worker died while running {job.job_id}")
+                self._retire_worker(job.worker)
+            if not job.future.done():
+                job.future.set_exception(error)
+        else:
+            result, rss = done.result()
+            self.completed += 1
+            if self.max_rss and rss > self.max_rss:
+                logger.info(
+                    f"Replacing conversion worker at {rss // 2**20} MiB"
+                    f" after {job.job_id}"
+                )
+                self.recycled += 1
+                self._retire_worker(job.worker)
+            if not job.future.done():
+                job.future.set_result(result)
+        self._idle.append(job.worker)
+        # Let the caller react to the outcome first, e.g. cancel queued jobs
+        asyncio.get_running_loop().call_soon(self._dispatch)
+
+    def _retire_worker(self, worker: int) -> None:
+        """Stop a worker; its next job starts a fresh one."""
+        executor, self._workers[worker] = self._workers[worker], None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def position(self, job_id: str) -> Optional[int]:
+        """Return the queue position of a job.
+
+        Returns:
+            Optional[int]: 0 while the job runs, its 1-based place in the queue
+            while it waits, or None if the engine does not know it.
+        """
+        if job_id in self._running.values():
+            return 0
+        waiting = sorted(job for job in self._queue if not job.future.done())
+        for place, job in enumerate(waiting, 1):
+            if job.job_id == job_id:
+                return place
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """Return the numbers of jobs by state and of replaced workers."""
+        return {
+            "workers": self.max_workers,
+            "running": len(self._running),
+            "queued": sum(1 for job in self._queue if not job.future.done()),
+            "completed": self.completed,
+            "failed": self.failed,
+            "recycled": self.recycled,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the workers, cancelling queued jobs."""
+        for job in self._queue:
+            job.future.cancel()
+        self._queue.clear()
+        for worker in range(self.max_workers):
+            self._retire_worker(worker)
+
+
+_engine: Optional[ConversionEngine] = None
+
+
+def get_conversion_engine() -> ConversionEngine:
+    """Return the process-wide conversion engine."""
+    global _engine
+    if _engine is None:
+        _engine = ConversionEngine(settings.CONVERSION_WORKERS or None)
+    return _engine
+
+
+def shutdown_conversion_engine() -> None:
+    """Stop the process-wide conversion engine, if it was started."""
+    global _engine
+    if _engine is not None:
+        _engine.shutdown()
+        _engine = None
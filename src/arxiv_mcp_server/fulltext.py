@@ -0,0 +1,314 @@
+"""Full-text index over the converted papers for the arXiv MCP server."""
+
+import logging
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from .config import Settings
+from .local_search import fts_expression, fts_phrase, ranking_terms
+from .query import parse_query
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    paper_id TEXT NOT NULL UNIQUE,
+    mtime REAL NOT NULL,
+    chunks INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS texts USING fts5(
+    headings, body, content='',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks USING fts5(
+    paper_id UNINDEXED, section, body,
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+"""
+
+# Headings weigh more than body text; the paper ID is not scored
+_PAPER_BM25 = "bm25(texts, 3.0, 1.0)"
+_CHUNK_BM25 = "bm25(chunks, 0.0, 3.0, 1.0)"
+
+# The text of a paper is indexed under the rowid of its documents row, and its
+# passages under consecutive rowids from that rowid times _MAX_CHUNKS, so that
+# a paper's rows can be deleted by rowid; FTS5 cannot index the paper ID
+_MAX_CHUNKS = 1 << 20
+
+_HEADING = re.compile(r"^#{1,6}\s+(.*)$", re.MULTILINE)
+
+
+@dataclass
+class FullTextHit:
+    """A paper matching a full-text query with its best passages."""
+
+    paper_id: str
+    score: float
+    snippets: List[str] = field(default_factory=list)
+
+
+def chunk_markdown(markdown: str, max_chars: int = 2000) -> Iterator[Tuple[str, str]]:
+    """Split a converted paper into (section heading, text) chunks.
+
+    Chunks follow the Markdown headings and are further split at paragraph
+    boundaries so that BM25 scores and snippets refer to a single passage.
+    """
+    sections = []
+    position, heading = 0, ""
+    for match in _HEADING.finditer(markdown):
+        sections.append((heading, markdown[position : match.start()]))
+        heading, position = match.group(1).strip(" *#"), match.end()
+    sections.append((heading, markdown[position:]))
+
+    for heading, text in sections:
+        chunk = ""
+        for paragraph in re.split(r"\n\s*\n", text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if chunk and len(chunk) + len(paragraph) > max_chars:
+                yield heading, chunk
+                chunk = ""
+            chunk = f"{chunk}\n\n{paragraph}" if chunk else paragraph
+        if chunk:
+            yield heading, chunk
+
+
+def _paper_text(chunks: List[Tuple[str, str]]) -> Tuple[str, str]:
+    """Join the passages of a paper into its indexed headings and body."""
+    headings = "\n".join(dict.fromkeys(heading for heading, _ in chunks))
+    return headings, "\n\n".join(body for _, body in chunks)
+
+
+class FullTextIndex:
+    """BM25-ranked full-text index of converted papers, stored in SQLite FTS5.
+
+    Queries are matched and ranked against whole papers. Each paper is also
+    indexed in passages, from which the snippets of a hit are taken. Only the
+    passages are stored; the whole-paper table is contentless, and the text it
+    was given is rebuilt from the passages when a paper is deleted.
+    """
+
+    def __init__(self, path: Path):
+        """Open (and create if needed) the index at ``path``."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced = False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        documents = self._columns("documents")
+        if (documents and "id" not in documents) or "paper_id" in self._columns(
+            "texts"
+        ):
+            # Indexes from before rowid keys or the contentless paper table
+            # are rebuilt by the next sync
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS documents; DROP TABLE IF EXISTS texts; "
+                "DROP TABLE IF EXISTS chunks;"
+            )
+        self._conn.executescript(_SCHEMA)
+
+    def _columns(self, table: str) -> List[str]:
+        """Return the column names of a table, empty if it does not exist."""
+        return [row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def index_paper(self, paper_id: str, markdown: str, mtime: float = 0.0) -> int:
+        """Index (or re-index) the Markdown of one paper.
+
+        Returns:
+            int: Number of passages indexed.
+        """
+        chunks = list(chunk_markdown(markdown))[:_MAX_CHUNKS]
+        headings, body = _paper_text(chunks)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id FROM documents WHERE paper_id = ?", (paper_id,)
+            ).fetchone()
+            if row is not None:
+                document = row[0]
+                self._delete(document)
+                self._conn.execute(
+                    "UPDATE documents SET mtime = ?, chunks = ? WHERE id = ?",
+                    (mtime, len(chunks), document),
+                )
+            else:
+                document = self._conn.execute(
+                    "INSERT INTO documents (paper_id, mtime, chunks) VALUES (?, ?, ?)",
+                    (paper_id, mtime, len(chunks)),
+                ).lastrowid
+            self._conn.execute(
+                "INSERT INTO texts (rowid, headings, body) VALUES (?, ?, ?)",
+                (document, headings, body),
+            )
+            first = document * _MAX_CHUNKS
+            self._conn.executemany(
+                "INSERT INTO chunks (rowid, paper_id, section, body) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (first + i, paper_id, heading, body)
+                    for i, (heading, body) in enumerate(chunks)
+                ],
+            )
+        logger.debug(f"Indexed {len(chunks)} passages of {paper_id}")
+        return len(chunks)
+
+    def index_file(self, paper_id: str, md_path: Path) -> int:
+        """Index a converted paper from its Markdown file."""
+        markdown = md_path.read_text(encoding="utf-8")
+        return self.index_paper(paper_id, markdown, md_path.stat().st_mtime)
+
+    def remove_paper(self, paper_id: str) -> None:
+        """Drop a paper from the index."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id FROM documents WHERE paper_id = ?", (paper_id,)
+            ).fetchone()
+            if row is not None:
+                self._delete(row[0])
+                self._conn.execute("DELETE FROM documents WHERE id = ?", row)
+
+    def _delete(self, document: int) -> None:
+        """Delete the indexed text of a document; the caller holds the lock."""
+        rowids = (document * _MAX_CHUNKS, (document + 1) * _MAX_CHUNKS - 1)
+        chunks = self._conn.execute(
+            "SELECT section, body FROM chunks WHERE rowid BETWEEN ? AND ? "
+            "ORDER BY rowid",
+            rowids,
+        ).fetchall()
+        # A contentless table forgets a row given the values it indexed
+        self._conn.execute(
+            "INSERT INTO texts (texts, rowid, headings, body) "
+            "VALUES ('delete', ?, ?, ?)",
+            (document, *_paper_text(chunks)),
+        )
+        self._conn.execute("DELETE FROM chunks WHERE rowid BETWEEN ? AND ?", rowids)
+
+    def sync(self, storage_path: Path) -> int:
+        """Index new or changed Markdown files and forget deleted ones.
+
+        Returns:
+            int: Number of papers (re-)indexed.
+        """
+        with self._lock:
+            known = dict(self._conn.execute("SELECT paper_id, mtime FROM documents"))
+        indexed = 0
+        present = set()
+        for md_path in storage_path.glob("*.md"):
+            paper_id = md_path.stem
+            present.add(paper_id)
+            try:
+                if known.get(paper_id) != md_path.stat().st_mtime:
+                    self.index_file(paper_id, md_path)
+                    indexed += 1
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Could not index {md_path}: {e}")
+        for paper_id in known.keys() - present:
+            self.remove_paper(paper_id)
+        return indexed
+
+    def sync_once(self, storage_path: Path) -> None:
+        """Sync with the storage directory unless this index already has.
+
+        Papers converted afterwards are indexed as their conversion finishes,
+        so one sync per process catches up with files it did not convert.
+        """
+        with self._sync_lock:
+            if not self._synced:
+                indexed = self.sync(storage_path)
+                self._synced = True
+                logger.info(f"Full-text index synced, {indexed} papers indexed")
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        snippets_per_paper: int = 3,
+        snippet_tokens: int = 24,
+    ) -> List[FullTextHit]:
+        """Return the papers best matching ``query`` with highlighted snippets.
+
+        The query uses the search_papers syntax restricted to plain terms,
+        quoted phrases, AND/OR/ANDNOT and parentheses. Matches in snippets are
+        wrapped in ``**``.
+
+        Raises:
+            ValueError: If the query is empty or invalid.
+        """
+        node = parse_query(query)
+        if node is None:
+            raise ValueError("Empty full-text query")
+        expression = fts_expression(node)
+
+        try:
+            with self._lock:
+                ranked = self._conn.execute(
+                    "SELECT paper_id, score FROM "
+                    f"(SELECT rowid AS document, {_PAPER_BM25} AS score FROM texts "
+                    "WHERE texts MATCH ? ORDER BY score LIMIT ?) "
+                    "JOIN documents ON documents.id = document ORDER BY score",
+                    (expression, limit),
+                ).fetchall()
+                if not ranked:
+                    return []
+
+                # Best passages of the hits for the terms they should contain
+                terms = " OR ".join(fts_phrase(term) for term in ranking_terms(node))
+                ids = [paper_id for paper_id, _ in ranked]
+                passages = self._conn.execute(
+                    "SELECT paper_id, section, "
+                    "snippet(chunks, 2, '**', '**', ' … ', ?) "
+                    f"FROM chunks WHERE chunks MATCH ? AND paper_id IN "
+                    f"({', '.join('?' * len(ids))}) ORDER BY {_CHUNK_BM25}",
+                    (snippet_tokens, terms, *ids),
+                ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid full-text query: {e}")
+
+        # BM25 scores are negative; report higher-is-better values
+        hits = {
+            paper_id: FullTextHit(paper_id, round(-score, 4))
+            for paper_id, score in ranked
+        }
+        for paper_id, section, snippet in passages:
+            hit = hits[paper_id]
+            if len(hit.snippets) < snippets_per_paper:
+                hit.snippets.append(f"[{section}] {snippet}" if section else snippet)
+        return list(hits.values())
+
+
+_fulltext_index: Optional[FullTextIndex] = None
+
+
+def get_fulltext_index() -> FullTextIndex:
+    """Return the process-wide full-text index under the storage path."""
+    global _fulltext_index
+    if _fulltext_index is None:
+        _fulltext_index = FullTextIndex(Path(settings.STORAGE_PATH) / "fulltext.db")
+    return _fulltext_index
+
+
+def sync_fulltext_index() -> None:
+    """Index stored papers the full-text index does not know yet, once."""
+    get_fulltext_index().sync_once(Path(settings.STORAGE_PATH))
+
+
+def index_converted_paper(paper_id: str, md_path: Path) -> None:
+    """Index a freshly converted paper, logging instead of raising on failure."""
+    try:
+        get_fulltext_index().index_file(paper_id, md_path)
+    except Exception as e:
+        logger.warning(f"Could not index {paper_id} for full-text search: {e}")
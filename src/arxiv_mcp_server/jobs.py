@@ -0,0 +1,277 @@
+"""Durable table of paper download and conversion jobs for the arXiv MCP server.
+
+Every download of a paper is a job whose state, attempts, timings and last
+error are kept in a SQLite database under the storage path, so that a restart
+can pick up the jobs the previous run left unfinished.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .config import Settings
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    paper_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    completed_at REAL,
+    updated_at REAL NOT NULL,
+    error TEXT,
+    bytes_received INTEGER NOT NULL,
+    bytes_total INTEGER
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state);
+"""
+
+_UPSERT = (
+    "INSERT INTO jobs (paper_id, state, attempts, started_at, completed_at, "
+    "updated_at, error, bytes_received, bytes_total) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (paper_id) DO UPDATE SET state = excluded.state, "
+    "attempts = excluded.attempts, started_at = excluded.started_at, "
+    "completed_at = excluded.completed_at, updated_at = excluded.updated_at, "
+    "error = excluded.error, bytes_received = excluded.bytes_received, "
+    "bytes_total = excluded.bytes_total"
+)
+_SELECT = (
+    "SELECT paper_id, state, attempts, started_at, completed_at, error, "
+    "bytes_received, bytes_total FROM jobs"
+)
+
+# Jobs in these states were interrupted if no process is running them
+UNFINISHED = ("downloading", "converting")
+
+# Attributes of a status that are columns of the jobs table
+_COLUMNS = {
+    "status",
+    "attempts",
+    "started_at",
+    "completed_at",
+    "error",
+    "bytes_received",
+    "bytes_total",
+}
+
+# Seconds between writes of the transfer progress of a download
+_PROGRESS_INTERVAL = 1.0
+# Progress is written when it advanced by this share of the PDF size, or by
+# _PROGRESS_BYTES when the size is unknown
+_PROGRESS_STEPS = 20
+_PROGRESS_BYTES = 1024 * 1024
+
+
+@dataclass
+class ConversionStatus:
+    """Track the status of a PDF download and its conversion to Markdown.
+
+    A status stored in a ``JobStore`` is a view of its row: assigning one of
+    the job's attributes writes the row back.
+    """
+
+    paper_id: str
+    status: str  # 'downloading', 'converting', 'success', 'error'
+    started_at: datetime
+    completed_at: Optional[datetime] = None
+    error: Optional[str] = None
+    bytes_received: int = 0
+    bytes_total: Optional[int] = None
+    attempts: int = 0
+    _store: Optional["JobStore"] = field(default=None, repr=False, compare=False)
+    _saved_at: float = field(default=0.0, repr=False, compare=False)
+    _saved_bytes: int = field(default=0, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name in _COLUMNS and self._store is not None:
+            self._store.save(self)
+
+    def update_progress(self, received: int, total: Optional[int]) -> None:
+        """Record the progress of the PDF transfer.
+
+        Called for every chunk received, so the table is only updated when
+        the transfer completes, or at most once a second when it advanced by
+        another milestone (a twentieth of the PDF, or a megabyte if its size
+        is unknown).
+        """
+        object.__setattr__(self, "bytes_received", received)
+        object.__setattr__(self, "bytes_total", total)
+        if self._store is None:
+            return
+        step = max(1, total // _PROGRESS_STEPS) if total else _PROGRESS_BYTES
+        if received == total or (
+            received - self._saved_bytes >= step
+            and time.monotonic() - self._saved_at >= _PROGRESS_INTERVAL
+        ):
+            self._store.save(self)
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value is not None else None
+
+
+class JobStore(MutableMapping):
+    """SQLite-backed table of jobs keyed by paper ID, used like a dict.
+
+    Storing a status starts a new attempt at the paper's job; the status then
+    becomes a view of the row. Statuses are cached, so everyone asking for a
+    job gets the same object. A single connection is shared between threads
+    and serialised with a lock.
+    """
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time):
+        """Open (and create if needed) the job table at ``path``.
+
+        Args:
+            path: Location of the SQLite database file.
+            clock: Time source returning seconds since the epoch.
+        """
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, ConversionStatus] = {}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def save(self, status: ConversionStatus) -> None:
+        """Write a job's status to its row."""
+        object.__setattr__(status, "_saved_at", time.monotonic())
+        object.__setattr__(status, "_saved_bytes", status.bytes_received)
+        row = (
+            status.paper_id,
+            status.status,
+            status.attempts,
+            _timestamp(status.started_at),
+            _timestamp(status.completed_at),
+            self._clock(),
+            status.error,
+            status.bytes_received,
+            status.bytes_total,
+        )
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, row)
+
+    def unfinished(self) -> List[ConversionStatus]:
+        """Return the jobs left downloading or converting."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"{_SELECT} WHERE state IN (?, ?) ORDER BY started_at", UNFINISHED
+            ).fetchall()
+        return [self._view(row) for row in rows]
+
+    def _view(self, row: tuple) -> ConversionStatus:
+        """Return the cached status of a row, creating it if needed."""
+        status = self._statuses.get(row[0])
+        if status is None:
+            status = ConversionStatus(
+                paper_id=row[0],
+                status=row[1],
+                attempts=row[2],
+                started_at=_datetime(row[3]),
+                completed_at=_datetime(row[4]),
+                error=row[5],
+                bytes_received=row[6],
+                bytes_total=row[7],
+            )
+            object.__setattr__(status, "_store", self)
+            self._statuses[status.paper_id] = status
+        return status
+
+    def __getitem__(self, paper_id: str) -> ConversionStatus:
+        status = self._statuses.get(paper_id)
+        if status is not None:
+            return status
+        with self._lock:
+            row = self._conn.execute(
+                f"{_SELECT} WHERE paper_id = ?", (paper_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(paper_id)
+        return self._view(row)
+
+    def __setitem__(self, paper_id: str, status: ConversionStatus) -> None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT attempts FROM jobs WHERE paper_id = ?", (paper_id,)
+            ).fetchone()
+        object.__setattr__(status, "attempts", (row[0] if row else 0) + 1)
+        object.__setattr__(status, "_store", self)
+        self.save(status)
+        self._statuses[paper_id] = status
+
+    def __delitem__(self, paper_id: str) -> None:
+        status = self._statuses.pop(paper_id, None)
+        if status is not None:
+            object.__setattr__(status, "_store", None)
+        with self._lock, self._conn:
+            deleted = self._conn.execute(
+                "DELETE FROM jobs WHERE paper_id = ?", (paper_id,)
+            ).rowcount
+        if not deleted:
+            raise KeyError(paper_id)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT paper_id FROM jobs").fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+_job_store: Optional[JobStore] = None
+
+
+def get_job_store() -> JobStore:
+    """Return the process-wide job table under the storage path."""
+    global _job_store
+    if _job_store is None:
+        _job_store = JobStore(Path(settings.STORAGE_PATH) / "jobs.db")
+    return _job_store
+
+
+class _CurrentJobStore(MutableMapping):
+    """The process-wide job table, looked up on every access."""
+
+    def __getitem__(self, paper_id: str) -> ConversionStatus:
+        return get_job_store()[paper_id]
+
+    def __setitem__(self, paper_id: str, status: ConversionStatus) -> None:
+        get_job_store()[paper_id] = status
+
+    def __delitem__(self, paper_id: str) -> None:
+        del get_job_store()[paper_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(get_job_store())
+
+    def __len__(self) -> int:
+        return len(get_job_store())
+
+
+# Statuses of all download jobs by paper ID
+conversion_statuses: MutableMapping = _CurrentJobStore()
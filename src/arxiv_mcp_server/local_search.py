@@ -0,0 +1,177 @@
+"""Translation of arXiv queries into SQL over the local metadata store."""
+
+import re
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Tuple
+
+from .query import BoolOp, DateRange, Node, Term
+
+# FTS5 columns searched by each arXiv field prefix; None means all columns
+FTS_COLUMNS = {
+    "ti": "title",
+    "abs": "summary",
+    "au": "authors",
+    "co": "comment",
+    "jr": "journal_ref",
+    "all": None,
+}
+
+# BM25 weights of title, summary, authors, comment and journal_ref
+_BM25 = "bm25(papers_fts, 10.0, 1.0, 5.0, 0.5, 0.5)"
+
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+_VERSION_SUFFIX = re.compile(r"v\d+$")
+
+
+def fts_phrase(term: Term) -> str:
+    """Render a term as an FTS5 phrase, restricted to its field's column."""
+    value = term.value.replace("_", " ") if term.field == "au" else term.value
+    value = " ".join(value.split())
+    if not value:
+        raise ValueError("Empty search term in query")
+    phrase = '"' + value.replace('"', '""') + '"'
+    column = FTS_COLUMNS[term.field]
+    return phrase if column is None else f"{column} : {phrase}"
+
+
+def fts_expression(node: Node) -> str:
+    """Render a query tree of plain terms as an FTS5 query expression.
+
+    Raises:
+        ValueError: If the tree contains field-restricted terms or date ranges.
+    """
+    if isinstance(node, BoolOp):
+        op = "NOT" if node.op == "ANDNOT" else node.op
+        return f"({fts_expression(node.left)} {op} {fts_expression(node.right)})"
+    if isinstance(node, DateRange) or node.field != "all":
+        raise ValueError("Full-text queries support plain terms and phrases only")
+    return fts_phrase(node)
+
+
+def _category_condition(category: str, column: str) -> Tuple[str, List[Any]]:
+    """Match a category (``cs.AI``), an archive (``cs``) or a wildcard (``cs.*``).
+
+    Archives match as a range over the category index: every category of
+    ``cs`` sorts between ``cs.`` and ``cs/``.
+    """
+    category = category.removesuffix(".*")
+    if "." in category:
+        return f"{column} = ?", [category]
+    return (
+        f"({column} = ? OR ({column} >= ? AND {column} < ?))",
+        [category, f"{category}.", f"{category}/"],
+    )
+
+
+def categories_condition(categories: List[str]) -> Tuple[str, List[Any]]:
+    """Require a paper to be listed in at least one of ``categories``."""
+    parts, params = [], []
+    for category in categories:
+        sql, values = _category_condition(category, "category")
+        parts.append(sql)
+        params.extend(values)
+    return (
+        f"p.id IN (SELECT id FROM paper_categories WHERE {' OR '.join(parts)})",
+        params,
+    )
+
+
+def date_condition(
+    date_from: Optional[datetime], date_to: Optional[datetime]
+) -> Tuple[str, List[Any]]:
+    """Restrict the publication time; answered by a range scan on its index.
+
+    Timestamps are stored as ISO strings in UTC, so string comparison orders
+    them chronologically.
+    """
+    parts, params = [], []
+    if date_from is not None:
+        parts.append("p.published >= ?")
+        params.append(date_from.strftime(_TIME_FORMAT))
+    if date_to is not None:
+        parts.append("p.published < ?")
+        params.append((date_to + timedelta(seconds=1)).strftime(_TIME_FORMAT))
+    return " AND ".join(parts) or "1", params
+
+
+def _compile(node: Node) -> Tuple[str, List[Any]]:
+    """Compile a query tree into a SQL condition over ``papers p``."""
+    if isinstance(node, BoolOp):
+        left, left_params = _compile(node.left)
+        right, right_params = _compile(node.right)
+        if node.op == "ANDNOT":
+            return f"({left} AND NOT {right})", left_params + right_params
+        return f"({left} {node.op} {right})", left_params + right_params
+    if isinstance(node, DateRange):
+        return date_condition(node.start, node.end)
+    if node.field == "cat":
+        return categories_condition([node.value])
+    if node.field == "id":
+        return "p.id = ?", [_VERSION_SUFFIX.sub("", node.value)]
+    if node.field not in FTS_COLUMNS:
+        raise ValueError(f"Field '{node.field}:' is not supported by local search")
+    return (
+        "p.rowid IN (SELECT rowid FROM papers_fts WHERE papers_fts MATCH ?)",
+        [fts_phrase(node)],
+    )
+
+
+def ranking_terms(node: Node, negated: bool = False) -> List[Term]:
+    """Collect the text terms a matching paper should score on."""
+    if isinstance(node, BoolOp):
+        terms = ranking_terms(node.left, negated)
+        return terms + ranking_terms(node.right, negated or node.op == "ANDNOT")
+    if isinstance(node, Term) and node.field in FTS_COLUMNS and not negated:
+        return [node]
+    return []
+
+
+def compile_search(
+    select: str,
+    query: Optional[Node],
+    categories: Optional[List[str]],
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+    sort_by: str,
+    limit: int,
+    offset: int = 0,
+) -> Tuple[str, List[Any]]:
+    """Build the SQL statement of a local search.
+
+    Each query term becomes an indexed lookup (full-text match, category or
+    date range) and boolean operators combine them in SQL. Relevance is the
+    BM25 score of the positive text terms.
+
+    Args:
+        select: Comma-separated columns of ``papers p`` to return.
+    """
+    conditions, params = [], []
+    if query is not None:
+        sql, values = _compile(query)
+        conditions.append(sql)
+        params.extend(values)
+    if categories:
+        sql, values = categories_condition(categories)
+        conditions.append(sql)
+        params.extend(values)
+    if date_from is not None or date_to is not None:
+        sql, values = date_condition(date_from, date_to)
+        conditions.append(sql)
+        params.extend(values)
+
+    join, join_params = "", []
+    order = "p.published DESC"
+    terms = ranking_terms(query) if query is not None else []
+    if sort_by != "date" and terms:
+        join = (
+            f"LEFT JOIN (SELECT rowid, {_BM25} AS score FROM papers_fts "
+            "WHERE papers_fts MATCH ?) r ON r.rowid = p.rowid"
+        )
+        join_params = [" OR ".join(fts_phrase(term) for term in terms)]
+        order = "r.score IS NULL, r.score, p.published DESC"
+
+    sql = (
+        f"SELECT {select} FROM papers p {join} "
+        f"WHERE {' AND '.join(conditions) or '1'} ORDER BY {order} LIMIT ? OFFSET ?"
+    )
+    return sql, join_params + params + [limit, offset]
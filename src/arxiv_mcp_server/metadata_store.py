@@ -0,0 +1,336 @@
+"""Persistent store of arXiv paper metadata for the arXiv MCP server."""
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .config import Settings
+from .clients import ArxivClient, Paper, Priority
+from .clients.atom import Author, Link
+from .local_search import compile_search
+from .query import Node
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+_VERSION = re.compile(r"^(?P<base>.+?)(?:v(?P<version>\d+))?$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id TEXT PRIMARY KEY,
+    version INTEGER,
+    entry_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    categories TEXT NOT NULL,
+    primary_category TEXT,
+    published TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    pdf_url TEXT,
+    comment TEXT,
+    journal_ref TEXT,
+    doi TEXT,
+    links TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS papers_published ON papers (published);
+CREATE TABLE IF NOT EXISTS paper_categories (
+    category TEXT NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (category, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS paper_categories_id ON paper_categories (id);
+"""
+
+# Full-text index over the papers table, kept in sync by triggers
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE papers_fts USING fts5(
+    title, summary, authors, comment, journal_ref,
+    content='papers', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER papers_ai AFTER INSERT ON papers BEGIN
+    INSERT INTO papers_fts (rowid, title, summary, authors, comment, journal_ref)
+    VALUES (new.rowid, new.title, new.summary, new.authors, new.comment,
+            new.journal_ref);
+    INSERT OR IGNORE INTO paper_categories (category, id)
+    SELECT value, new.id FROM json_each(new.categories);
+END;
+CREATE TRIGGER papers_ad AFTER DELETE ON papers BEGIN
+    INSERT INTO papers_fts (papers_fts, rowid, title, summary, authors, comment,
+                            journal_ref)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.authors, old.comment,
+            old.journal_ref);
+    DELETE FROM paper_categories WHERE id = old.id;
+END;
+CREATE TRIGGER papers_au AFTER UPDATE ON papers BEGIN
+    INSERT INTO papers_fts (papers_fts, rowid, title, summary, authors, comment,
+                            journal_ref)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.authors, old.comment,
+            old.journal_ref);
+    INSERT INTO papers_fts (rowid, title, summary, authors, comment, journal_ref)
+    VALUES (new.rowid, new.title, new.summary, new.authors, new.comment,
+            new.journal_ref);
+    DELETE FROM paper_categories WHERE id = old.id;
+    INSERT OR IGNORE INTO paper_categories (category, id)
+    SELECT value, new.id FROM json_each(new.categories);
+END;
+INSERT INTO papers_fts (papers_fts) VALUES ('rebuild');
+INSERT OR IGNORE INTO paper_categories (category, id)
+SELECT json_each.value, papers.id FROM papers, json_each(papers.categories);
+"""
+
+_COLUMNS = (
+    "id, version, entry_id, title, summary, authors, categories, primary_category, "
+    "published, updated, pdf_url, comment, journal_ref, doi, links, fetched_at"
+)
+_SELECT = ", ".join(f"p.{column}" for column in _COLUMNS.split(", "))
+_UPSERT = (
+    f"INSERT INTO papers ({_COLUMNS}) VALUES ({', '.join('?' * 16)}) "
+    "ON CONFLICT (id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _COLUMNS.split(", ")[1:])
+    # An older version fetched on request must not replace a newer one
+    + " WHERE papers.version IS NULL OR excluded.version >= papers.version"
+)
+
+
+def split_version(paper_id: str) -> Tuple[str, Optional[int]]:
+    """Split an arXiv ID such as ``2103.12345v2`` into its base ID and version."""
+    match = _VERSION.match(paper_id.strip())
+    version = match.group("version")
+    return match.group("base"), int(version) if version else None
+
+
+class MetadataStore:
+    """SQLite-backed store of paper metadata keyed by versionless arXiv ID.
+
+    The database runs in WAL mode so that readers never block on a writer. A
+    single connection is shared between threads and serialised with a lock.
+    """
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time):
+        """Open (and create if needed) the store at ``path``.
+
+        Args:
+            path: Location of the SQLite database file.
+            clock: Time source returning seconds since the epoch.
+        """
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        has_fts = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'papers_fts'"
+        ).fetchone()
+        if not has_fts:
+            # Also indexes papers stored before full-text search was added
+            self._conn.executescript(_FTS_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def upsert_many(self, papers: Iterable[Paper]) -> int:
+        """Insert or refresh the metadata of several papers.
+
+        Papers older than the stored version of the same paper are skipped.
+
+        Returns:
+            int: Number of papers given.
+        """
+        now = self._clock()
+        rows = [self._to_row(paper, now) for paper in papers]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete
+            # would bypass the triggers that maintain the search index
+            self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def upsert(self, paper: Paper) -> None:
+        """Insert or refresh the metadata of one paper."""
+        self.upsert_many([paper])
+
+    def get(self, paper_id: str, max_age: Optional[float] = None) -> Optional[Paper]:
+        """Return the stored metadata for ``paper_id``, or None if unknown."""
+        return self.get_many([paper_id], max_age).get(paper_id)
+
+    def get_many(
+        self, paper_ids: Iterable[str], max_age: Optional[float] = None
+    ) -> Dict[str, Paper]:
+        """Return the stored metadata for the given IDs.
+
+        IDs with an explicit version only match that version. Entries older
+        than ``max_age`` seconds are treated as missing.
+
+        Returns:
+            Dict[str, Paper]: Papers found, keyed by the requested ID.
+        """
+        requested = {paper_id: split_version(paper_id) for paper_id in paper_ids}
+        if not requested:
+            return {}
+        bases = sorted({base for base, _ in requested.values()})
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM papers WHERE id IN "
+                f"({', '.join('?' * len(bases))})",
+                bases,
+            ).fetchall()
+
+        oldest = self._clock() - max_age if max_age is not None else None
+        by_base = {row[0]: row for row in rows if oldest is None or row[-1] >= oldest}
+        found = {}
+        for paper_id, (base, version) in requested.items():
+            row = by_base.get(base)
+            if row is not None and version in (None, row[1]):
+                found[paper_id] = self._from_row(row)
+        return found
+
+    def search(
+        self,
+        query: Optional[Node],
+        categories: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        sort_by: str = "relevance",
+        limit: int = 10,
+        offset: int = 0,
+    ) -> List[Paper]:
+        """Search the stored papers without contacting arXiv.
+
+        Args:
+            query: Parsed arXiv query, or None to match every paper.
+            categories: Categories or archives of which a paper needs one.
+            date_from: Earliest publication time, inclusive.
+            date_to: Latest publication time, inclusive.
+            sort_by: ``relevance`` (BM25) or ``date`` (newest first).
+            limit: Maximum number of papers to return.
+            offset: Number of leading matches to skip.
+
+        Raises:
+            ValueError: If the query cannot be evaluated.
+        """
+        sql, params = compile_search(
+            _SELECT, query, categories, date_from, date_to, sort_by, limit, offset
+        )
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid local search query: {e}")
+        return [self._from_row(row) for row in rows]
+
+    def count(self) -> int:
+        """Return the number of papers in the store."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    async def get_or_fetch(
+        self,
+        client: ArxivClient,
+        paper_ids: List[str],
+        priority: Priority = Priority.NORMAL,
+    ) -> Dict[str, Paper]:
+        """Read metadata from the store and fetch only unknown IDs from arXiv.
+
+        Fetched papers are written back to the store.
+
+        Returns:
+            Dict[str, Paper]: Papers found, keyed by the requested ID. IDs that
+            do not exist on arXiv are absent.
+        """
+        found = await asyncio.to_thread(
+            self.get_many, paper_ids, max_age=settings.METADATA_MAX_AGE
+        )
+        missing = [paper_id for paper_id in paper_ids if paper_id not in found]
+        if not missing:
+            return found
+
+        logger.debug(f"Metadata store miss for {len(missing)} papers")
+        fetched = await client.get_papers(missing, priority)
+        await asyncio.to_thread(self.safe_upsert_many, fetched)
+        by_base = {split_version(paper.get_short_id())[0]: paper for paper in fetched}
+        for paper_id in missing:
+            paper = by_base.get(split_version(paper_id)[0])
+            if paper is not None:
+                found[paper_id] = paper
+        return found
+
+    def safe_upsert_many(self, papers: Iterable[Paper]) -> None:
+        """Write papers to the store, logging instead of raising on failure."""
+        try:
+            self.upsert_many(papers)
+        except Exception as e:
+            logger.warning(f"Could not update metadata store: {e}")
+
+    @staticmethod
+    def _to_row(paper: Paper, now: float) -> tuple:
+        """Convert a paper into a database row."""
+        base, version = split_version(paper.get_short_id())
+        return (
+            base,
+            version,
+            paper.entry_id,
+            paper.title,
+            paper.summary,
+            json.dumps([author.name for author in paper.authors], ensure_ascii=False),
+            json.dumps(list(paper.categories)),
+            paper.primary_category,
+            paper.published.isoformat(),
+            (paper.updated or paper.published).isoformat(),
+            paper.pdf_url,
+            paper.comment,
+            paper.journal_ref,
+            paper.doi,
+            json.dumps(
+                [
+                    [link.href, link.title, link.rel, link.content_type]
+                    for link in paper.links
+                ]
+            ),
+            now,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Paper:
+        """Convert a database row back into a paper."""
+        return Paper(
+            entry_id=row[2],
+            title=row[3],
+            summary=row[4],
+            authors=[Author(name) for name in json.loads(row[5])],
+            categories=json.loads(row[6]),
+            primary_category=row[7],
+            published=datetime.fromisoformat(row[8]),
+            updated=datetime.fromisoformat(row[9]),
+            pdf_url=row[10],
+            comment=row[11],
+            journal_ref=row[12],
+            doi=row[13],
+            links=[Link(*link) for link in json.loads(row[14])],
+        )
+
+
+_metadata_store: Optional[MetadataStore] = None
+
+
+def get_metadata_store() -> MetadataStore:
+    """Return the process-wide metadata store under the storage path."""
+    global _metadata_store
+    if _metadata_store is None:
+        _metadata_store = MetadataStore(Path(settings.STORAGE_PATH) / "metadata.db")
+    return _metadata_store
@@ -0,0 +1,130 @@
+"""Shaping and encoding of paper listings returned by the tools.
+
+Tools that return lists of papers accept three output arguments:
+
+* ``fields`` keeps only the named keys of each paper,
+* ``abstract_chars`` truncates the abstract to a character budget,
+* ``format`` selects ``pretty`` (indented JSON), ``compact`` (minified JSON)
+  or ``ndjson`` (a header line followed by one line per paper).
+"""
+
+import json
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+from .config import Settings
+
+settings = Settings()
+
+OUTPUT_FORMATS = ("compact", "pretty", "ndjson")
+
+_ELLIPSIS = "…"
+
+
+def output_properties(fields: Iterable[str], abstract_field: str) -> Dict[str, Any]:
+    """JSON schema properties of the output arguments for a tool."""
+    fields = list(fields)
+    return {
+        "fields": {
+            "type": "array",
+            "items": {"type": "string", "enum": fields},
+            "description": f"Only return these fields of each paper (default: all of {', '.join(fields)}).",
+        },
+        "format": {
+            "type": "string",
+            "enum": list(OUTPUT_FORMATS),
+            "description": "'compact' (minified JSON, fastest and smallest), 'pretty' (indented JSON) or 'ndjson' (one paper per line).",
+        },
+        "abstract_chars": {
+            "type": "integer",
+            "description": f"Truncate each {abstract_field} to about this many characters (default: no limit).",
+        },
+    }
+
+
+def truncate(text: Optional[str], budget: int) -> Optional[str]:
+    """Shorten text to at most ``budget`` characters, cutting at a word."""
+    if text is None or len(text) <= budget:
+        return text
+    cut = text[:budget]
+    space = cut.rfind(" ")
+    if space > budget // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,.;:") + _ELLIPSIS
+
+
+class OutputOptions:
+    """Validated output arguments of one tool call."""
+
+    __slots__ = ("fields", "format", "abstract_chars", "abstract_field")
+
+    def __init__(
+        self,
+        arguments: Dict[str, Any],
+        available: Iterable[str],
+        abstract_field: str,
+    ):
+        """Parse the output arguments.
+
+        Raises:
+            ValueError: If a field, the format or the budget is invalid.
+        """
+        available = list(available)
+        fields = arguments.get("fields")
+        if fields:
+            unknown = [f for f in fields if f not in available]
+            if unknown:
+                raise ValueError(
+                    f"Unknown field(s) {', '.join(unknown)}. "
+                    f"Available fields: {', '.join(available)}"
+                )
+            # Keep the natural field order regardless of the request order
+            self.fields = [f for f in available if f in fields]
+        else:
+            self.fields = None
+
+        self.format = arguments.get("format") or settings.OUTPUT_FORMAT
+        if self.format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Invalid format '{self.format}'. Use one of: {', '.join(OUTPUT_FORMATS)}"
+            )
+
+        abstract_chars = arguments.get("abstract_chars")
+        if abstract_chars is not None:
+            abstract_chars = int(abstract_chars)
+            if abstract_chars < 1:
+                raise ValueError("abstract_chars must be a positive integer")
+        self.abstract_chars = abstract_chars
+        self.abstract_field = abstract_field
+
+    def shape(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the projection and abstract budget to one paper."""
+        if self.fields is not None:
+            paper = {key: paper[key] for key in self.fields if key in paper}
+        if self.abstract_chars and self.abstract_field in paper:
+            paper = dict(paper)
+            paper[self.abstract_field] = truncate(
+                paper[self.abstract_field], self.abstract_chars
+            )
+        return paper
+
+    def render(self, response: Dict[str, Any], list_key: str = "papers") -> str:
+        """Shape the papers under ``list_key`` and encode the response."""
+        papers = [self.shape(paper) for paper in response.get(list_key, [])]
+        if self.format == "pretty":
+            return json.dumps({**response, list_key: papers}, indent=2)
+        if self.format == "compact":
+            return dumps_compact({**response, list_key: papers})
+        header = {key: value for key, value in response.items() if key != list_key}
+        return "\n".join(dumps_compact(item) for item in [header, *papers])
+
+
+def dumps_compact(value: Any) -> str:
+    """Encode JSON without whitespace, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,70 @@
+"""Splitting of broad OR queries into sub-queries and fusion of their results.
+
+arXiv evaluates long ``"A" OR "B" OR ...`` queries slowly and ranks the union
+poorly. The planner runs the alternatives as separate searches instead and
+merges the rankings with reciprocal-rank fusion, which rewards papers that
+rank well for one alternative or appear for several of them.
+"""
+
+import logging
+from functools import reduce
+from typing import Any, Dict, List, Optional, Sequence
+
+from .config import Settings
+from .query import BoolOp, or_alternatives, parse_query, to_query_string
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+# Rank offset of reciprocal-rank fusion; 60 is the value from Cormack et al.
+RRF_K = 60
+
+
+def split_or_query(query: str, max_queries: int) -> Optional[List[str]]:
+    """Split a query at its top-level ORs into at most ``max_queries`` parts.
+
+    When there are more alternatives than ``max_queries``, neighbouring
+    alternatives are grouped into ORs of their own.
+
+    Returns:
+        Optional[List[str]]: The sub-queries, or None if the query has fewer
+        than ``settings.SEARCH_SPLIT_MIN_ALTERNATIVES`` alternatives or cannot
+        be parsed.
+    """
+    try:
+        alternatives = or_alternatives(parse_query(query))
+    except ValueError as e:
+        logger.debug(f"Not splitting unparsable query: {e}")
+        return None
+    if len(alternatives) < max(2, settings.SEARCH_SPLIT_MIN_ALTERNATIVES):
+        return None
+
+    groups = min(len(alternatives), max(1, max_queries))
+    size, extra = divmod(len(alternatives), groups)
+    sub_queries, start = [], 0
+    for i in range(groups):
+        end = start + size + (1 if i < extra else 0)
+        group = alternatives[start:end]
+        node = reduce(lambda left, right: BoolOp("OR", left, right), group)
+        sub_queries.append(to_query_string(node))
+        start = end
+    return sub_queries
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[List[Dict[str, Any]]], limit: int, k: int = RRF_K
+) -> List[Dict[str, Any]]:
+    """Merge ranked paper lists, keeping each paper ID once.
+
+    Every paper scores ``1 / (k + rank)`` per list it appears in (ranks start
+    at 1). Ties keep the order in which papers were first seen.
+    """
+    scores: Dict[str, float] = {}
+    papers: Dict[str, Dict[str, Any]] = {}
+    for ranking in rankings:
+        for rank, paper in enumerate(ranking, 1):
+            paper_id = paper["id"]
+            scores[paper_id] = scores.get(paper_id, 0.0) + 1.0 / (k + rank)
+            papers.setdefault(paper_id, paper)
+    order = sorted(papers, key=lambda paper_id: -scores[paper_id])
+    return [papers[paper_id] for paper_id in order[:limit]]
@@ -0,0 +1,274 @@
+"""Speculative prefetch of top search results for the arXiv MCP server.
+
+After a search, agents usually download one of the first few hits. When
+prefetching is enabled, those papers are downloaded and converted in the
+background at the lowest request priority, into a separate cache directory.
+A later ``download_paper`` call moves the finished files into storage instead
+of fetching them again. The cache is bounded in size and evicts the least
+recently prefetched papers first; each prefetch in flight reserves room for a
+paper of average size before it starts.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .clients import Priority, get_arxiv_client
+from .config import Settings
+from .conversion import get_conversion_engine
+from .metadata_store import get_metadata_store, split_version
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+# Room reserved for a prefetch before any paper has been cached
+_PAPER_BYTES = 8 * 1024 * 1024
+
+
+class Prefetcher:
+    """Background downloads and conversions of likely-wanted papers."""
+
+    def __init__(
+        self,
+        directory: Path,
+        top_k: int = 3,
+        max_concurrent: int = 2,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            directory: Cache directory for prefetched PDFs and Markdown.
+            top_k: Number of leading results of each search to prefetch.
+            max_concurrent: Maximum number of prefetches in flight; further
+                requests are dropped until one finishes.
+            max_bytes: Disk budget of the cache directory, including the room
+                reserved for prefetches in flight; requests that do not fit
+                are dropped.
+        """
+        self.directory = directory
+        self.top_k = top_k
+        self.max_concurrent = max_concurrent
+        self.max_bytes = max_bytes
+        directory.mkdir(parents=True, exist_ok=True)
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._claimed: Set[str] = set()
+        self.scheduled = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.evicted = 0
+        self.hits = 0
+        self.late_hits = 0
+        self.misses = 0
+
+    def _files(self, paper_id: str) -> Tuple[Path, Path]:
+        return (
+            self.directory / f"{paper_id}.pdf",
+            self.directory / f"{paper_id}.md",
+        )
+
+    def _is_stored(self, paper_id: str) -> bool:
+        """Return True if a paper is already in storage or being downloaded."""
+        storage = Path(settings.STORAGE_PATH)
+        base, _ = split_version(paper_id)
+        return any(
+            (storage / f"{name}{suffix}").exists()
+            for name in {paper_id, base}
+            for suffix in (".md", ".pdf")
+        )
+
+    def _resolve(self, paper_id: str) -> Optional[str]:
+        """Find the cached or in-flight ID matching a requested paper ID.
+
+        Search results carry versioned IDs; a request without a version
+        matches any prefetched version of the paper.
+        """
+        if paper_id in self._tasks or self._files(paper_id)[1].exists():
+            return paper_id
+        base, version = split_version(paper_id)
+        if version is not None:
+            return None
+        for candidate in self._tasks:
+            if split_version(candidate)[0] == base:
+                return candidate
+        for md_path in self.directory.glob(f"{base}v*.md"):
+            return md_path.stem
+        return None
+
+    def schedule(self, paper_ids: Iterable[str]) -> int:
+        """Start prefetching the first ``top_k`` of ``paper_ids``.
+
+        Returns:
+            int: Number of prefetches started.
+        """
+        started = 0
+        for paper_id in list(paper_ids)[: self.top_k]:
+            if self._resolve(paper_id) is not None or self._is_stored(paper_id):
+                continue
+            if len(self._tasks) >= self.max_concurrent:
+                self.dropped += 1
+                continue
+            reserved = (len(self._tasks) + 1) * self._estimate()
+            if self._enforce_budget(reserved) + reserved > self.max_bytes:
+                logger.debug(f"Prefetch cache full; not prefetching {paper_id}")
+                self.dropped += 1
+                continue
+            self._tasks[paper_id] = asyncio.create_task(self._prefetch(paper_id))
+            self.scheduled += 1
+            started += 1
+        if started:
+            logger.debug(f"Prefetching {started} papers")
+        return started
+
+    async def _prefetch(self, paper_id: str) -> bool:
+        """Download and convert one paper into the cache directory."""
+        pdf_path, md_path = self._files(paper_id)
+        try:
+            client = get_arxiv_client()
+            papers = await get_metadata_store().get_or_fetch(
+                client, [paper_id], Priority.BACKGROUND
+            )
+            paper = papers.get(paper_id)
+            if paper is None:
+                raise ValueError("paper not found")
+            await client.download_pdf(paper, pdf_path, Priority.BACKGROUND)
+            await get_conversion_engine().convert(
+                f"prefetch:{paper_id}", pdf_path, md_path, Priority.BACKGROUND
+            )
+            self.completed += 1
+            logger.debug(f"Prefetched {paper_id}")
+            return True
+        except Exception as e:
+            self.failed += 1
+            logger.info(f"Prefetch of {paper_id} failed: {e}")
+            pdf_path.unlink(missing_ok=True)
+            return False
+        finally:
+            self._tasks.pop(paper_id, None)
+            self._enforce_budget()
+
+    def _cached_sizes(self) -> Dict[str, Tuple[float, int, List[Path]]]:
+        """Return the mtime, size and files of every cached paper."""
+        cached = {}
+        for md_path in self.directory.glob("*.md"):
+            paper_id = md_path.stem
+            files = [p for p in self._files(paper_id) if p.exists()]
+            cached[paper_id] = (
+                md_path.stat().st_mtime,
+                sum(p.stat().st_size for p in files),
+                files,
+            )
+        return cached
+
+    def _estimate(self) -> int:
+        """Expected cache size of one paper, from the papers cached so far."""
+        sizes = [size for _, size, _ in self._cached_sizes().values()]
+        if sizes:
+            return sum(sizes) // len(sizes)
+        return min(_PAPER_BYTES, self.max_bytes)
+
+    def _enforce_budget(self, reserved: int = 0) -> int:
+        """Evict the oldest unclaimed papers while the cache is over budget.
+
+        Args:
+            reserved: Room to keep free for prefetches in flight.
+
+        Returns:
+            int: Size of the papers left in the cache.
+        """
+        entries = []
+        total = 0
+        for paper_id, (mtime, size, files) in self._cached_sizes().items():
+            total += size
+            if paper_id not in self._claimed and paper_id not in self._tasks:
+                entries.append((mtime, size, files))
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, files in entries:
+            if total + reserved <= self.max_bytes:
+                break
+            for path in files:
+                path.unlink(missing_ok=True)
+            total -= size
+            self.evicted += 1
+        return total
+
+    def take(self, paper_id: str) -> Optional[Tuple[Path, Path]]:
+        """Hand over the cached PDF and Markdown of a finished prefetch.
+
+        The caller moves the files out of the cache directory.
+        """
+        cached_id = self._resolve(paper_id)
+        if cached_id is None or cached_id in self._tasks:
+            return None
+        pdf_path, md_path = self._files(cached_id)
+        if not (pdf_path.exists() and md_path.exists()):
+            return None
+        self._claimed.discard(cached_id)
+        return pdf_path, md_path
+
+    def claim(self, paper_id: str) -> Optional[asyncio.Task]:
+        """Reserve an in-flight prefetch so that it is not evicted.
+
+        Returns:
+            Optional[asyncio.Task]: The prefetch task, resolving to True on
+            success, or None if the paper is not being prefetched.
+        """
+        cached_id = self._resolve(paper_id)
+        task = self._tasks.get(cached_id) if cached_id else None
+        if task is not None:
+            self._claimed.add(cached_id)
+        return task
+
+    def record(self, outcome: str) -> None:
+        """Count a download request as a ``hit``, ``late_hit`` or ``miss``."""
+        if outcome == "hit":
+            self.hits += 1
+        elif outcome == "late_hit":
+            self.late_hits += 1
+        else:
+            self.misses += 1
+        logger.info(f"Prefetch stats: {self.stats()}")
+
+    async def wait(self) -> None:
+        """Wait for the prefetches currently in flight."""
+        await asyncio.gather(*list(self._tasks.values()), return_exceptions=True)
+
+    def stats(self) -> Dict[str, float]:
+        """Return prefetch counters and hit rates.
+
+        ``hit_rate`` is the share of download requests answered by a prefetch
+        (finished or in flight); ``useful_rate`` the share of started
+        prefetches that were later requested.
+        """
+        requests = self.hits + self.late_hits + self.misses
+        used = self.hits + self.late_hits
+        return {
+            "scheduled": self.scheduled,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+            "hits": self.hits,
+            "late_hits": self.late_hits,
+            "misses": self.misses,
+            "hit_rate": used / requests if requests else 0.0,
+            "useful_rate": used / self.scheduled if self.scheduled else 0.0,
+        }
+
+
+_prefetcher: Optional[Prefetcher] = None
+
+
+def get_prefetcher() -> Prefetcher:
+    """Return the process-wide prefetcher, caching under the storage path."""
+    global _prefetcher
+    if _prefetcher is None:
+        _prefetcher = Prefetcher(
+            Path(settings.STORAGE_PATH) / ".prefetch",
+            top_k=settings.PREFETCH_TOP_K,
+            max_concurrent=settings.PREFETCH_MAX_CONCURRENT,
+            max_bytes=settings.PREFETCH_MAX_BYTES,
+        )
+    return _prefetcher
@@ -0,0 +1,206 @@
+"""Parser for the arXiv search query syntax."""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Union
+
+# Field prefixes understood by the arXiv API
+FIELDS = {"ti", "au", "abs", "co", "jr", "cat", "id", "all", "rn"}
+OPERATORS = {"AND", "OR", "ANDNOT"}
+
+_TOKEN = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<lparen>\()
+    | (?P<rparen>\))
+    | (?P<field>[A-Za-z]+):(?P<value>"[^"]*"?|\[[^\]]*\]?|[^\s()"]+)
+    | (?P<phrase>"[^"]*"?)
+    | (?P<word>[^\s()"]+)
+    """,
+    re.VERBOSE,
+)
+_RANGE = re.compile(r"^\[\s*(\d{8,14})\s+TO\s+(\d{8,14})\s*\]$")
+
+
+@dataclass(frozen=True)
+class Term:
+    """A search term, optionally restricted to a field (``all`` if not)."""
+
+    field: str
+    value: str
+    phrase: bool = False
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """A ``submittedDate:[start TO end]`` filter; both bounds are inclusive."""
+
+    start: datetime
+    end: datetime
+
+
+@dataclass(frozen=True)
+class BoolOp:
+    """A binary boolean expression; ``op`` is AND, OR or ANDNOT."""
+
+    op: str
+    left: "Node"
+    right: "Node"
+
+
+Node = Union[Term, DateRange, BoolOp]
+
+
+def _parse_timestamp(value: str, end: bool) -> datetime:
+    """Parse a ``YYYYMMDD[HHMM[SS]]`` timestamp of a date range."""
+    value = value.ljust(14, "9" if end else "0")
+    if end:
+        # Clamp padded components to their valid maximum
+        value = value[:8] + min(value[8:10], "23") + min(value[10:12], "59") + "59"
+    return datetime.strptime(value[:14], "%Y%m%d%H%M%S")
+
+
+def _strip_quotes(value: str) -> str:
+    return value[1:-1] if value.endswith('"') and len(value) > 1 else value[1:]
+
+
+def _tokenize(query: str) -> List[tuple]:
+    """Split a query into (kind, text, field) tokens."""
+    tokens = []
+    for match in _TOKEN.finditer(query):
+        kind = match.lastgroup
+        if kind == "space":
+            continue
+        if kind == "value":
+            tokens.append(("field", match.group("value"), match.group("field")))
+        elif kind == "word" and match.group("word") in OPERATORS:
+            tokens.append(("op", match.group("word"), None))
+        else:
+            tokens.append((kind, match.group(kind), None))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser over a token list.
+
+    OR binds loosest; AND and ANDNOT bind tighter and are left-associative.
+    Adjacent terms without an operator are combined with AND.
+    """
+
+    def __init__(self, tokens: List[tuple]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> Optional[tuple]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self) -> tuple:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> Node:
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected '{self.peek()[1]}' in query")
+        return node
+
+    def parse_or(self) -> Node:
+        node = self.parse_and()
+        while self.peek() == ("op", "OR", None):
+            self.take()
+            node = BoolOp("OR", node, self.parse_and())
+        return node
+
+    def parse_and(self) -> Node:
+        node = self.parse_unary()
+        while (token := self.peek()) is not None and token[0] != "rparen":
+            if token[0] == "op":
+                if token[1] == "OR":
+                    break
+                self.take()
+                node = BoolOp(token[1], node, self.parse_unary())
+            else:
+                node = BoolOp("AND", node, self.parse_unary())
+        return node
+
+    def parse_unary(self) -> Node:
+        token = self.peek()
+        if token is None:
+            raise ValueError("Query ends unexpectedly")
+        kind, text, field = self.take()
+        if kind == "lparen":
+            node = self.parse_or()
+            if self.peek() is None or self.take()[0] != "rparen":
+                raise ValueError("Unbalanced parentheses in query")
+            return node
+        if kind == "field":
+            return self.parse_field(field, text)
+        if kind == "phrase":
+            return Term("all", _strip_quotes(text), phrase=True)
+        if kind == "word":
+            return Term("all", text)
+        raise ValueError(f"Unexpected '{text}' in query")
+
+    def parse_field(self, field: str, value: str) -> Node:
+        if field == "submittedDate" or field == "lastUpdatedDate":
+            match = _RANGE.match(value)
+            if not match:
+                raise ValueError(f"Invalid date range: {value}")
+            return DateRange(
+                _parse_timestamp(match.group(1), end=False),
+                _parse_timestamp(match.group(2), end=True),
+            )
+        if field not in FIELDS:
+            raise ValueError(f"Unsupported search field: {field}")
+        if value.startswith('"'):
+            return Term(field, _strip_quotes(value), phrase=True)
+        return Term(field, value)
+
+
+def parse_query(query: str) -> Optional[Node]:
+    """Parse an arXiv search query into a syntax tree.
+
+    Returns:
+        Optional[Node]: The root node, or None for an empty query.
+
+    Raises:
+        ValueError: If the query is malformed or uses an unsupported field.
+    """
+    tokens = _tokenize(query)
+    if not tokens:
+        return None
+    return _Parser(tokens).parse()
+
+
+def to_query_string(node: Node) -> str:
+    """Render a syntax tree back into arXiv query syntax."""
+    if isinstance(node, Term):
+        value = f'"{node.value}"' if node.phrase else node.value
+        return value if node.field == "all" else f"{node.field}:{value}"
+    if isinstance(node, DateRange):
+        start = node.start.strftime("%Y%m%d%H%M")
+        end = node.end.strftime("%Y%m%d%H%M")
+        return f"submittedDate:[{start} TO {end}]"
+    left = to_query_string(node.left)
+    right = to_query_string(node.right)
+    if isinstance(node.left, BoolOp) and node.left.op != node.op:
+        left = f"({left})"
+    if isinstance(node.right, BoolOp):
+        right = f"({right})"
+    return f"{left} {node.op} {right}"
+
+
+def or_alternatives(node: Optional[Node]) -> List[Node]:
+    """Return the operands of the top-level OR chain of a query.
+
+    A query without a top-level OR is its own single alternative.
+    """
+    if node is None:
+        return []
+    if isinstance(node, BoolOp) and node.op == "OR":
+        return or_alternatives(node.left) + or_alternatives(node.right)
+    return [node]
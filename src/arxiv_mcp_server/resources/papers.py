@@ -1,14 +1,19 @@
 """Resource management and storage for arXiv papers."""
 
+import asyncio
 from pathlib import Path
 from typing import List
 import arxiv
-import pymupdf4llm
 import aiofiles
 import logging
 from pydantic import AnyUrl
 import mcp.types as types
 from ..config import Settings
+from ..clients import Priority, get_arxiv_client
+from ..conversion import get_conversion_engine
+from ..fulltext import index_converted_paper
+from ..similarity import index_paper_vector
+from ..metadata_store import get_metadata_store
 
 logger = logging.getLogger("arxiv-mcp-server")
 
@@ -21,7 +26,7 @@ class PaperManager:
         settings = Settings()
         self.storage_path = Path(settings.STORAGE_PATH)
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        self.client = arxiv.Client()
+        self.client = get_arxiv_client()
 
     def _get_paper_path(self, paper_id: str) -> Path:
         """Get the absolute file path for a paper."""
@@ -36,17 +41,18 @@ class PaperManager:
             return True
 
         try:
-            paper = next(self.client.results(arxiv.Search(id_list=[paper_id])))
-            paper.download_pdf(dirpath=self.storage_path, filename=paper_pdf_path)
-            markdown = pymupdf4llm.to_markdown(paper_pdf_path, show_progress=False)
-
-            async with aiofiles.open(paper_md_path, "w", encoding="utf-8") as f:
-                await f.write(markdown)
+            papers = await get_metadata_store().get_or_fetch(self.client, [paper_id])
+            paper = papers.get(paper_id)
+            if paper is not None:
+                await self.client.download_pdf(paper, paper_pdf_path)
+                await get_conversion_engine().convert(
+                    paper_id, paper_pdf_path, paper_md_path
+                )
+                await asyncio.to_thread(index_converted_paper, paper_id, paper_md_path)
+                await asyncio.to_thread(index_paper_vector, paper_id, paper_md_path)
 
-            return True
+                return True
 
-        except StopIteration:
-            raise ValueError(f"Paper with ID {paper_id} not found on arXiv.")
         except arxiv.ArxivError as e:
             raise ValueError(
                 f"Error: Failed to download paper {paper_id} from arXiv. Details: {str(e)}"
@@ -55,6 +61,7 @@ class PaperManager:
             raise ValueError(
                 f"Error: An unexpected error occurred while storing paper {paper_id}. Details: {str(e)}"
             )
+        raise ValueError(f"Paper with ID {paper_id} not found on arXiv.")
 
     async def has_paper(self, paper_id: str) -> bool:
         """Check if a paper is available in storage."""
@@ -70,14 +77,15 @@ class PaperManager:
     async def list_resources(self) -> List[types.Resource]:
         """List all papers as MCP resources with metadata."""
         paper_ids = await self.list_papers()
+        papers = await get_metadata_store().get_or_fetch(
+            self.client, paper_ids, Priority.BACKGROUND
+        )
         resources = []
 
         for paper_id in paper_ids:
-            search = arxiv.Search(id_list=[paper_id])
-            papers = list(self.client.results(search))
+            paper = papers.get(paper_id)
 
-            if papers:
-                paper = papers[0]
+            if paper:
                 paper_path = self._get_paper_path(paper_id)
                 resources.append(
                     types.Resource(
@@ -5,6 +5,7 @@ Arxiv MCP Server
 This module implements an MCP server for interacting with arXiv.
 """
 
+import asyncio
 import logging
 import mcp.types as types
 from typing import Dict, Any, List
@@ -13,8 +14,15 @@ from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions
 from mcp.server.stdio import stdio_server 
 from .config import Settings
+from .clients.http import get_http_client, close_http_client
+from .conversion import shutdown_conversion_engine
+from .fulltext import sync_fulltext_index
 from .tools import handle_search, handle_download, handle_list_papers, handle_read_paper
-from .tools import search_tool, download_tool, list_tool, read_tool
+from .tools import handle_batch_search, handle_search_local, handle_related_papers
+from .tools import search_tool, download_tool, list_tool, read_tool, batch_search_tool
+from .tools import search_local_tool, related_papers_tool
+from .tools.download import resume_jobs
+from .tools.search import ProgressCallback
 from .prompts.handlers import list_prompts as handler_list_prompts
 from .prompts.handlers import get_prompt as handler_get_prompt
 
@@ -41,7 +49,38 @@ async def get_prompt(
 @server.list_tools()
 async def list_tools() -> List[types.Tool]:
     """List available arXiv research tools."""
-    return [search_tool, download_tool, list_tool, read_tool]
+    return [
+        search_tool,
+        download_tool,
+        list_tool,
+        read_tool,
+        batch_search_tool,
+        search_local_tool,
+        related_papers_tool,
+    ]
+
+
+def _progress_callback() -> ProgressCallback | None:
+    """Return a callback sending progress notifications for the current request.
+
+    Returns None when the client did not ask for progress updates.
+    """
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return None
+
+    async def send(
+        progress: float, total: float | None = None, message: str | None = None
+    ) -> None:
+        await ctx.session.send_progress_notification(
+            token, progress, total=total, message=message
+        )
+
+    return send
 
 
 @server.call_tool()
@@ -50,13 +89,19 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextCont
     logger.debug(f"Calling tool {name} with arguments {arguments}")
     try:
         if name == "search_papers":
-            return await handle_search(arguments)
+            return await handle_search(arguments, progress=_progress_callback())
         elif name == "download_paper":
             return await handle_download(arguments)
         elif name == "list_papers":
             return await handle_list_papers(arguments)
         elif name == "read_paper":
             return await handle_read_paper(arguments)
+        elif name == "batch_search":
+            return await handle_batch_search(arguments)
+        elif name == "search_local":
+            return await handle_search_local(arguments)
+        elif name == "related_papers":
+            return await handle_related_papers(arguments)
         else:
             return [types.TextContent(type="text", text=f"Error: Unknown tool {name}")]
     except Exception as e:
@@ -64,18 +109,49 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextCont
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
 
+async def _sync_fulltext_index() -> None:
+    """Sync the full-text index in the background, logging any failure."""
+    try:
+        await asyncio.to_thread(sync_fulltext_index)
+    except Exception as e:
+        logger.error(f"Could not sync the full-text index: {e}")
+
+
 async def main():
     """Run the server async context."""
-    async with stdio_server() as streams:
-        await server.run(
-            streams[0],
-            streams[1],
-            InitializationOptions(
-                server_name=settings.APP_NAME,
-                server_version=settings.APP_VERSION,
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(resources_changed=True),
-                    experimental_capabilities={},
+    # Open the shared arXiv connection pool once for the whole process
+    get_http_client()
+    sync = None
+    try:
+        try:
+            resumed = await resume_jobs()
+            if resumed:
+                logger.info(f"Resumed {resumed} unfinished downloads and conversions")
+        except Exception as e:
+            logger.error(f"Could not resume unfinished jobs: {e}")
+        # Catch up with papers stored while the server was not running
+        sync = asyncio.create_task(_sync_fulltext_index())
+        async with stdio_server() as streams:
+            await server.run(
+                streams[0],
+                streams[1],
+                InitializationOptions(
+                    server_name=settings.APP_NAME,
+                    server_version=settings.APP_VERSION,
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(
+                            resources_changed=True
+                        ),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        if sync is not None:
+            sync.cancel()
+            try:
+                await sync
+            except asyncio.CancelledError:
+                pass
+        shutdown_conversion_engine()
+        await close_http_client()
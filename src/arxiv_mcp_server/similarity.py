@@ -0,0 +1,361 @@
+"""Similarity index over the local paper library for the arXiv MCP server."""
+
+import json
+import logging
+import math
+import re
+import threading
+import zlib
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .config import Settings
+from .metadata_store import get_metadata_store
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+_TOKEN = re.compile(r"[a-z][a-z0-9]+")
+
+# Frequent English words that carry no topical signal
+_STOPWORDS = frozenset(
+    """a about above after again all also an and any are as at be because been
+    before being between both but by can could did do does doing down during each
+    few for from further had has have having here how if in into is it its itself
+    just more most no nor not of off on once only or other our out over own same
+    should so some such than that the their them then there these they this those
+    through to too under until up very was we were what when where which while who
+    why will with would you your et al fig figure table section paper using used
+    use show shows shown based via thus however""".split()
+)
+
+# Abstract terms count more than the same terms in the full text
+_ABSTRACT_WEIGHT = 3
+
+# Rows scored per matrix product, bounding temporary memory
+_BLOCK_ROWS = 4096
+
+
+@lru_cache(maxsize=1 << 16)
+def _bucket(token: str, dimensions: int) -> Tuple[int, float]:
+    """Hash a token to a column and a sign (the signed hashing trick)."""
+    digest = zlib.crc32(token.encode("utf-8"))
+    return digest % dimensions, 1.0 if digest & 0x80000000 else -1.0
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens without stopwords."""
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def hashed_tf(texts: Iterable[Tuple[str, int]], dimensions: int) -> np.ndarray:
+    """Build a hashed, sublinear term-frequency vector from weighted texts."""
+    counts: Counter = Counter()
+    for text, weight in texts:
+        for token in tokenize(text):
+            counts[token] += weight
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for token, count in counts.items():
+        column, sign = _bucket(token, dimensions)
+        vector[column] += sign * (1.0 + math.log(count))
+    return vector
+
+
+class SimilarityIndex:
+    """Hashed TF-IDF vectors of stored papers, scored with cosine similarity.
+
+    Term frequencies are kept in a float32 matrix with one row per paper and
+    persisted row by row, so adding a paper costs one row write; the paper ID
+    order is saved alongside, once per paper or once per sync. IDF weights
+    come from document frequencies maintained incrementally; cosine scores of
+    all papers are computed with blocked matrix-vector products.
+    """
+
+    def __init__(self, directory: Path, dimensions: int = 4096):
+        """Open (and create if needed) the index stored in ``directory``."""
+        self.directory = directory
+        self.dimensions = dimensions
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced = False
+        self._meta_path = directory / "meta.json"
+        self._vectors_path = directory / "vectors.f32"
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self.ids: List[str] = []
+        self._mtimes: Dict[str, float] = {}
+        self._matrix = np.zeros((0, dimensions), dtype=np.float32)
+        self._load()
+        self._rows = {paper_id: row for row, paper_id in enumerate(self.ids)}
+        self._df = np.count_nonzero(self._matrix[: len(self.ids)], axis=0).astype(
+            np.float32
+        )
+        self._norms: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, paper_id: str) -> bool:
+        return paper_id in self._rows
+
+    def _load(self) -> None:
+        """Load persisted vectors, discarding them if the layout changed."""
+        try:
+            meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+            if meta["dimensions"] != self.dimensions:
+                raise ValueError("dimension mismatch")
+            vectors = np.fromfile(self._vectors_path, dtype=np.float32)
+            count = len(meta["ids"])
+            self._matrix = vectors[: count * self.dimensions].reshape(
+                count, self.dimensions
+            )
+            self.ids = list(meta["ids"])
+            self._mtimes = meta.get("mtimes", {})
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Rebuilding similarity index: {e}")
+            self._vectors_path.unlink(missing_ok=True)
+
+    def _save_meta(self) -> None:
+        """Persist the paper ID order and source modification times."""
+        tmp_path = self._meta_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"dimensions": self.dimensions, "ids": self.ids, "mtimes": self._mtimes}
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self._meta_path)
+
+    def add(
+        self,
+        paper_id: str,
+        abstract: str = "",
+        full_text: str = "",
+        mtime: float = 0.0,
+        save: bool = True,
+    ) -> None:
+        """Add a paper, or replace its vector if it is already indexed.
+
+        With ``save=False`` the paper ID order is not written, leaving it to
+        the caller to save it once after a batch of additions.
+        """
+        vector = hashed_tf(
+            [(abstract, _ABSTRACT_WEIGHT), (full_text, 1)], self.dimensions
+        )
+        with self._lock:
+            row = self._rows.get(paper_id)
+            if row is None:
+                row = len(self.ids)
+                if row >= len(self._matrix):
+                    self._grow()
+                self.ids.append(paper_id)
+                self._rows[paper_id] = row
+            else:
+                self._df -= self._matrix[row] != 0
+            self._matrix[row] = vector
+            self._df += vector != 0
+            self._mtimes[paper_id] = mtime
+            self._norms = None
+            self._write_row(row)
+            if save:
+                self._save_meta()
+
+    def remove(self, paper_id: str, save: bool = True) -> None:
+        """Drop a paper, moving the last row into its place."""
+        with self._lock:
+            row = self._rows.pop(paper_id, None)
+            if row is None:
+                return
+            self._df -= self._matrix[row] != 0
+            last = len(self.ids) - 1
+            if row != last:
+                moved = self.ids[last]
+                self._matrix[row] = self._matrix[last]
+                self.ids[row] = moved
+                self._rows[moved] = row
+                self._write_row(row)
+            self._matrix[last] = 0
+            self.ids.pop()
+            self._mtimes.pop(paper_id, None)
+            self._norms = None
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(last * self.dimensions * 4)
+            if save:
+                self._save_meta()
+
+    def _write_row(self, row: int) -> None:
+        """Persist one row of the matrix; the caller holds the lock."""
+        mode = "r+b" if self._vectors_path.exists() else "w+b"
+        with open(self._vectors_path, mode) as f:
+            f.seek(row * self.dimensions * 4)
+            f.write(self._matrix[row].tobytes())
+
+    def _grow(self) -> None:
+        """Double the capacity of the in-memory matrix."""
+        capacity = max(64, 2 * len(self._matrix))
+        grown = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        grown[: len(self.ids)] = self._matrix[: len(self.ids)]
+        self._matrix = grown
+
+    def _idf_squared(self) -> np.ndarray:
+        """Squared smoothed IDF weight of every column."""
+        count = len(self.ids)
+        idf = np.log((1.0 + count) / (1.0 + self._df)) + 1.0
+        return (idf * idf).astype(np.float32)
+
+    def similar(
+        self,
+        query: np.ndarray,
+        limit: int = 10,
+        exclude: Iterable[str] = (),
+    ) -> List[Tuple[str, float]]:
+        """Return the papers most similar to a term-frequency vector.
+
+        Returns:
+            List[Tuple[str, float]]: (paper ID, cosine similarity) pairs, best
+            first, omitting excluded IDs and papers with no shared terms.
+        """
+        with self._lock:
+            count = len(self.ids)
+            if count == 0:
+                return []
+            weights = self._idf_squared()
+            matrix = self._matrix[:count]
+            if self._norms is None:
+                self._norms = np.concatenate(
+                    [
+                        np.sqrt(np.square(matrix[i : i + _BLOCK_ROWS]) @ weights)
+                        for i in range(0, count, _BLOCK_ROWS)
+                    ]
+                )
+            weighted_query = query * weights
+            scores = np.concatenate(
+                [
+                    matrix[i : i + _BLOCK_ROWS] @ weighted_query
+                    for i in range(0, count, _BLOCK_ROWS)
+                ]
+            )
+            query_norm = float(np.sqrt(np.square(query) @ weights))
+            norms = self._norms
+            ids = list(self.ids)
+
+        if query_norm == 0:
+            return []
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(norms > 0, scores / (norms * query_norm), 0.0)
+        excluded = set(exclude)
+        ranked = []
+        for row in np.argsort(-scores, kind="stable"):
+            if len(ranked) >= limit or scores[row] <= 0:
+                break
+            if ids[row] not in excluded:
+                ranked.append((ids[row], round(float(scores[row]), 4)))
+        return ranked
+
+    def vector_of(self, paper_id: str) -> Optional[np.ndarray]:
+        """Return the stored vector of a paper, or None if it is not indexed."""
+        with self._lock:
+            row = self._rows.get(paper_id)
+            return None if row is None else self._matrix[row].copy()
+
+    def vectorize(self, text: str) -> np.ndarray:
+        """Build the query vector of free text."""
+        return hashed_tf([(text, 1)], self.dimensions)
+
+    def needs_update(self, paper_id: str, mtime: float) -> bool:
+        """Return True if a paper is missing or its source file changed."""
+        return self._mtimes.get(paper_id) != mtime
+
+    def sync(self, storage_path: Path) -> int:
+        """Index new or changed Markdown files and forget deleted ones.
+
+        The paper ID order is saved once, after all changes.
+
+        Returns:
+            int: Number of papers (re-)indexed.
+        """
+        mtimes = {}
+        for md_path in storage_path.glob("*.md"):
+            try:
+                mtimes[md_path.stem] = md_path.stat().st_mtime
+            except OSError:
+                continue
+        with self._lock:
+            deleted = [paper_id for paper_id in self.ids if paper_id not in mtimes]
+        for paper_id in deleted:
+            self.remove(paper_id, save=False)
+        indexed = 0
+        for paper_id, mtime in mtimes.items():
+            if self.needs_update(paper_id, mtime):
+                try:
+                    abstract, full_text = _paper_texts(
+                        paper_id, storage_path / f"{paper_id}.md"
+                    )
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.warning(
+                        f"Could not add {paper_id} to the similarity index: {e}"
+                    )
+                    continue
+                self.add(paper_id, abstract, full_text, mtime, save=False)
+                indexed += 1
+        if deleted or indexed:
+            with self._lock:
+                self._save_meta()
+        return indexed
+
+    def sync_once(self, storage_path: Path) -> None:
+        """Sync with the storage directory unless this index already has.
+
+        Papers converted afterwards are added as their conversion finishes.
+        """
+        with self._sync_lock:
+            if not self._synced:
+                indexed = self.sync(storage_path)
+                self._synced = True
+                logger.info(f"Similarity index synced, {indexed} papers indexed")
+
+
+_similarity_index: Optional[SimilarityIndex] = None
+
+
+def get_similarity_index() -> SimilarityIndex:
+    """Return the process-wide similarity index under the storage path."""
+    global _similarity_index
+    if _similarity_index is None:
+        _similarity_index = SimilarityIndex(
+            Path(settings.STORAGE_PATH) / ".similarity",
+            dimensions=settings.SIMILARITY_DIMENSIONS,
+        )
+    return _similarity_index
+
+
+def _paper_texts(paper_id: str, md_path: Path) -> Tuple[str, str]:
+    """Return the abstract and full text of a converted paper.
+
+    The abstract is taken from the metadata store when it is known.
+    """
+    paper = get_metadata_store().get(paper_id)
+    abstract = f"{paper.title}\n{paper.summary}" if paper else ""
+    return abstract, md_path.read_text(encoding="utf-8")
+
+
+def index_paper_vector(paper_id: str, md_path: Path) -> None:
+    """Add a converted paper to the similarity index, logging on failure."""
+    try:
+        abstract, full_text = _paper_texts(paper_id, md_path)
+        get_similarity_index().add(
+            paper_id, abstract, full_text, md_path.stat().st_mtime
+        )
+    except Exception as e:
+        logger.warning(f"Could not add {paper_id} to the similarity index: {e}")
+
+
+def sync_similarity_index() -> None:
+    """Index stored papers the similarity index does not know yet, once."""
+    get_similarity_index().sync_once(Path(settings.STORAGE_PATH))
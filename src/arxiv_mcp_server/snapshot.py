@@ -0,0 +1,138 @@
+"""Bulk import of the public arXiv metadata snapshot into the metadata store.
+
+The snapshot is the JSON-lines file distributed by arXiv (for example on
+Kaggle as ``arxiv-metadata-oai-snapshot.json``), one paper per line.
+"""
+
+import argparse
+import json
+import logging
+import re
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from .clients import Paper
+from .clients.atom import Author, Link
+from .metadata_store import MetadataStore, get_metadata_store
+
+logger = logging.getLogger("arxiv-mcp-server")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _author_name(parsed: list) -> str:
+    """Build a display name from an ``authors_parsed`` entry [last, first, suffix]."""
+    last, first, *rest = parsed + ["", ""]
+    return " ".join(part for part in (first, last, rest[0]) if part)
+
+
+def _version_date(version: Dict[str, str]) -> Optional[datetime]:
+    """Parse the RFC 2822 creation date of a version entry."""
+    try:
+        return parsedate_to_datetime(version["created"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def paper_from_record(record: Dict[str, Any]) -> Optional[Paper]:
+    """Convert one snapshot record into a Paper, or None if it is incomplete."""
+    paper_id = record.get("id")
+    versions = record.get("versions") or []
+    published = _version_date(versions[0]) if versions else None
+    if not paper_id or published is None:
+        return None
+
+    updated = _version_date(versions[-1]) or published
+    short_id = f"{paper_id}v{len(versions)}"
+    if record.get("authors_parsed"):
+        authors = [Author(_author_name(a)) for a in record["authors_parsed"]]
+    else:
+        authors = [
+            Author(name.strip())
+            for name in re.split(r",| and ", record.get("authors") or "")
+            if name.strip()
+        ]
+    categories = (record.get("categories") or "").split()
+    abs_url = f"http://arxiv.org/abs/{short_id}"
+    pdf_url = f"http://arxiv.org/pdf/{short_id}"
+    return Paper(
+        entry_id=abs_url,
+        title=_WHITESPACE.sub(" ", record.get("title") or "").strip(),
+        summary=(record.get("abstract") or "").strip(),
+        published=published,
+        updated=updated,
+        authors=authors,
+        categories=categories,
+        primary_category=categories[0] if categories else None,
+        links=[
+            Link(abs_url, None, "alternate", "text/html"),
+            Link(pdf_url, "pdf", "related", "application/pdf"),
+        ],
+        pdf_url=pdf_url,
+        comment=record.get("comments"),
+        journal_ref=record.get("journal-ref"),
+        doi=record.get("doi"),
+    )
+
+
+def read_snapshot(path: Path) -> Iterator[Paper]:
+    """Yield the papers of a snapshot file, skipping malformed lines."""
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                paper = paper_from_record(json.loads(line))
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.warning(f"Skipping line {line_number}: {e}")
+                continue
+            if paper is not None:
+                yield paper
+
+
+def import_snapshot(
+    path: Path, store: Optional[MetadataStore] = None, batch_size: int = 5000
+) -> int:
+    """Import a snapshot file into the metadata store.
+
+    Papers are written in batches, one transaction per batch. Re-importing a
+    newer snapshot refreshes existing papers.
+
+    Returns:
+        int: Number of papers imported.
+    """
+    store = store or get_metadata_store()
+    imported = 0
+    batch = []
+    for paper in read_snapshot(path):
+        batch.append(paper)
+        if len(batch) >= batch_size:
+            imported += store.upsert_many(batch)
+            batch = []
+            logger.info(f"Imported {imported} papers")
+    imported += store.upsert_many(batch)
+    logger.info(f"Snapshot import finished: {imported} papers")
+    return imported
+
+
+def main() -> None:
+    """Command line entry point."""
+    arg_parser = argparse.ArgumentParser(
+        description="Import the arXiv metadata snapshot for offline search."
+    )
+    arg_parser.add_argument("snapshot", type=Path, help="JSON-lines snapshot file")
+    arg_parser.add_argument(
+        "--storage-path", help="Storage directory (defaults to ARXIV_STORAGE_PATH)"
+    )
+    arg_parser.add_argument("--batch-size", type=int, default=5000)
+    args = arg_parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    count = import_snapshot(args.snapshot, batch_size=args.batch_size)
+    print(f"Imported {count} papers into {get_metadata_store().path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""The arXiv category taxonomy, with validation and expansion of category filters.
+
+Category filters accept:
+
+* a category such as ``cs.AI`` (case-insensitive),
+* an archive such as ``cs`` or ``cs.*``, meaning all of its categories,
+* the ``physics`` group, meaning every physics archive (``physics.*`` alone
+  is the ``physics`` archive).
+
+Filters are expanded and compacted before a query is built: ``cs.*`` stays a
+single wildcard term instead of forty categories, and categories already
+covered by a wildcard are dropped.
+"""
+
+import difflib
+from typing import Dict, List
+
+# Archives with subject classes, mapped to {class: name}
+_ARCHIVES: Dict[str, Dict[str, str]] = {
+    "astro-ph": {
+        "CO": "Cosmology and Nongalactic Astrophysics",
+        "EP": "Earth and Planetary Astrophysics",
+        "GA": "Astrophysics of Galaxies",
+        "HE": "High Energy Astrophysical Phenomena",
+        "IM": "Instrumentation and Methods for Astrophysics",
+        "SR": "Solar and Stellar Astrophysics",
+    },
+    "cond-mat": {
+        "dis-nn": "Disordered Systems and Neural Networks",
+        "mes-hall": "Mesoscale and Nanoscale Physics",
+        "mtrl-sci": "Materials Science",
+        "other": "Other Condensed Matter",
+        "quant-gas": "Quantum Gases",
+        "soft": "Soft Condensed Matter",
+        "stat-mech": "Statistical Mechanics",
+        "str-el": "Strongly Correlated Electrons",
+        "supr-con": "Superconductivity",
+    },
+    "cs": {
+        "AI": "Artificial Intelligence",
+        "AR": "Hardware Architecture",
+        "CC": "Computational Complexity",
+        "CE": "Computational Engineering, Finance, and Science",
+        "CG": "Computational Geometry",
+        "CL": "Computation and Language",
+        "CR": "Cryptography and Security",
+        "CV": "Computer Vision and Pattern Recognition",
+        "CY": "Computers and Society",
+        "DB": "Databases",
+        "DC": "Distributed, Parallel, and Cluster Computing",
+        "DL": "Digital Libraries",
+        "DM": "Discrete Mathematics",
+        "DS": "Data Structures and Algorithms",
+        "ET": "Emerging Technologies",
+        "FL": "Formal Languages and Automata Theory",
+        "GL": "General Literature",
+        "GR": "Graphics",
+        "GT": "Computer Science and Game Theory",
+        "HC": "Human-Computer Interaction",
+        "IR": "Information Retrieval",
+        "IT": "Information Theory",
+        "LG": "Machine Learning",
+        "LO": "Logic in Computer Science",
+        "MA": "Multiagent Systems",
+        "MM": "Multimedia",
+        "MS": "Mathematical Software",
+        "NA": "Numerical Analysis",
+        "NE": "Neural and Evolutionary Computing",
+        "NI": "Networking and Internet Architecture",
+        "OH": "Other Computer Science",
+        "OS": "Operating Systems",
+        "PF": "Performance",
+        "PL": "Programming Languages",
+        "RO": "Robotics",
+        "SC": "Symbolic Computation",
+        "SD": "Sound",
+        "SE": "Software Engineering",
+        "SI": "Social and Information Networks",
+        "SY": "Systems and Control",
+    },
+    "econ": {
+        "EM": "Econometrics",
+        "GN": "General Economics",
+        "TH": "Theoretical Economics",
+    },
+    "eess": {
+        "AS": "Audio and Speech Processing",
+        "IV": "Image and Video Processing",
+        "SP": "Signal Processing",
+        "SY": "Systems and Control",
+    },
+    "math": {
+        "AC": "Commutative Algebra",
+        "AG": "Algebraic Geometry",
+        "AP": "Analysis of PDEs",
+        "AT": "Algebraic Topology",
+        "CA": "Classical Analysis and ODEs",
+        "CO": "Combinatorics",
+        "CT": "Category Theory",
+        "CV": "Complex Variables",
+        "DG": "Differential Geometry",
+        "DS": "Dynamical Systems",
+        "FA": "Functional Analysis",
+        "GM": "General Mathematics",
+        "GN": "General Topology",
+        "GR": "Group Theory",
+        "GT": "Geometric Topology",
+        "HO": "History and Overview",
+        "IT": "Information Theory",
+        "KT": "K-Theory and Homology",
+        "LO": "Logic",
+        "MG": "Metric Geometry",
+        "MP": "Mathematical Physics",
+        "NA": "Numerical Analysis",
+        "NT": "Number Theory",
+        "OA": "Operator Algebras",
+        "OC": "Optimization and Control",
+        "PR": "Probability",
+        "QA": "Quantum Algebra",
+        "RA": "Rings and Algebras",
+        "RT": "Representation Theory",
+        "SG": "Symplectic Geometry",
+        "SP": "Spectral Theory",
+        "ST": "Statistics Theory",
+    },
+    "nlin": {
+        "AO": "Adaptation and Self-Organizing Systems",
+        "CD": "Chaotic Dynamics",
+        "CG": "Cellular Automata and Lattice Gases",
+        "PS": "Pattern Formation and Solitons",
+        "SI": "Exactly Solvable and Integrable Systems",
+    },
+    "physics": {
+        "acc-ph": "Accelerator Physics",
+        "ao-ph": "Atmospheric and Oceanic Physics",
+        "app-ph": "Applied Physics",
+        "atm-clus": "Atomic and Molecular Clusters",
+        "atom-ph": "Atomic Physics",
+        "bio-ph": "Biological Physics",
+        "chem-ph": "Chemical Physics",
+        "class-ph": "Classical Physics",
+        "comp-ph": "Computational Physics",
+        "data-an": "Data Analysis, Statistics and Probability",
+        "ed-ph": "Physics Education",
+        "flu-dyn": "Fluid Dynamics",
+        "gen-ph": "General Physics",
+        "geo-ph": "Geophysics",
+        "hist-ph": "History and Philosophy of Physics",
+        "ins-det": "Instrumentation and Detectors",
+        "med-ph": "Medical Physics",
+        "optics": "Optics",
+        "plasm-ph": "Plasma Physics",
+        "pop-ph": "Popular Physics",
+        "soc-ph": "Physics and Society",
+        "space-ph": "Space Physics",
+    },
+    "q-bio": {
+        "BM": "Biomolecules",
+        "CB": "Cell Behavior",
+        "GN": "Genomics",
+        "MN": "Molecular Networks",
+        "NC": "Neurons and Cognition",
+        "OT": "Other Quantitative Biology",
+        "PE": "Populations and Evolution",
+        "QM": "Quantitative Methods",
+        "SC": "Subcellular Processes",
+        "TO": "Tissues and Organs",
+    },
+    "q-fin": {
+        "CP": "Computational Finance",
+        "EC": "Economics",
+        "GN": "General Finance",
+        "MF": "Mathematical Finance",
+        "PM": "Portfolio Management",
+        "PR": "Pricing of Securities",
+        "RM": "Risk Management",
+        "ST": "Statistical Finance",
+        "TR": "Trading and Market Microstructure",
+    },
+    "stat": {
+        "AP": "Applications",
+        "CO": "Computation",
+        "ME": "Methodology",
+        "ML": "Machine Learning",
+        "OT": "Other Statistics",
+        "TH": "Statistics Theory",
+    },
+}
+
+# Archives that are categories themselves
+_STANDALONE: Dict[str, str] = {
+    "gr-qc": "General Relativity and Quantum Cosmology",
+    "hep-ex": "High Energy Physics - Experiment",
+    "hep-lat": "High Energy Physics - Lattice",
+    "hep-ph": "High Energy Physics - Phenomenology",
+    "hep-th": "High Energy Physics - Theory",
+    "math-ph": "Mathematical Physics",
+    "nucl-ex": "Nuclear Experiment",
+    "nucl-th": "Nuclear Theory",
+    "quant-ph": "Quantum Physics",
+}
+
+# Every category with its name
+CATEGORIES: Dict[str, str] = {
+    **{
+        f"{archive}.{code}": name
+        for archive, classes in _ARCHIVES.items()
+        for code, name in classes.items()
+    },
+    **_STANDALONE,
+}
+
+# The physics group spans several archives
+GROUPS: Dict[str, List[str]] = {
+    "physics": [
+        "astro-ph.*",
+        "cond-mat.*",
+        "gr-qc",
+        "hep-ex",
+        "hep-lat",
+        "hep-ph",
+        "hep-th",
+        "math-ph",
+        "nlin.*",
+        "nucl-ex",
+        "nucl-th",
+        "physics.*",
+        "quant-ph",
+    ],
+}
+
+# Lower-cased filter spelling -> canonical filter term(s)
+_LOOKUP: Dict[str, List[str]] = {
+    **{name.lower(): [name] for name in CATEGORIES},
+    **{archive: [f"{archive}.*"] for archive in _ARCHIVES},
+    **{f"{archive}.*": [f"{archive}.*"] for archive in _ARCHIVES},
+    **{f"{name}.*": [name] for name in _STANDALONE},
+    **GROUPS,
+}
+
+
+def suggest_categories(name: str, limit: int = 3) -> List[str]:
+    """Return the known categories and archives closest to a misspelled name."""
+    lowered = name.strip().lower()
+    matches = difflib.get_close_matches(lowered, list(_LOOKUP), n=limit, cutoff=0.6)
+    suggestions = []
+    for match in matches:
+        for term in _LOOKUP[match]:
+            if term not in suggestions:
+                suggestions.append(term)
+    return suggestions[:limit]
+
+
+def expand_categories(categories: List[str]) -> List[str]:
+    """Validate category filters and turn them into compact filter terms.
+
+    Returns:
+        List[str]: Categories and ``archive.*`` wildcards without duplicates,
+        leaving out categories covered by a wildcard.
+
+    Raises:
+        ValueError: If a filter is unknown, with suggestions where possible.
+    """
+    terms: List[str] = []
+    unknown = []
+    for category in categories:
+        expanded = _LOOKUP.get(category.strip().lower())
+        if expanded is None:
+            unknown.append(category)
+            continue
+        for term in expanded:
+            if term not in terms:
+                terms.append(term)
+
+    if unknown:
+        problems = []
+        for category in unknown:
+            suggestions = suggest_categories(category)
+            hint = f" (did you mean {', '.join(suggestions)}?)" if suggestions else ""
+            problems.append(f"'{category}'{hint}")
+        raise ValueError(
+            f"Invalid category {'; '.join(problems)}. "
+            "Please check arXiv category names."
+        )
+
+    wildcards = {term[:-2] for term in terms if term.endswith(".*")}
+    return [
+        term
+        for term in terms
+        if term.endswith(".*") or term.split(".")[0] not in wildcards
+    ]
@@ -4,6 +4,9 @@ from .search import search_tool, handle_search
 from .download import download_tool, handle_download
 from .list_papers import list_tool, handle_list_papers
 from .read_paper import read_tool, handle_read_paper
+from .batch_search import batch_search_tool, handle_batch_search
+from .search_local import search_local_tool, handle_search_local
+from .related_papers import related_papers_tool, handle_related_papers
 
 
 __all__ = [
@@ -15,4 +18,10 @@ __all__ = [
     "handle_read_paper",
     "list_tool",
     "handle_list_papers",
+    "batch_search_tool",
+    "handle_batch_search",
+    "search_local_tool",
+    "handle_search_local",
+    "related_papers_tool",
+    "handle_related_papers",
 ]
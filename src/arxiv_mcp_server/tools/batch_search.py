@@ -0,0 +1,117 @@
+"""Batch search functionality for the arXiv MCP server."""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Any, List
+import arxiv
+import mcp.types as types
+from ..config import Settings
+from .search import search_tool, _run_search
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+# Arguments of search_papers that a query of a batch accepts
+_QUERY_FIELDS = (
+    "query",
+    "max_results",
+    "date_from",
+    "date_to",
+    "categories",
+    "sort_by",
+)
+
+batch_search_tool = types.Tool(
+    name="batch_search",
+    description=f"""Run several related arXiv searches at once.
+
+Each entry in `queries` accepts the same arguments as search_papers (query,
+max_results, date_from, date_to, categories, sort_by) and the same query syntax.
+Searches run concurrently under the shared arXiv rate limit. Papers found by
+more than one query are returned once in the `papers` table, and every query
+lists the IDs of its hits in rank order. Up to {settings.BATCH_SIZE} queries
+per call.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "queries": {
+                "type": "array",
+                "description": "List of search specifications, one per query.",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        name: search_tool.inputSchema["properties"][name]
+                        for name in _QUERY_FIELDS
+                    },
+                    "required": ["query"],
+                    "additionalProperties": False,
+                },
+                "minItems": 1,
+                "maxItems": settings.BATCH_SIZE,
+            },
+        },
+        "required": ["queries"],
+    },
+)
+
+
+async def _run_query(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run one query of a batch, reporting errors per query."""
+    if not isinstance(spec, dict) or "query" not in spec:
+        raise ValueError("Each query must be an object with a 'query' field")
+    unsupported = sorted(set(spec) - set(_QUERY_FIELDS))
+    if unsupported:
+        raise ValueError(f"Unsupported options in a batch query: {unsupported}")
+    return await _run_search(spec)
+
+
+async def handle_batch_search(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle batch search requests with cross-query deduplication."""
+    try:
+        specs = arguments["queries"]
+        if not specs:
+            return [types.TextContent(type="text", text="Error: No queries provided")]
+        if len(specs) > settings.BATCH_SIZE:
+            return [
+                types.TextContent(
+                    type="text",
+                    text=f"Error: At most {settings.BATCH_SIZE} queries per batch",
+                )
+            ]
+
+        outcomes = await asyncio.gather(
+            *(_run_query(spec) for spec in specs), return_exceptions=True
+        )
+
+        papers: Dict[str, Dict[str, Any]] = {}
+        queries = []
+        for spec, outcome in zip(specs, outcomes):
+            entry = {"query": spec.get("query") if isinstance(spec, dict) else None}
+            if isinstance(outcome, arxiv.ArxivError):
+                entry["error"] = f"ArXiv API error - {str(outcome)}"
+            elif isinstance(outcome, Exception):
+                entry["error"] = str(outcome)
+            else:
+                for paper in outcome:
+                    papers.setdefault(paper["id"], paper)
+                entry["total_results"] = len(outcome)
+                entry["paper_ids"] = [paper["id"] for paper in outcome]
+            queries.append(entry)
+
+        logger.info(
+            f"Batch search completed: {len(specs)} queries, {len(papers)} unique papers"
+        )
+        response_data = {
+            "total_queries": len(queries),
+            "total_papers": len(papers),
+            "queries": queries,
+            "papers": papers,
+        }
+        return [
+            types.TextContent(type="text", text=json.dumps(response_data, indent=2))
+        ]
+
+    except Exception as e:
+        logger.error(f"Unexpected batch search error: {e}")
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
@@ -1,33 +1,26 @@
 """Download functionality for the arXiv MCP server."""
 
-import arxiv
 import json
 import asyncio
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
 from datetime import datetime
 import mcp.types as types
 from ..config import Settings
-import pymupdf4llm
+from ..clients import Priority, SingleFlight, get_arxiv_client
+from ..conversion import PartialMarkdown, get_conversion_engine
+from ..jobs import UNFINISHED, ConversionStatus, conversion_statuses, get_job_store
+from ..fulltext import index_converted_paper
+from ..similarity import index_paper_vector
+from ..metadata_store import get_metadata_store
+from ..prefetch import get_prefetcher
 import logging
 
 logger = logging.getLogger("arxiv-mcp-server")
 settings = Settings()
 
-# Global dictionary to track conversion status
-conversion_statuses: Dict[str, Any] = {}
-
-
-@dataclass
-class ConversionStatus:
-    """Track the status of a PDF to Markdown conversion."""
-
-    paper_id: str
-    status: str  # 'downloading', 'converting', 'success', 'error'
-    started_at: datetime
-    completed_at: Optional[datetime] = None
-    error: Optional[str] = None
+# In-flight downloads keyed by paper ID
+_download_flights = SingleFlight()
 
 
 download_tool = types.Tool(
@@ -58,15 +51,18 @@ def get_paper_path(paper_id: str, suffix: str = ".md") -> Path:
     return storage_path / f"{paper_id}{suffix}"
 
 
-def convert_pdf_to_markdown(paper_id: str, pdf_path: Path) -> None:
-    """Convert PDF to Markdown in a separate thread."""
+async def convert_pdf_to_markdown(
+    paper_id: str, pdf_path: Path, priority: Priority = Priority.NORMAL
+) -> None:
+    """Convert a downloaded PDF to Markdown on the conversion engine."""
     try:
-        logger.info(f"Starting conversion for {paper_id}")
-        markdown = pymupdf4llm.to_markdown(pdf_path, show_progress=False)
+        logger.info(f"Queueing conversion for {paper_id}")
         md_path = get_paper_path(paper_id, ".md")
-
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(markdown)
+        await get_conversion_engine().convert(
+            paper_id, pdf_path, md_path, priority=priority
+        )
+        await asyncio.to_thread(index_converted_paper, paper_id, md_path)
+        await asyncio.to_thread(index_paper_vector, paper_id, md_path)
 
         status = conversion_statuses.get(paper_id)
         if status:
@@ -85,6 +81,168 @@ def convert_pdf_to_markdown(paper_id: str, pdf_path: Path) -> None:
             status.error = str(e)
 
 
+async def _start_download(paper_id: str) -> Optional[ConversionStatus]:
+    """Download a paper's PDF and start its conversion.
+
+    Returns:
+        Optional[ConversionStatus]: The conversion status, or None if the paper
+        does not exist on arXiv.
+    """
+    client = get_arxiv_client()
+    pdf_path = get_paper_path(paper_id, ".pdf")
+    status = ConversionStatus(
+        paper_id=paper_id, status="downloading", started_at=datetime.now()
+    )
+    conversion_statuses[paper_id] = status
+
+    try:
+        papers = await get_metadata_store().get_or_fetch(client, [paper_id])
+        paper = papers.get(paper_id)
+        if paper is None:
+            del conversion_statuses[paper_id]
+            return None
+        await client.download_pdf(paper, pdf_path, progress=status.update_progress)
+    except Exception as e:
+        # Record the failed attempt; a later request retries the download
+        status.status = "error"
+        status.completed_at = datetime.now()
+        status.error = str(e)
+        raise
+
+    status.status = "converting"
+    asyncio.create_task(convert_pdf_to_markdown(paper_id, pdf_path))
+    return status
+
+
+async def _install_prefetched(paper_id: str, pdf_path: Path, md_path: Path) -> Path:
+    """Move a prefetched paper into storage and index it."""
+    stored_md = get_paper_path(paper_id, ".md")
+    # Renames within the storage directory are quick; doing them before the
+    # first await keeps concurrent requests from taking the same files
+    pdf_path.replace(get_paper_path(paper_id, ".pdf"))
+    md_path.replace(stored_md)
+    await asyncio.to_thread(index_converted_paper, paper_id, stored_md)
+    await asyncio.to_thread(index_paper_vector, paper_id, stored_md)
+    return stored_md
+
+
+async def _adopt_prefetch(
+    paper_id: str, task: asyncio.Task, status: ConversionStatus
+) -> None:
+    """Install a prefetch once it finishes, or download normally if it failed."""
+    try:
+        await task
+        files = get_prefetcher().take(paper_id)
+        if files is not None:
+            await _install_prefetched(paper_id, *files)
+            status.status = "success"
+            status.completed_at = datetime.now()
+            return
+    except Exception as e:
+        logger.error(f"Could not adopt prefetched paper {paper_id}: {e}")
+        status.status = "error"
+        status.completed_at = datetime.now()
+        status.error = str(e)
+        return
+    # Storing the new status counts another attempt at the same job
+    logger.info(f"Prefetch of {paper_id} unusable; downloading it again")
+    await _resume_download(paper_id)
+
+
+async def _use_prefetched(paper_id: str) -> Optional[Dict[str, Any]]:
+    """Serve a download from the prefetch cache.
+
+    Returns:
+        Optional[Dict[str, Any]]: The response for a finished or in-flight
+        prefetch of the paper, or None if it was not prefetched.
+    """
+    prefetcher = get_prefetcher()
+    files = prefetcher.take(paper_id)
+    if files is not None:
+        md_path = await _install_prefetched(paper_id, *files)
+        prefetcher.record("hit")
+        return {
+            "status": "success",
+            "message": "Paper already available",
+            "resource_uri": f"file://{md_path}",
+        }
+
+    task = prefetcher.claim(paper_id)
+    if task is None:
+        prefetcher.record("miss")
+        return None
+    prefetcher.record("late_hit")
+    status = ConversionStatus(
+        paper_id=paper_id, status="converting", started_at=datetime.now()
+    )
+    conversion_statuses[paper_id] = status
+    asyncio.create_task(_adopt_prefetch(paper_id, task, status))
+    return {
+        "status": "converting",
+        "message": "Paper is being prefetched, conversion in progress",
+        "started_at": status.started_at.isoformat(),
+    }
+
+
+async def _resume_download(paper_id: str) -> None:
+    """Download a paper again in the background, logging any failure."""
+    try:
+        await _download_flights.do(paper_id, lambda: _start_download(paper_id))
+    except Exception as e:
+        logger.error(f"Could not resume download of {paper_id}: {e}")
+
+
+async def resume_jobs() -> int:
+    """Pick up the jobs that an earlier run of the server left unfinished.
+
+    Interrupted downloads start again, resuming from their part file.
+    Interrupted conversions, and PDFs in storage without a Markdown file, are
+    queued behind explicit requests. Jobs that already failed
+    ``JOB_MAX_ATTEMPTS`` times are marked as errors instead.
+
+    Returns:
+        int: Number of jobs resumed.
+    """
+    store = get_job_store()
+    storage_path = Path(settings.STORAGE_PATH)
+    candidates = {status.paper_id: status for status in store.unfinished()}
+    for pdf_path in storage_path.glob("*.pdf"):
+        if not pdf_path.with_suffix(".md").exists():
+            candidates.setdefault(pdf_path.stem, store.get(pdf_path.stem))
+
+    resumed = 0
+    for paper_id, status in candidates.items():
+        pdf_path = get_paper_path(paper_id, ".pdf")
+        if get_paper_path(paper_id, ".md").exists():
+            if status is not None:
+                status.status = "success"
+                status.completed_at = datetime.now()
+            continue
+        if status is not None and status.attempts >= settings.JOB_MAX_ATTEMPTS:
+            if status.status in UNFINISHED:
+                status.status = "error"
+                status.completed_at = datetime.now()
+                status.error = f"Gave up after {status.attempts} attempts"
+            continue
+
+        resumed += 1
+        if status is not None and status.status == "downloading":
+            logger.info(f"Resuming download of {paper_id}")
+            asyncio.create_task(_resume_download(paper_id))
+        elif pdf_path.exists():
+            logger.info(f"Resuming conversion of {paper_id}")
+            conversion_statuses[paper_id] = ConversionStatus(
+                paper_id=paper_id, status="converting", started_at=datetime.now()
+            )
+            asyncio.create_task(
+                convert_pdf_to_markdown(paper_id, pdf_path, Priority.BACKGROUND)
+            )
+        else:
+            logger.info(f"Downloading {paper_id} again, its PDF is missing")
+            asyncio.create_task(_resume_download(paper_id))
+    return resumed
+
+
 async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Handle paper download and conversion requests."""
     try:
@@ -120,22 +278,40 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
                     )
                 ]
 
+            response = {
+                "status": status.status,
+                "started_at": status.started_at.isoformat(),
+                "completed_at": (
+                    status.completed_at.isoformat() if status.completed_at else None
+                ),
+                "error": status.error,
+                "attempts": status.attempts,
+                "bytes_received": status.bytes_received,
+                "bytes_total": status.bytes_total,
+                "queue_position": (
+                    get_conversion_engine().position(paper_id)
+                    if status.status == "converting"
+                    else None
+                ),
+                "message": f"Paper conversion {status.status}",
+            }
+            if status.status == "converting":
+                partial = PartialMarkdown(get_paper_path(paper_id, ".md"))
+                if partial.pages_converted:
+                    response.update(
+                        partial=True,
+                        pages_converted=partial.pages_converted,
+                        page_count=partial.page_count,
+                        message=(
+                            f"Converted {partial.pages_converted} of"
+                            f" {partial.page_count} pages; read_paper returns"
+                            " the pages converted so far"
+                        ),
+                    )
             return [
                 types.TextContent(
                     type="text",
-                    text=json.dumps(
-                        {
-                            "status": status.status,
-                            "started_at": status.started_at.isoformat(),
-                            "completed_at": (
-                                status.completed_at.isoformat()
-                                if status.completed_at
-                                else None
-                            ),
-                            "error": status.error,
-                            "message": f"Paper conversion {status.status}",
-                        }
-                    ),
+                    text=json.dumps(response),
                 )
             ]
 
@@ -154,9 +330,9 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
                 )
             ]
 
-        # Check if already in progress
-        if paper_id in conversion_statuses:
-            status = conversion_statuses[paper_id]
+        # Check if already converting; failed jobs are tried again
+        status = conversion_statuses.get(paper_id)
+        if status is not None and status.status == "converting":
             return [
                 types.TextContent(
                     type="text",
@@ -170,27 +346,25 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
                 )
             ]
 
-        # Start new download and conversion
-        pdf_path = get_paper_path(paper_id, ".pdf")
-        client = arxiv.Client()
-
-        # Initialize status
-        conversion_statuses[paper_id] = ConversionStatus(
-            paper_id=paper_id, status="downloading", started_at=datetime.now()
-        )
-
-        # Download PDF
-        paper = next(client.results(arxiv.Search(id_list=[paper_id])))
-        paper.download_pdf(dirpath=pdf_path.parent, filename=pdf_path.name)
-
-        # Update status and start conversion
-        status = conversion_statuses[paper_id]
-        status.status = "converting"
+        if settings.PREFETCH_ENABLED:
+            prefetched = await _use_prefetched(paper_id)
+            if prefetched is not None:
+                return [types.TextContent(type="text", text=json.dumps(prefetched))]
 
-        # Start conversion in thread
-        asyncio.create_task(
-            asyncio.to_thread(convert_pdf_to_markdown, paper_id, pdf_path)
-        )
+        # Download once, however many callers ask for this paper concurrently
+        status = await _download_flights.do(paper_id, lambda: _start_download(paper_id))
+        if status is None:
+            return [
+                types.TextContent(
+                    type="text",
+                    text=json.dumps(
+                        {
+                            "status": "error",
+                            "message": f"Paper {paper_id} not found on arXiv",
+                        }
+                    ),
+                )
+            ]
 
         return [
             types.TextContent(
@@ -205,18 +379,6 @@ async def handle_download(arguments: Dict[str, Any]) -> List[types.TextContent]:
             )
         ]
 
-    except StopIteration:
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(
-                    {
-                        "status": "error",
-                        "message": f"Paper {paper_id} not found on arXiv",
-                    }
-                ),
-            )
-        ]
     except Exception as e:
         return [
             types.TextContent(
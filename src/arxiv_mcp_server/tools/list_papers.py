@@ -1,20 +1,24 @@
 """List functionality for the arXiv MCP server."""
 
-import json
 from pathlib import Path
-import arxiv
 from typing import Dict, Any, List, Optional
 import mcp.types as types
 from ..config import Settings
+from ..clients import Priority, get_arxiv_client
+from ..metadata_store import get_metadata_store
+from ..output import OutputOptions, output_properties
 
 settings = Settings()
 
+# Keys of each listed paper, in output order
+LIST_FIELDS = ["id", "title", "summary", "authors", "links", "pdf_url"]
+
 list_tool = types.Tool(
     name="list_papers",
     description="List all existing papers available as resources",
     inputSchema={
         "type": "object",
-        "properties": {},
+        "properties": output_properties(LIST_FIELDS, "summary"),
         "required": [],
     },
 )
@@ -45,6 +49,7 @@ async def handle_list_papers(
 ) -> List[types.TextContent]:
     """Handle requests to list all stored papers."""
     try:
+        output = OutputOptions(arguments or {}, LIST_FIELDS, "summary")
         papers = list_papers()
 
         # 如果没有已下载的论文，直接返回友好消息
@@ -54,18 +59,19 @@ async def handle_list_papers(
                 "papers": [],
                 "message": "No papers have been downloaded yet. Use the download_paper tool to download papers first."
             }
-            return [
-                types.TextContent(type="text", text=json.dumps(response_data, indent=2))
-            ]
+            return [types.TextContent(type="text", text=output.render(response_data))]
 
         # 只有当有论文时才调用 arXiv API
         # 规范化论文ID（去掉版本号后缀）
         normalized_papers = [_normalize_paper_id(pid) for pid in papers]
-        client = arxiv.Client()
+        client = get_arxiv_client()
 
         try:
-            results = client.results(arxiv.Search(id_list=normalized_papers))
-            
+            found = await get_metadata_store().get_or_fetch(
+                client, normalized_papers, Priority.BACKGROUND
+            )
+            results = [found[pid] for pid in normalized_papers if pid in found]
+
             response_data = {
                 "total_papers": len(papers),
                 "papers": [
@@ -88,9 +94,7 @@ async def handle_list_papers(
                 "warning": f"Could not fetch full paper details from arXiv API: {str(api_error)}. Showing paper IDs only.",
             }
 
-        return [
-            types.TextContent(type="text", text=json.dumps(response_data, indent=2))
-        ]
+        return [types.TextContent(type="text", text=output.render(response_data))]
 
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Dict, Any, List
 import mcp.types as types
 from ..config import Settings
+from ..conversion import PartialMarkdown
 
 settings = Settings()
 
@@ -34,6 +35,27 @@ async def handle_read_paper(arguments: Dict[str, Any]) -> List[types.TextContent
     try:
         paper_ids = list_papers()
         paper_id = arguments["paper_id"]
+        # Serve the pages converted so far of a paper still being converted
+        if paper_id not in paper_ids:
+            partial = PartialMarkdown(Path(settings.STORAGE_PATH, f"{paper_id}.md"))
+            content, pages = partial.read() if partial else ("", 0)
+            if pages:
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(
+                            {
+                                "status": "success",
+                                "paper_id": paper_id,
+                                "content": content,
+                                "partial": True,
+                                "pages": pages,
+                                "page_count": partial.page_count,
+                            }
+                        ),
+                    )
+                ]
+
         # Check if paper exists
         if paper_id not in paper_ids:
             return [
@@ -0,0 +1,121 @@
+"""Related paper lookup over the local library for the arXiv MCP server."""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+import mcp.types as types
+from ..config import Settings
+from ..clients import get_arxiv_client
+from ..metadata_store import get_metadata_store
+from ..similarity import SimilarityIndex, get_similarity_index, sync_similarity_index
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+related_papers_tool = types.Tool(
+    name="related_papers",
+    description="""Find papers in the local library that are related to a paper or a topic.
+
+Ranks the downloaded papers by TF-IDF similarity of their abstracts and full
+text to the given paper (by arXiv ID, downloaded or not) or to free text. Runs
+locally without querying arXiv, so use it first when looking for context papers;
+use search_papers only to discover papers that are not in the library yet.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "paper_id": {
+                "type": "string",
+                "description": "arXiv ID of the paper to find related papers for.",
+            },
+            "text": {
+                "type": "string",
+                "description": "Free text (e.g. a topic description or an abstract) to match instead of a paper.",
+            },
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of papers to return (default: 10).",
+            },
+        },
+    },
+)
+
+
+def _rank(
+    index: SimilarityIndex,
+    query: Optional[np.ndarray],
+    text: Optional[str],
+    limit: int,
+    exclude: List[str],
+) -> List[Tuple[str, float]]:
+    """Rank the library against a stored vector or free text."""
+    if query is None:
+        query = index.vectorize(text)
+    return index.similar(query, limit, exclude=exclude)
+
+
+async def handle_related_papers(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle requests for papers related to a paper or free text."""
+    try:
+        paper_id = arguments.get("paper_id")
+        text = arguments.get("text")
+        if not paper_id and not text:
+            return [
+                types.TextContent(
+                    type="text", text="Error: Provide either paper_id or text"
+                )
+            ]
+        max_results = min(int(arguments.get("max_results", 10)), settings.MAX_RESULTS)
+
+        # Loads the index and picks up papers converted before it existed, on
+        # the first query
+        await asyncio.to_thread(sync_similarity_index)
+        index = get_similarity_index()
+
+        query = None
+        if paper_id:
+            query = await asyncio.to_thread(index.vector_of, paper_id)
+            if query is None:
+                # Not downloaded: match on its title and abstract instead
+                papers = await get_metadata_store().get_or_fetch(
+                    get_arxiv_client(), [paper_id]
+                )
+                paper = papers.get(paper_id)
+                if paper is None:
+                    return [
+                        types.TextContent(
+                            type="text",
+                            text=f"Error: Paper {paper_id} not found on arXiv",
+                        )
+                    ]
+                text = f"{paper.title}\n{paper.summary}"
+
+        exclude = [paper_id] if paper_id else []
+        ranked = await asyncio.to_thread(
+            _rank, index, query, text, max_results, exclude
+        )
+        known = await asyncio.to_thread(
+            get_metadata_store().get_many, [pid for pid, _ in ranked]
+        )
+
+        response_data = {
+            "total_results": len(ranked),
+            "papers": [
+                {
+                    "id": pid,
+                    "title": known[pid].title if pid in known else None,
+                    "score": score,
+                    "resource_uri": f"arxiv://{pid}",
+                }
+                for pid, score in ranked
+            ],
+        }
+        logger.info(f"Found {len(ranked)} related papers in the local library")
+        return [
+            types.TextContent(type="text", text=json.dumps(response_data, indent=2))
+        ]
+
+    except Exception as e:
+        logger.error(f"Related papers error: {e}")
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
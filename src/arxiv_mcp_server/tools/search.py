@@ -1,40 +1,62 @@
 """Search functionality for the arXiv MCP server."""
 
 import arxiv
+import asyncio
+import base64
 import json
 import logging
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Any, List, Optional
 from datetime import datetime, timezone
 from dateutil import parser
 import mcp.types as types
 from ..config import Settings
+from ..cache import ResultCache
+from ..metadata_store import get_metadata_store
+from ..output import OutputOptions, output_properties
+from ..planner import reciprocal_rank_fusion, split_or_query
+from ..prefetch import get_prefetcher
+from ..query import parse_query
+from ..taxonomy import expand_categories
+from ..clients import ArxivClient, Paper, Priority, get_arxiv_client
 
 logger = logging.getLogger("arxiv-mcp-server")
 settings = Settings()
 
-# Valid arXiv category prefixes for validation
-VALID_CATEGORIES = {
-    "cs",
-    "econ",
-    "eess",
-    "math",
-    "physics",
-    "q-bio",
-    "q-fin",
-    "stat",
-    "astro-ph",
-    "cond-mat",
-    "gr-qc",
-    "hep-ex",
-    "hep-lat",
-    "hep-ph",
-    "hep-th",
-    "math-ph",
-    "nlin",
-    "nucl-ex",
-    "nucl-th",
-    "quant-ph",
-}
+# Receives (progress, total, message) for each streamed page of results
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+# Receives (page number, papers, papers so far, max results) for each page
+PageCallback = Callable[[int, List[Dict[str, Any]], int, int], Awaitable[None]]
+
+# Keys of each paper in search results, in output order
+SEARCH_FIELDS = [
+    "id",
+    "title",
+    "authors",
+    "abstract",
+    "categories",
+    "published",
+    "url",
+    "resource_uri",
+]
+
+# Search arguments carried over to later pages by a cursor
+_SEARCH_ARGUMENTS = (
+    "query",
+    "max_results",
+    "date_from",
+    "date_to",
+    "categories",
+    "sort_by",
+    "split_or",
+)
+
+# Bumped when the cursor layout changes, invalidating older cursors
+_CURSOR_VERSION = 1
+
+# Default used to resolve date_to values without a time to the end of that day
+_END_OF_DAY = datetime(2000, 1, 1, 23, 59, 59)
 
 search_tool = types.Tool(
     name="search_papers",
@@ -84,13 +106,22 @@ This ensures you get the most pertinent results regardless of publication date.
 TIPS FOR FOUNDATIONAL RESEARCH:
 - Use date_to: "2010-12-31" to find classic papers on BDI, SOAR, ACT-R
 - Combine with field searches: ti:"BDI" AND abs:"belief desire intention"  
-- Try author searches: au:"Rao" AND "BDI" for Anand Rao's foundational BDI work""",
+- Try author searches: au:"Rao" AND "BDI" for Anand Rao's foundational BDI work
+
+OUTPUT SIZE: For long result lists, request only the fields you need (e.g. fields: ["id", "title"]),
+cap abstracts with abstract_chars, and use format: "compact".
+
+MANY ALTERNATIVES: For queries like "A" OR "B" OR "C" OR "D", set split_or: true to search each
+alternative concurrently and merge the rankings.
+
+PAGINATION: max_results is capped at 50 per call. When more results exist the response includes
+next_cursor; pass it as cursor to get the next page (and prev_cursor to go back).""",
     inputSchema={
         "type": "object",
         "properties": {
             "query": {
                 "type": "string",
-                "description": 'Search query using quoted phrases for exact matches (e.g., \'"machine learning" OR "deep learning"\') or specific technical terms. Avoid overly broad or generic terms.',
+                "description": 'Required unless cursor is given. Search query using quoted phrases for exact matches (e.g., \'"machine learning" OR "deep learning"\') or specific technical terms. Avoid overly broad or generic terms.',
             },
             "max_results": {
                 "type": "integer",
@@ -107,32 +138,27 @@ TIPS FOR FOUNDATIONAL RESEARCH:
             "categories": {
                 "type": "array",
                 "items": {"type": "string"},
-                "description": "Strongly recommended: arXiv categories to focus search (e.g., ['cs.AI', 'cs.MA'] for agent research, ['cs.LG'] for ML, ['cs.CL'] for NLP, ['cs.CV'] for vision). Greatly improves relevance.",
+                "description": "Strongly recommended: arXiv categories to focus search (e.g., ['cs.AI', 'cs.MA'] for agent research, ['cs.LG'] for ML, ['cs.CL'] for NLP, ['cs.CV'] for vision). Greatly improves relevance. Whole archives ('cs' or 'cs.*') and the 'physics' group (all physics archives) are accepted.",
             },
             "sort_by": {
                 "type": "string",
                 "enum": ["relevance", "date"],
                 "description": "Sort results by 'relevance' (most relevant first, default) or 'date' (newest first). Use 'relevance' for focused searches, 'date' for recent developments.",
             },
+            "split_or": {
+                "type": "boolean",
+                "description": "Run the top-level OR alternatives of the query as separate concurrent searches and merge them by rank. Faster and better ranked for queries with many alternatives; returns a single page without next_cursor.",
+            },
+            "cursor": {
+                "type": "string",
+                "description": "next_cursor or prev_cursor from an earlier search_papers response, to fetch the following or preceding page of the same search. Other search arguments are taken from the cursor; max_results may be changed.",
+            },
+            **output_properties(SEARCH_FIELDS, "abstract"),
         },
-        "required": ["query"],
     },
 )
 
 
-def _validate_categories(categories: List[str]) -> bool:
-    """Validate that all provided categories are valid arXiv categories."""
-    for category in categories:
-        if "." in category:
-            prefix = category.split(".")[0]
-        else:
-            prefix = category
-        if prefix not in VALID_CATEGORIES:
-            logger.warning(f"Unknown category prefix: {prefix}")
-            return False
-    return True
-
-
 def _optimize_query(query: str) -> str:
     """Minimal query optimization - preserve user intent while fixing obvious issues."""
 
@@ -177,13 +203,88 @@ def _build_date_filter(date_from: str = None, date_to: str = None) -> str:
         else:
             end_date = datetime.now().strftime("%Y%m%d2359")
 
-        return f"submittedDate:[{start_date}+TO+{end_date}]"
+        return f"submittedDate:[{start_date} TO {end_date}]"
     except (ValueError, TypeError) as e:
         logger.error(f"Error parsing dates: {e}")
         raise ValueError(f"Invalid date format. Use YYYY-MM-DD format: {e}")
 
 
-def _process_paper(paper: arxiv.Result) -> Dict[str, Any]:
+_search_cache: Optional[ResultCache] = None
+
+
+def get_search_cache() -> ResultCache:
+    """Return the process-wide search result cache."""
+    global _search_cache
+    if _search_cache is None:
+        persist_dir = None
+        if settings.SEARCH_CACHE_PERSIST:
+            persist_dir = Path(settings.STORAGE_PATH) / ".cache" / "search"
+        _search_cache = ResultCache(
+            max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+            max_bytes=settings.SEARCH_CACHE_MAX_BYTES,
+            ttl=settings.SEARCH_CACHE_TTL,
+            persist_dir=persist_dir,
+        )
+    return _search_cache
+
+
+def _search_cache_key(
+    arguments: Dict[str, Any],
+    max_results: int,
+    offset: int = 0,
+    arxiv_query: Optional[str] = None,
+) -> str:
+    """Build a canonical cache key from the search arguments.
+
+    Later pages are keyed by the arXiv query they were fetched with as well,
+    since a search may fall back to a different query than it started with.
+    """
+
+    def _normalize_date(value: Optional[str]) -> Optional[str]:
+        return parser.parse(value).date().isoformat() if value else None
+
+    return json.dumps(
+        [
+            " ".join(arguments["query"].split()),
+            sorted(set(arguments.get("categories") or [])),
+            _normalize_date(arguments.get("date_from")),
+            _normalize_date(arguments.get("date_to")),
+            "date" if arguments.get("sort_by") == "date" else "relevance",
+            max_results,
+            offset,
+            arxiv_query if offset else None,
+            bool(arguments.get("split_or", settings.SEARCH_SPLIT_OR)),
+        ]
+    )
+
+
+def _encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode pagination state as an opaque URL-safe token."""
+    payload = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a token made by ``_encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if state.get("v") != _CURSOR_VERSION or not isinstance(state["args"], dict):
+            raise ValueError("unsupported version")
+        if not isinstance(state["args"].get("query"), str):
+            raise ValueError("missing query")
+        if not isinstance(state["offset"], int) or state["offset"] < 0:
+            raise ValueError("bad offset")
+        return state
+    except (ValueError, KeyError, TypeError, AttributeError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def _process_paper(paper: Paper) -> Dict[str, Any]:
     """Process paper information with resource URI."""
     return {
         "id": paper.get_short_id(),
@@ -197,133 +298,436 @@ def _process_paper(paper: arxiv.Result) -> Dict[str, Any]:
     }
 
 
-async def handle_search(arguments: Dict[str, Any]) -> List[types.TextContent]:
-    """Handle paper search requests with improved arXiv API integration."""
-    try:
-        client = arxiv.Client()
-        max_results = min(int(arguments.get("max_results", 10)), settings.MAX_RESULTS)
-        base_query = arguments["query"]
-
-        logger.debug(
-            f"Starting search with query: '{base_query}', max_results: {max_results}"
-        )
-
-        # Build query components
-        query_parts = []
-
-        # Add base query with optimization
-        if base_query.strip():
-            optimized_query = _optimize_query(base_query)
-            query_parts.append(f"({optimized_query})")
-            if optimized_query != base_query:
-                logger.debug(f"Optimized query: '{base_query}' -> '{optimized_query}'")
-
-        # Add category filtering
-        if categories := arguments.get("categories"):
-            if not _validate_categories(categories):
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: Invalid category provided. Please check arXiv category names.",
-                    )
-                ]
-            category_filter = " OR ".join(f"cat:{cat}" for cat in categories)
-            query_parts.append(f"({category_filter})")
-            logger.debug(f"Added category filter: {category_filter}")
-
-        # Add date filtering using arXiv API syntax
-        # Temporarily disable server-side date filtering due to API issues
-        # Will filter client-side for now
-        date_from_arg = arguments.get("date_from")
-        date_to_arg = arguments.get("date_to")
-        if date_from_arg or date_to_arg:
-            logger.debug(f"Date filtering requested: {date_from_arg} to {date_to_arg}")
-            # We'll handle this client-side after getting results
-
-        # Combine query parts
-        if not query_parts:
-            return [
-                types.TextContent(
-                    type="text", text="Error: No search criteria provided"
-                )
-            ]
-
-        # Combine query parts - arXiv uses space for AND by default
-        final_query = " ".join(query_parts)
-        logger.debug(f"Final arXiv query: {final_query}")
-
-        # Increase max_results slightly to account for any edge cases
-        # but cap it to avoid overwhelming the API
-        api_max_results = min(max_results + 5, settings.MAX_RESULTS)
-
-        # Determine sort method
-        sort_by_arg = arguments.get("sort_by", "relevance")
-        if sort_by_arg == "date":
-            sort_criterion = arxiv.SortCriterion.SubmittedDate
-            logger.debug("Using date sorting (newest first)")
-        else:
-            sort_criterion = arxiv.SortCriterion.Relevance
-            logger.debug("Using relevance sorting (most relevant first)")
-
-        search = arxiv.Search(
-            query=final_query,
-            max_results=api_max_results,
-            sort_by=sort_criterion,
-        )
-
-        # Process results with client-side date filtering
-        results = []
-        result_count = 0
-
-        # Parse date filters if provided
-        date_from_parsed = None
-        date_to_parsed = None
-        if date_from_arg:
-            try:
-                date_from_parsed = parser.parse(date_from_arg).replace(
-                    tzinfo=timezone.utc
-                )
-            except (ValueError, TypeError) as e:
-                return [
-                    types.TextContent(
-                        type="text", text=f"Error: Invalid date_from format - {str(e)}"
-                    )
-                ]
-
-        if date_to_arg:
-            try:
-                date_to_parsed = parser.parse(date_to_arg).replace(tzinfo=timezone.utc)
-            except (ValueError, TypeError) as e:
-                return [
-                    types.TextContent(
-                        type="text", text=f"Error: Invalid date_to format - {str(e)}"
-                    )
-                ]
-
-        for paper in client.results(search):
-            if result_count >= max_results:
-                break
-
+async def _collect_results(
+    client: ArxivClient,
+    search: arxiv.Search,
+    max_results: int,
+    page_size: int,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    on_page: Optional[PageCallback] = None,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """Collect up to ``max_results`` papers within the requested date range.
+
+    When client-side date filtering drops entries, further pages are fetched
+    until enough papers are found or the page budget is exhausted. If an
+    ``on_page`` callback is given, the papers of each parsed page are passed
+    to it as soon as the page arrives.
+
+    Returns:
+        Dict[str, Any]: The processed ``papers``, the arXiv ``start`` offset
+        to resume from as ``next_offset`` (None once the result set is
+        exhausted) and the number of matches reported by arXiv as
+        ``total_available``.
+    """
+    max_pages = settings.SEARCH_MAX_PAGES if date_from or date_to else 1
+    first_page_size = None
+    if on_page is not None:
+        first_page_size = min(settings.SEARCH_STREAM_FIRST_PAGE_SIZE, page_size)
+        max_pages += 1
+
+    results = []
+    page_number = 0
+    next_offset = None
+    total_available = None
+    async for page in client.pages(
+        search,
+        offset=offset,
+        priority=Priority.INTERACTIVE,
+        page_size=page_size,
+        max_pages=max_pages,
+        first_page_size=first_page_size,
+    ):
+        page_number += 1
+        total_available = page.total_results
+        next_offset = page.end
+        await asyncio.to_thread(get_metadata_store().safe_upsert_many, page)
+        page_results = []
+        for index, paper in enumerate(page):
             # Apply client-side date filtering
             paper_date = paper.published
             if not paper_date.tzinfo:
                 paper_date = paper_date.replace(tzinfo=timezone.utc)
 
-            if date_from_parsed and paper_date < date_from_parsed:
+            if date_from and paper_date < date_from:
                 continue
-            if date_to_parsed and paper_date > date_to_parsed:
+            if date_to and paper_date > date_to:
                 continue
 
-            results.append(_process_paper(paper))
-            result_count += 1
+            page_results.append(_process_paper(paper))
+            if len(results) + len(page_results) >= max_results:
+                if index + 1 < len(page):
+                    # Resume right after the last returned paper
+                    next_offset = page.start + index + 1
+                break
 
-        logger.info(f"Search completed: {len(results)} results returned")
-        response_data = {"total_results": len(results), "papers": results}
+        results.extend(page_results)
+        if on_page is not None and page_results:
+            await on_page(page_number, page_results, len(results), max_results)
+        if len(results) >= max_results:
+            break
 
-        return [
-            types.TextContent(type="text", text=json.dumps(response_data, indent=2))
-        ]
+    if total_available is not None and next_offset >= total_available:
+        next_offset = None
+    return {
+        "papers": results,
+        "next_offset": next_offset,
+        "total_available": total_available,
+    }
+
+
+async def _run_local_search(
+    arguments: Dict[str, Any],
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+    max_results: int,
+    on_page: Optional[PageCallback] = None,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """Answer a search from the local metadata store.
+
+    In ``local_first`` mode, queries the local engine cannot evaluate return
+    no results so that the caller falls back to arXiv.
+
+    Returns:
+        Dict[str, Any]: A result page shaped like those of ``_search_page``.
+
+    Raises:
+        ValueError: If the query is invalid and the server is offline.
+    """
+    page = {
+        "papers": [],
+        "next_offset": None,
+        "total_available": None,
+        "source": "local",
+        "arxiv_query": None,
+    }
+    try:
+        # The store may hold a whole metadata snapshot; search off the loop
+        papers = await asyncio.to_thread(
+            get_metadata_store().search,
+            parse_query(arguments["query"]),
+            categories=arguments.get("categories"),
+            date_from=date_from,
+            date_to=date_to,
+            sort_by=arguments.get("sort_by", "relevance"),
+            limit=max_results,
+            offset=offset,
+        )
+    except ValueError as e:
+        if settings.SEARCH_MODE == "offline":
+            raise
+        logger.info(f"Local search not possible: {e}")
+        return page
+
+    results = [_process_paper(paper) for paper in papers]
+    logger.info(f"Local search returned {len(results)} results")
+    if on_page is not None and results:
+        await on_page(1, results, len(results), max_results)
+    page["papers"] = results
+    if len(results) == max_results:
+        page["next_offset"] = offset + len(results)
+    return page
+
+
+async def _search_page(
+    arguments: Dict[str, Any],
+    on_page: Optional[PageCallback] = None,
+    offset: int = 0,
+    source: Optional[str] = None,
+    arxiv_query: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run one search and return a page of processed papers.
+
+    A first page (no ``source``) is looked up locally and/or on arXiv as
+    configured by ``SEARCH_MODE``. Later pages continue in the same
+    ``source`` at ``offset``, reusing the arXiv query of the first page.
+
+    Returns:
+        Dict[str, Any]: ``papers``, ``next_offset`` (None when there are no
+        more results), ``total_available`` (None if unknown), ``source``
+        (``local`` or ``arxiv``) and the ``arxiv_query`` that was run.
+
+    Raises:
+        ValueError: If the search arguments are invalid.
+        arxiv.ArxivError: If the arXiv API request fails.
+    """
+    client = get_arxiv_client()
+    max_results = min(int(arguments.get("max_results", 10)), settings.MAX_RESULTS)
+    base_query = arguments["query"]
+
+    logger.debug(
+        f"Starting search with query: '{base_query}', max_results: {max_results}"
+    )
+
+    # Build query components
+    query_parts = []
+
+    # Add base query with optimization
+    if base_query.strip():
+        optimized_query = _optimize_query(base_query)
+        query_parts.append(f"({optimized_query})")
+        if optimized_query != base_query:
+            logger.debug(f"Optimized query: '{base_query}' -> '{optimized_query}'")
+
+    # Add category filtering
+    if categories := arguments.get("categories"):
+        # Checked locally to spare a round trip that would return nothing
+        categories = expand_categories(categories)
+        arguments = {**arguments, "categories": categories}
+        category_filter = " OR ".join(f"cat:{cat}" for cat in categories)
+        query_parts.append(f"({category_filter})")
+        logger.debug(f"Added category filter: {category_filter}")
+
+    # Validate dates up front. They are sent to arXiv as a submittedDate
+    # filter and re-checked client-side in case the two disagree.
+    date_from_arg = arguments.get("date_from")
+    date_to_arg = arguments.get("date_to")
+    date_from_parsed = None
+    date_to_parsed = None
+    if date_from_arg:
+        try:
+            date_from_parsed = parser.parse(date_from_arg).replace(tzinfo=timezone.utc)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid date_from format - {str(e)}")
+
+    if date_to_arg:
+        try:
+            # Missing time components default to the end of the day
+            date_to_parsed = parser.parse(date_to_arg, default=_END_OF_DAY).replace(
+                tzinfo=timezone.utc
+            )
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid date_to format - {str(e)}")
+
+    date_filter = _build_date_filter(date_from_arg, date_to_arg)
+    if date_filter:
+        logger.debug(f"Date filtering requested: {date_filter}")
+
+    # Combine query parts
+    if not query_parts and not date_filter:
+        raise ValueError("No search criteria provided")
+
+    # Combine query parts with explicit AND
+    final_query = " AND ".join(query_parts)
+    logger.debug(f"Final arXiv query: {final_query}")
+
+    # Request slightly more than needed to absorb entries dropped by
+    # client-side filtering, but cap it to avoid overwhelming the API
+    page_size = min(max_results + 5, settings.MAX_RESULTS)
+
+    # Determine sort method
+    sort_by_arg = arguments.get("sort_by", "relevance")
+    if sort_by_arg == "date":
+        sort_criterion = arxiv.SortCriterion.SubmittedDate
+        logger.debug("Using date sorting (newest first)")
+    else:
+        sort_criterion = arxiv.SortCriterion.Relevance
+        logger.debug("Using relevance sorting (most relevant first)")
+
+    if source == "local" or (source is None and settings.SEARCH_MODE != "remote"):
+        page = await _run_local_search(
+            arguments, date_from_parsed, date_to_parsed, max_results, on_page, offset
+        )
+        if page["papers"] or source == "local" or settings.SEARCH_MODE == "offline":
+            return page
+        logger.info("No local results; falling back to arXiv")
+
+    cache = get_search_cache()
+    cache_key = _search_cache_key(arguments, max_results, offset, arxiv_query)
+    if (cached := cache.get(cache_key)) is not None:
+        logger.debug(f"Search cache hit: {cache.stats()}")
+        if on_page is not None and cached["papers"]:
+            # Stream cached results like freshly fetched ones
+            papers = cached["papers"]
+            await on_page(1, papers, len(papers), max_results)
+        return cached
+
+    split_or = arguments.get("split_or", settings.SEARCH_SPLIT_OR)
+    if split_or and offset == 0 and arxiv_query is None and base_query.strip():
+        sub_queries = split_or_query(optimized_query, settings.SEARCH_SPLIT_MAX_QUERIES)
+        if sub_queries:
+            page = await _run_split_search(arguments, sub_queries, max_results, on_page)
+            cache.set(cache_key, page)
+            return page
+
+    async def collect(query: str) -> Dict[str, Any]:
+        page = await _collect_results(
+            client,
+            arxiv.Search(query=query, max_results=None, sort_by=sort_criterion),
+            max_results,
+            page_size,
+            date_from_parsed,
+            date_to_parsed,
+            on_page,
+            offset,
+        )
+        page.update(source="arxiv", arxiv_query=query)
+        return page
+
+    page = None
+    if arxiv_query is not None:
+        # Continue with the query that produced the previous pages
+        page = await collect(arxiv_query)
+    elif date_filter:
+        try:
+            page = await collect(" AND ".join(query_parts + [date_filter]))
+        except arxiv.ArxivError as e:
+            if not query_parts:
+                raise
+            logger.warning(
+                f"Server-side date filter failed: {e}; "
+                "falling back to client-side date filtering"
+            )
+    if page is None:
+        page = await collect(final_query)
+
+    # Later pages are only kept long enough to page back and forth
+    cache.set(cache_key, page, ttl=settings.SEARCH_PAGE_TTL if offset else None)
+    logger.info(f"Search completed: {len(page['papers'])} results returned")
+    return page
+
+
+async def _run_split_search(
+    arguments: Dict[str, Any],
+    sub_queries: List[str],
+    max_results: int,
+    on_page: Optional[PageCallback] = None,
+) -> Dict[str, Any]:
+    """Run the alternatives of an OR query concurrently and fuse the rankings.
+
+    Each sub-query is an ordinary cached search with the same filters, so
+    alternatives shared with earlier searches are not fetched again. Failed
+    sub-queries are left out unless all of them fail.
+    """
+    logger.info(f"Splitting query into {len(sub_queries)} concurrent sub-queries")
+    outcomes = await asyncio.gather(
+        *(
+            _search_page(
+                {**arguments, "query": query, "split_or": False}, source="arxiv"
+            )
+            for query in sub_queries
+        ),
+        return_exceptions=True,
+    )
+    rankings, errors = [], []
+    for query, outcome in zip(sub_queries, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(f"Sub-query '{query}' failed: {outcome}")
+            errors.append(outcome)
+        else:
+            rankings.append(outcome["papers"])
+    if not rankings:
+        raise errors[0]
+
+    papers = reciprocal_rank_fusion(rankings, max_results)
+    if on_page is not None and papers:
+        await on_page(1, papers, len(papers), max_results)
+    # Fused results have no single arXiv offset to continue from
+    return {
+        "papers": papers,
+        "next_offset": None,
+        "total_available": None,
+        "source": "arxiv",
+        "arxiv_query": None,
+    }
+
+
+async def _run_search(
+    arguments: Dict[str, Any], on_page: Optional[PageCallback] = None
+) -> List[Dict[str, Any]]:
+    """Run one search and return the processed papers of its first page.
+
+    Raises:
+        ValueError: If the search arguments are invalid.
+        arxiv.ArxivError: If the arXiv API request fails.
+    """
+    page = await _search_page(arguments, on_page)
+    return page["papers"]
+
+
+def _progress_reporter(
+    progress: Optional[ProgressCallback], output: OutputOptions
+) -> Optional[PageCallback]:
+    """Send each page of results as a progress message shaped like the response."""
+    if progress is None:
+        return None
 
+    async def on_page(
+        page_number: int, papers: List[Dict[str, Any]], done: int, total: int
+    ) -> None:
+        message = output.render({"page": page_number, "papers": papers})
+        await progress(done, total, message)
+
+    return on_page
+
+
+async def handle_search(
+    arguments: Dict[str, Any], progress: Optional[ProgressCallback] = None
+) -> List[types.TextContent]:
+    """Handle paper search requests with improved arXiv API integration.
+
+    If ``progress`` is given, results are streamed page by page through it,
+    shaped by the same output arguments, before the complete response is
+    returned. When more results are available, the response carries a
+    ``next_cursor`` that continues the search in a follow-up call, and pages
+    after the first a ``prev_cursor``.
+    """
+    try:
+        output = OutputOptions(arguments, SEARCH_FIELDS, "abstract")
+        offset, source, arxiv_query, starts = 0, None, None, []
+        if arguments.get("cursor"):
+            state = _decode_cursor(arguments["cursor"])
+            search_args = dict(state["args"])
+            if (
+                arguments.get("query")
+                and arguments["query"].split() != search_args["query"].split()
+            ):
+                raise ValueError("The cursor belongs to a different query")
+            if "max_results" in arguments:
+                search_args["max_results"] = arguments["max_results"]
+            offset, source = state["offset"], state.get("source")
+            arxiv_query, starts = state.get("arxiv_query"), state.get("starts", [])
+        elif "query" in arguments:
+            search_args = {
+                key: arguments[key] for key in _SEARCH_ARGUMENTS if key in arguments
+            }
+        else:
+            raise ValueError("Either query or cursor is required")
+
+        on_page = _progress_reporter(progress, output)
+        page = await _search_page(search_args, on_page, offset, source, arxiv_query)
+        if settings.PREFETCH_ENABLED:
+            # Likely next downloads are fetched while the agent reads results
+            get_prefetcher().schedule(paper["id"] for paper in page["papers"])
+        response_data = {"total_results": len(page["papers"]), "papers": page["papers"]}
+        if page["total_available"] is not None:
+            response_data["total_available"] = page["total_available"]
+
+        def cursor(position: int, previous: List[int]) -> str:
+            return _encode_cursor(
+                {
+                    "v": _CURSOR_VERSION,
+                    "args": search_args,
+                    "source": page["source"],
+                    "arxiv_query": page["arxiv_query"],
+                    "offset": position,
+                    "starts": previous,
+                }
+            )
+
+        if page["next_offset"] is not None:
+            response_data["next_cursor"] = cursor(
+                page["next_offset"], starts + [offset]
+            )
+        if starts:
+            response_data["prev_cursor"] = cursor(starts[-1], starts[:-1])
+
+        return [types.TextContent(type="text", text=output.render(response_data))]
+
+    except ValueError as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
     except arxiv.ArxivError as e:
         logger.error(f"ArXiv API error: {e}")
         return [
@@ -0,0 +1,80 @@
+"""Full-text search over downloaded papers for the arXiv MCP server."""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Any, List
+import mcp.types as types
+from ..config import Settings
+from ..fulltext import get_fulltext_index, sync_fulltext_index
+from ..metadata_store import get_metadata_store
+
+logger = logging.getLogger("arxiv-mcp-server")
+settings = Settings()
+
+search_local_tool = types.Tool(
+    name="search_local",
+    description="""Search the full text of papers that have already been downloaded.
+
+Runs entirely offline against a BM25 index of the converted papers, so it is the
+fastest way to find which stored papers discuss a method, dataset or result.
+Returns paper IDs ranked by relevance, each with highlighted passages (matches
+wrapped in **) and the section they come from. Use read_paper to open a hit.
+
+Query syntax: plain terms and "quoted phrases", combined with AND (default),
+OR and ANDNOT, with parentheses for grouping.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Terms or phrases to look for, e.g. '\"contrastive loss\" AND imagenet'.",
+            },
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of papers to return (default: 10).",
+            },
+        },
+        "required": ["query"],
+    },
+)
+
+
+async def handle_search_local(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle full-text search requests over stored papers."""
+    try:
+        query = arguments["query"]
+        max_results = min(int(arguments.get("max_results", 10)), settings.MAX_RESULTS)
+
+        # Picks up papers converted before indexing existed, on the first query
+        # unless the server's startup sync got there first
+        await asyncio.to_thread(sync_fulltext_index)
+        hits = await asyncio.to_thread(get_fulltext_index().search, query, max_results)
+
+        known = await asyncio.to_thread(
+            get_metadata_store().get_many, [hit.paper_id for hit in hits]
+        )
+        papers = []
+        for hit in hits:
+            paper = known.get(hit.paper_id)
+            papers.append(
+                {
+                    "id": hit.paper_id,
+                    "title": paper.title if paper else None,
+                    "score": hit.score,
+                    "snippets": hit.snippets,
+                    "resource_uri": f"arxiv://{hit.paper_id}",
+                }
+            )
+
+        logger.info(f"Local full-text search returned {len(papers)} papers")
+        response_data = {"total_results": len(papers), "papers": papers}
+        return [
+            types.TextContent(type="text", text=json.dumps(response_data, indent=2))
+        ]
+
+    except ValueError as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+    except Exception as e:
+        logger.error(f"Unexpected local search error: {e}")
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
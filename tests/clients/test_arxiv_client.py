@@ -0,0 +1,203 @@
+"""Tests for the asynchronous arXiv API client."""
+
+import asyncio
+import arxiv
+import httpx
+import pytest
+from arxiv_mcp_server.clients import ArxivClient, RateLimiter
+
+
+def _make_client(handler, **kwargs) -> ArxivClient:
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    limiter = RateLimiter(rate=1000, burst=1000)
+    return ArxivClient(session=session, rate_limiter=limiter, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_results_paginates(atom_feed):
+    """Test that results are fetched page by page until max_results."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        start = int(request.url.params["start"])
+        size = int(request.url.params["max_results"])
+        return httpx.Response(200, content=atom_feed(start, size, total=25))
+
+    client = _make_client(handler, page_size=10)
+    search = arxiv.Search(query="test", max_results=25)
+    papers = [paper async for paper in client.results(search)]
+
+    assert len(papers) == 25
+    assert papers[0].get_short_id() == "2301.00000v1"
+    assert [int(r.url.params["start"]) for r in requests] == [0, 10, 20]
+    assert requests[0].url.params["search_query"] == "test"
+
+
+@pytest.mark.asyncio
+async def test_get_paper_not_found(atom_feed):
+    """Test that an empty feed for an ID lookup yields None."""
+    client = _make_client(
+        lambda request: httpx.Response(200, content=atom_feed(0, 0, total=0))
+    )
+    assert await client.get_paper("invalid.12345") is None
+
+
+@pytest.mark.asyncio
+async def test_http_error_is_retried(atom_feed):
+    """Test that HTTP errors are retried and eventually raised."""
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    client = _make_client(handler, num_retries=2)
+    with pytest.raises(arxiv.HTTPError):
+        await client.get_paper("2301.00001")
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_overlap(atom_feed):
+    """Test that slow requests do not block the event loop."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, content=atom_feed(0, 1, total=1))
+
+    client = _make_client(handler)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await asyncio.gather(*(client.get_paper("2301.00000") for _ in range(5)))
+
+    assert all(paper is not None for paper in results)
+    assert loop.time() - started < 0.8
+
+
+@pytest.mark.asyncio
+async def test_download_pdf(mock_paper, temp_storage_path):
+    """Test that PDFs are fetched from the export mirror and written to disk."""
+    urls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        urls.append(str(request.url))
+        # An unread stream, as the download is read raw off the wire
+        return httpx.Response(200, stream=httpx.ByteStream(b"%PDF-1.4 test"))
+
+    client = _make_client(handler)
+    path = await client.download_pdf(mock_paper, temp_storage_path / "paper.pdf")
+
+    assert path.read_bytes() == b"%PDF-1.4 test"
+    assert urls == ["https://export.arxiv.org/pdf/2103.12345"]
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_streams_with_progress(mock_paper, temp_storage_path):
+    """Test that PDFs are streamed to a part file and reported chunkwise."""
+    content = b"%PDF-1.4 " + b"x" * 200_000
+    updates = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            stream=httpx.ByteStream(content),
+            headers={"Content-Length": str(len(content))},
+        )
+
+    client = _make_client(handler)
+    path = temp_storage_path / "paper.pdf"
+    await client.download_pdf(
+        mock_paper, path, progress=lambda received, total: updates.append(received)
+    )
+
+    assert path.read_bytes() == content
+    assert not (temp_storage_path / "paper.pdf.part").exists()
+    assert updates[0] == 0 and updates[-1] == len(content)
+    assert updates == sorted(updates)
+
+
+@pytest.mark.asyncio
+async def test_failed_download_leaves_no_file(mock_paper, temp_storage_path):
+    """Test that a failed transfer removes its temporary file."""
+    client = _make_client(lambda request: httpx.Response(404))
+    path = temp_storage_path / "paper.pdf"
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.download_pdf(mock_paper, path)
+    assert list(temp_storage_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_coalesced(atom_feed):
+    """Test that concurrent identical lookups share one HTTP request."""
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=atom_feed(0, 1, total=1))
+
+    client = _make_client(handler)
+    results = await asyncio.gather(*(client.get_paper("2301.00000") for _ in range(3)))
+
+    assert calls == 1
+    assert all(paper.get_short_id() == "2301.00000v1" for paper in results)
+
+
+@pytest.mark.asyncio
+async def test_results_respects_page_budget(atom_feed):
+    """Test that no more than max_pages pages are requested."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        start = int(request.url.params["start"])
+        return httpx.Response(200, content=atom_feed(start, 5, total=100))
+
+    client = _make_client(handler)
+    search = arxiv.Search(query="test", max_results=None)
+    papers = [p async for p in client.results(search, page_size=5, max_pages=2)]
+
+    assert len(papers) == 10
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_pages_with_small_first_page(atom_feed):
+    """Test that the first page can be smaller than the following ones."""
+    sizes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        size = int(request.url.params["max_results"])
+        sizes.append(size)
+        return httpx.Response(200, content=atom_feed(start, size, total=30))
+
+    client = _make_client(handler)
+    search = arxiv.Search(query="test", max_results=30)
+    pages = [
+        len(page)
+        async for page in client.pages(search, page_size=20, first_page_size=5)
+    ]
+
+    assert sizes == [5, 20, 5]
+    assert pages == [5, 20, 5]
+
+
+@pytest.mark.asyncio
+async def test_malformed_feed_is_retried(atom_feed):
+    """Test that a truncated feed is retried and surfaced as an arXiv error."""
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, content=atom_feed(0, 2, total=2)[:300])
+
+    client = _make_client(handler, num_retries=1)
+    with pytest.raises(arxiv.ArxivError):
+        await client.get_paper("2301.00001")
+    assert calls == 2
@@ -0,0 +1,77 @@
+"""Tests for the streaming Atom feed parser."""
+
+from pathlib import Path
+
+import arxiv
+import feedparser
+import pytest
+from arxiv_mcp_server.clients.atom import AtomFeedParser, parse_feed
+
+FEED_PATH = Path(__file__).parent.parent / "fixtures" / "arxiv_feed.xml"
+
+
+@pytest.fixture
+def feed_bytes():
+    return FEED_PATH.read_bytes()
+
+
+def test_matches_arxiv_library(feed_bytes):
+    """Test that parsed papers agree with arxiv.Result on every used field."""
+    expected = [
+        arxiv.Result._from_feed_entry(entry)
+        for entry in feedparser.parse(feed_bytes).entries
+    ]
+    page = parse_feed(feed_bytes)
+
+    assert len(page.entries) == len(expected) == 50
+    for paper, result in zip(page.entries, expected):
+        assert paper.get_short_id() == result.get_short_id()
+        for field in (
+            "entry_id",
+            "title",
+            "summary",
+            "published",
+            "updated",
+            "categories",
+            "primary_category",
+            "pdf_url",
+            "comment",
+            "journal_ref",
+            "doi",
+        ):
+            assert getattr(paper, field) == getattr(result, field), field
+        assert [a.name for a in paper.authors] == [a.name for a in result.authors]
+        assert [(l.href, l.title, l.rel) for l in paper.links] == [
+            (l.href, l.title, l.rel) for l in result.links
+        ]
+
+
+def test_feed_metadata(feed_bytes):
+    """Test that OpenSearch counters are read from the feed header."""
+    page = parse_feed(feed_bytes)
+    assert page.total_results == 21873
+    assert page.start_index == 0
+    assert page.items_per_page == 50
+
+
+def test_incremental_chunks(feed_bytes):
+    """Test that entries are emitted as soon as they are complete."""
+    parser = AtomFeedParser()
+    emitted = []
+    for i in range(0, len(feed_bytes), 512):
+        emitted.extend(parser.feed(feed_bytes[i : i + 512]))
+    page = parser.close()
+
+    assert len(emitted) == 50
+    assert page.entries == emitted
+    assert page.entries == parse_feed(feed_bytes).entries
+
+
+def test_partial_entry_is_skipped(atom_feed):
+    """Test that entries without a publication date are skipped and counted."""
+    content = atom_feed(0, 3, total=3).replace(
+        b"<published>2023-01-01T00:00:00Z</published>", b"", 1
+    )
+    page = parse_feed(content)
+    assert [p.get_short_id() for p in page.entries] == ["2301.00001v1", "2301.00002v1"]
+    assert page.skipped == 1
@@ -0,0 +1,70 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import pytest
+from arxiv_mcp_server.clients import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_share_one_future():
+    """Test that concurrent calls with the same key run once."""
+    flights = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(5)))
+
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert flights.stats() == {"calls": 1, "coalesced": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_finished_calls_are_not_reused():
+    """Test that a new call starts once the previous one has finished."""
+    flights = SingleFlight()
+    counter = iter(range(10))
+
+    async def fetch():
+        return next(counter)
+
+    assert await flights.do("key", fetch) == 0
+    assert await flights.do("key", fetch) == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared():
+    """Test that every waiter receives the exception of the shared call."""
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert not flights.in_flight("key")
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_caller_keeps_the_call_alive():
+    """Test that cancelling one waiter does not cancel the shared call."""
+    flights = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    first = asyncio.create_task(flights.do("key", fetch))
+    second = asyncio.create_task(flights.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
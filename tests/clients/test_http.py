@@ -0,0 +1,30 @@
+"""Tests for the shared HTTP connection pool."""
+
+import pytest
+from arxiv_mcp_server.clients import http
+from arxiv_mcp_server.clients.http import get_http_client, close_http_client
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared():
+    """Test that the pool is created once and reused."""
+    try:
+        client = get_http_client()
+        assert get_http_client() is client
+        assert client.timeout.read == http.settings.REQUEST_TIMEOUT
+        assert client.timeout.connect == http.settings.CONNECT_TIMEOUT
+    finally:
+        await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_close_http_client():
+    """Test that closing the pool allows a fresh one to be created."""
+    client = get_http_client()
+    await close_http_client()
+    assert client.is_closed
+    assert http._http_client is None
+
+    replacement = get_http_client()
+    assert replacement is not client
+    await close_http_client()
@@ -0,0 +1,72 @@
+"""Tests for the global arXiv rate limiter."""
+
+import asyncio
+import pytest
+from arxiv_mcp_server.clients import Priority, RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_burst_is_granted_immediately():
+    """Test that available tokens are granted without waiting."""
+    limiter = RateLimiter(rate=1, burst=3)
+    waits = [await limiter.acquire() for _ in range(3)]
+    assert waits == [0.0, 0.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_spaced():
+    """Test that requests beyond the burst wait for tokens to refill."""
+    limiter = RateLimiter(rate=20, burst=1)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    assert loop.time() - started >= 0.14
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_jump_the_queue():
+    """Test that higher priority waiters are served first."""
+    limiter = RateLimiter(rate=20, burst=1)
+    await limiter.acquire()
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+
+    background = [
+        asyncio.create_task(request(f"bulk-{i}", Priority.BACKGROUND)) for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request("search", Priority.INTERACTIVE))
+    await asyncio.gather(*background, interactive)
+
+    assert order[0] == "search"
+    assert order[1:] == ["bulk-0", "bulk-1", "bulk-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_slot():
+    """Test that a cancelled waiter does not consume a token."""
+    limiter = RateLimiter(rate=20, burst=1)
+    await limiter.acquire()
+    cancelled = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    waited = await limiter.acquire()
+    assert waited < 0.1
+    assert limiter.queue_length == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_stats():
+    """Test that queue-wait time is recorded per priority."""
+    limiter = RateLimiter(rate=20, burst=1)
+    await limiter.acquire(Priority.INTERACTIVE)
+    await limiter.acquire(Priority.BACKGROUND)
+
+    stats = limiter.stats()
+    assert stats["interactive"]["requests"] == 1
+    assert stats["interactive"]["max_wait"] == 0.0
+    assert stats["background"]["requests"] == 1
+    assert stats["background"]["max_wait"] > 0
@@ -0,0 +1,217 @@
+"""Tests for resumable downloads against a local HTTP server."""
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from arxiv_mcp_server.clients import ArxivClient, RateLimiter
+from arxiv_mcp_server.clients.resumable import IncompleteDownloadError, PartialDownload
+
+CONTENT = b"%PDF-1.4 " + bytes(range(256)) * 1024
+
+
+class _FileServer(ThreadingHTTPServer):
+    """Serves one file with ``Range``/``If-Range`` support.
+
+    The first ``drops`` responses are cut off after ``drop_after`` body bytes.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RangeHandler)
+        self.content = CONTENT
+        self.etag = '"v1"'
+        self.honour_range = True
+        self.drops = 0
+        self.drop_after = 1000
+        self.gzip = False
+        self.requests = []
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        content = server.content
+        start = 0
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and server.honour_range and if_range in (None, server.etag):
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(content):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(content)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        else:
+            self.send_response(200)
+        body = content[start:]
+        if server.gzip and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", server.etag)
+        self.end_headers()
+        if server.drops:
+            server.drops -= 1
+            self.wfile.write(body[: server.drop_after])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def file_server():
+    server = _FileServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+async def session():
+    async with httpx.AsyncClient() as session:
+        yield session
+
+
+def _client(server, session, **kwargs) -> ArxivClient:
+    client = ArxivClient(
+        session=session, rate_limiter=RateLimiter(rate=1000, burst=1000), **kwargs
+    )
+    client.download_scheme = "http"
+    client.download_domain = f"127.0.0.1:{server.server_address[1]}"
+    return client
+
+
+@pytest.mark.asyncio
+async def test_interrupted_transfer_resumes(
+    file_server, session, mock_paper, temp_storage_path
+):
+    """Test that a broken transfer is retried with a range request."""
+    file_server.drops = 1
+    path = temp_storage_path / "paper.pdf"
+
+    await _client(file_server, session).download_pdf(mock_paper, path)
+
+    assert path.read_bytes() == CONTENT
+    assert "Range" not in file_server.requests[0]
+    assert file_server.requests[1]["Range"] == "bytes=1000-"
+    assert file_server.requests[1]["If-Range"] == '"v1"'
+    assert sorted(p.name for p in temp_storage_path.iterdir()) == ["paper.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_part_file_survives_failed_download(
+    file_server, session, mock_paper, temp_storage_path
+):
+    """Test that a later download resumes the part left by a failed one."""
+    file_server.drops = 1
+    path = temp_storage_path / "paper.pdf"
+    with pytest.raises(httpx.TransportError):
+        await _client(file_server, session, num_retries=0).download_pdf(
+            mock_paper, path
+        )
+    assert (temp_storage_path / "paper.pdf.part").stat().st_size == 1000
+
+    progress = []
+    await _client(file_server, session).download_pdf(
+        mock_paper, path, progress=lambda received, total: progress.append(received)
+    )
+
+    assert path.read_bytes() == CONTENT
+    assert file_server.requests[-1]["Range"] == "bytes=1000-"
+    assert progress[0] == 1000 and progress[-1] == len(CONTENT)
+
+
+@pytest.mark.asyncio
+async def test_changed_file_restarts(
+    file_server, session, mock_paper, temp_storage_path
+):
+    """Test that a part is discarded when the ETag no longer matches."""
+    file_server.drops = 1
+    path = temp_storage_path / "paper.pdf"
+    with pytest.raises(httpx.TransportError):
+        await _client(file_server, session, num_retries=0).download_pdf(
+            mock_paper, path
+        )
+
+    file_server.content = b"%PDF-1.5 revised"
+    file_server.etag = '"v2"'
+    await _client(file_server, session).download_pdf(mock_paper, path)
+
+    assert path.read_bytes() == b"%PDF-1.5 revised"
+
+
+@pytest.mark.asyncio
+async def test_server_without_range_support(
+    file_server, session, mock_paper, temp_storage_path
+):
+    """Test that a full response to a range request starts the part over."""
+    file_server.drops = 1
+    file_server.honour_range = False
+    path = temp_storage_path / "paper.pdf"
+
+    await _client(file_server, session).download_pdf(mock_paper, path)
+
+    assert path.read_bytes() == CONTENT
+    assert len(file_server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_complete_part_is_finished(file_server, session, temp_storage_path):
+    """Test that a part holding the whole file is moved into place."""
+    path = temp_storage_path / "paper.pdf"
+    download = PartialDownload(path)
+    download._begin('"v1"', len(CONTENT))
+    download.part_path.write_bytes(CONTENT)
+
+    url = f"http://127.0.0.1:{file_server.server_address[1]}/pdf/2103.12345"
+    await PartialDownload(path).fetch(session, url)
+
+    assert path.read_bytes() == CONTENT
+    assert not download.meta_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_short_body_is_incomplete(session, temp_storage_path):
+    """Test that a body shorter than announced is reported as incomplete."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, stream=httpx.ByteStream(b"%PDF"), headers={"Content-Length": "10"}
+        )
+
+    mock_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    download = PartialDownload(temp_storage_path / "paper.pdf")
+    with pytest.raises(IncompleteDownloadError):
+        await download.fetch(mock_session, "https://example.org/paper.pdf")
+    assert download.offset == 4
+
+
+@pytest.mark.asyncio
+async def test_download_is_not_compressed(
+    file_server, session, mock_paper, temp_storage_path
+):
+    """Test that byte counts refer to the file, not a compressed encoding."""
+    file_server.gzip = True
+    file_server.drops = 1
+    path = temp_storage_path / "paper.pdf"
+
+    await _client(file_server, session).download_pdf(mock_paper, path)
+
+    assert path.read_bytes() == CONTENT
+    assert file_server.requests[1]["Range"] == "bytes=1000-"
+    assert {r["Accept-Encoding"] for r in file_server.requests} == {"identity"}
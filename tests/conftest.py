@@ -2,45 +2,103 @@
 
 import pytest
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, AsyncMock
-import arxiv
 from pathlib import Path
-
-
-class MockAuthor:
-    def __init__(self, name):
-        self.name = name
-
-
-class MockLink:
-    def __init__(self, href):
-        self.href = href
+from arxiv_mcp_server.clients import ArxivClient, Paper, ResultPage
+from arxiv_mcp_server.clients.atom import Author, Link
+
+
+@pytest.fixture(autouse=True)
+def reset_search_cache(monkeypatch):
+    """Give every test a fresh, empty search result cache."""
+    from arxiv_mcp_server.tools import search
+
+    monkeypatch.setattr(search, "_search_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(monkeypatch, tmp_path):
+    """Keep the papers and databases of every test in a temporary directory."""
+    from arxiv_mcp_server import (
+        conversion,
+        fulltext,
+        jobs,
+        metadata_store,
+        prefetch,
+        similarity,
+    )
+
+    storage_path = tmp_path / "storage"
+    storage_path.mkdir()
+    monkeypatch.setenv("ARXIV_STORAGE_PATH", str(storage_path))
+    monkeypatch.setattr(metadata_store, "_metadata_store", None)
+    monkeypatch.setattr(fulltext, "_fulltext_index", None)
+    monkeypatch.setattr(jobs, "_job_store", None)
+    monkeypatch.setattr(similarity, "_similarity_index", None)
+    monkeypatch.setattr(prefetch, "_prefetcher", None)
+    # Convert in threads so that patched converters apply
+    monkeypatch.setattr(
+        conversion, "_engine", conversion.ConversionEngine(2, ThreadPoolExecutor)
+    )
+    yield storage_path
+    for store in (
+        metadata_store._metadata_store,
+        fulltext._fulltext_index,
+        jobs._job_store,
+    ):
+        if store is not None:
+            store.close()
+
+
+@pytest.fixture(scope="session")
+def pdf_bytes():
+    """A one-page PDF that the converter can open."""
+    import pymupdf
+
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), "Test paper", fontsize=11)
+    return doc.tobytes()
 
 
 @pytest.fixture
 def mock_paper():
     """Create a properly structured mock paper with all required attributes."""
-    paper = MagicMock(spec=arxiv.Result)
+    paper = MagicMock(spec=Paper)
     paper.get_short_id.return_value = "2103.12345"
+    paper.entry_id = "http://arxiv.org/abs/2103.12345"
     paper.title = "Test Paper"
-    paper.authors = [MockAuthor("John Doe"), MockAuthor("Jane Smith")]
+    paper.authors = [Author("John Doe"), Author("Jane Smith")]
     paper.summary = "Test abstract"
     paper.categories = ["cs.AI", "cs.LG"]
     paper.published = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    paper.updated = datetime(2023, 1, 2, tzinfo=timezone.utc)
     paper.pdf_url = "https://arxiv.org/pdf/2103.12345"
     paper.comment = "Test comment"
     paper.journal_ref = "Test Journal 2023"
+    paper.doi = None
     paper.primary_category = "cs.AI"
-    paper.links = [MockLink("https://arxiv.org/abs/2103.12345")]
+    paper.links = [Link("https://arxiv.org/abs/2103.12345")]
     return paper
 
 
 @pytest.fixture
 def mock_client(mock_paper):
-    """Create a mock arxiv client with predefined behavior."""
-    client = MagicMock(spec=arxiv.Client)
-    client.results.return_value = [mock_paper]
+    """Create a mock async arXiv client with predefined behavior."""
+    client = MagicMock(spec=ArxivClient)
+
+    async def results(search, offset=0, **kwargs):
+        for paper in [mock_paper]:
+            yield paper
+
+    async def pages(search, offset=0, **kwargs):
+        yield ResultPage([mock_paper], total_results=1)
+
+    client.results.side_effect = results
+    client.pages.side_effect = pages
+    client.get_paper = AsyncMock(return_value=mock_paper)
+    client.get_papers = AsyncMock(return_value=[mock_paper])
     return client
 
 
@@ -74,3 +132,42 @@ def mock_http_session(mock_http_response):
     session.get.return_value = mock_http_response
     session.__aenter__.return_value = session
     return session
+
+
+def _atom_entry(index: int) -> str:
+    paper_id = f"2301.{index:05d}"
+    return f"""
+  <entry>
+    <id>http://arxiv.org/abs/{paper_id}v1</id>
+    <updated>2023-01-02T00:00:00Z</updated>
+    <published>2023-01-01T00:00:00Z</published>
+    <title>Paper {index}</title>
+    <summary>Abstract of paper {index}</summary>
+    <author><name>Author {index}</name></author>
+    <link href="http://arxiv.org/abs/{paper_id}v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/{paper_id}v1" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>"""
+
+
+@pytest.fixture
+def atom_feed():
+    """Build arXiv API Atom feeds with numbered entries."""
+
+    def build(start: int, count: int, total: int) -> bytes:
+        entries = "".join(_atom_entry(i) for i in range(start, start + count))
+        return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+      xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"
+      xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>arXiv Query</title>
+  <id>http://arxiv.org/api/test</id>
+  <updated>2023-01-02T00:00:00Z</updated>
+  <opensearch:totalResults>{total}</opensearch:totalResults>
+  <opensearch:startIndex>{start}</opensearch:startIndex>
+  <opensearch:itemsPerPage>{count}</opensearch:itemsPerPage>{entries}
+</feed>
+""".encode()
+
+    return build
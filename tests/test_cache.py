@@ -0,0 +1,79 @@
+"""Tests for the result cache."""
+
+from arxiv_mcp_server.cache import ResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_and_set():
+    """Test basic hits and misses."""
+    cache = ResultCache()
+    assert cache.get("a") is None
+    cache.set("a", [1, 2, 3])
+    assert cache.get("a") == [1, 2, 3]
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_ttl_expiry():
+    """Test that entries expire after their TTL."""
+    clock = FakeClock()
+    cache = ResultCache(ttl=10, clock=clock)
+    cache.set("a", "value")
+    cache.set("b", "value", ttl=100)
+
+    clock.now += 11
+    assert cache.get("a") is None
+    assert cache.get("b") == "value"
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_eviction_by_entries():
+    """Test that the least recently used entry is evicted first."""
+    cache = ResultCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_eviction_by_bytes():
+    """Test that the memory budget is respected."""
+    cache = ResultCache(max_bytes=20)
+    cache.set("a", "x" * 10)
+    cache.set("b", "y" * 10)
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] <= 20
+
+    cache.set("c", "z" * 100)
+    assert cache.get("c") is None
+
+
+def test_disk_persistence(temp_storage_path):
+    """Test that entries survive a new cache instance and expire on disk."""
+    clock = FakeClock()
+    cache = ResultCache(ttl=10, persist_dir=temp_storage_path, clock=clock)
+    cache.set("query", {"papers": ["2103.12345"]})
+
+    reloaded = ResultCache(ttl=10, persist_dir=temp_storage_path, clock=clock)
+    assert reloaded.get("query") == {"papers": ["2103.12345"]}
+
+    clock.now += 11
+    expired = ResultCache(ttl=10, persist_dir=temp_storage_path, clock=clock)
+    assert expired.get("query") is None
+    assert not list(temp_storage_path.glob("*.json"))
@@ -0,0 +1,297 @@
+"""Tests for the bounded PDF conversion engine."""
+
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pymupdf
+import pymupdf4llm
+import pytest
+from arxiv_mcp_server import conversion
+from arxiv_mcp_server.clients import Priority
+from arxiv_mcp_server.conversion import (
+    ConversionEngine,
+    PartialMarkdown,
+    get_conversion_engine,
+    resident_memory,
+    split_pages,
+)
+from arxiv_mcp_server.tools import handle_download, handle_read_paper
+from arxiv_mcp_server.tools.download import ConversionStatus, conversion_statuses
+
+
+def _thread_engine(workers: int) -> ConversionEngine:
+    return ConversionEngine(workers, ThreadPoolExecutor)
+
+
+async def _until(condition) -> None:
+    while not condition():
+        await asyncio.sleep(0.01)
+
+
+def _make_pdf(path, pages: int, section_every: int = 4) -> None:
+    """Write a PDF with a heading every few pages and body text."""
+    doc = pymupdf.open()
+    for number in range(pages):
+        page = doc.new_page()
+        y = 72
+        if number % section_every == 0:
+            page.insert_text((72, y), f"Section {number // 4 + 1}", fontsize=20)
+            y += 36
+        if number % 4 == 2:
+            page.insert_text((72, y), f"Subsection {number}", fontsize=15)
+            y += 28
+        for line in range(20):
+            page.insert_text((72, y), f"Page {number} line {line} text.", fontsize=10)
+            y += 14
+    doc.save(path)
+
+
+@pytest.mark.asyncio
+async def test_workers_are_bounded():
+    """Test that no more than max_workers jobs run at once."""
+    engine = _thread_engine(2)
+    lock = threading.Lock()
+    running = peak = 0
+
+    def job():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.02)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*(engine.run(f"job-{i}", job) for i in range(6)))
+
+    assert peak == 2
+    assert engine.stats()["completed"] == 6
+
+
+@pytest.mark.asyncio
+async def test_queue_serves_priority_then_fifo():
+    """Test that queued jobs start highest priority first, FIFO within one."""
+    engine = _thread_engine(1)
+    release = threading.Event()
+    order = []
+
+    tasks = [asyncio.create_task(engine.run("blocker", release.wait))]
+    await _until(lambda: engine.position("blocker") == 0)
+    for name, priority in [
+        ("prefetch", Priority.BACKGROUND),
+        ("first", Priority.NORMAL),
+        ("second", Priority.NORMAL),
+    ]:
+        tasks.append(
+            asyncio.create_task(engine.run(name, order.append, name, priority=priority))
+        )
+    await asyncio.sleep(0)
+
+    positions = [engine.position(name) for name in ("first", "second", "prefetch")]
+    assert positions == [1, 2, 3]
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["first", "second", "prefetch"]
+    assert engine.position("first") is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_leaves_queue():
+    """Test that cancelling a queued job removes it without running it."""
+    engine = _thread_engine(1)
+    release = threading.Event()
+    ran = []
+
+    blocker = asyncio.create_task(engine.run("blocker", release.wait))
+    queued = asyncio.create_task(engine.run("queued", ran.append, "queued"))
+    await _until(lambda: engine.position("queued") == 1)
+    queued.cancel()
+    await asyncio.sleep(0)
+
+    assert engine.position("queued") is None
+    release.set()
+    await blocker
+    assert ran == []
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_the_caller():
+    """Test that a failing job raises in the caller and frees its worker."""
+    engine = _thread_engine(1)
+
+    with pytest.raises(ValueError):
+        await engine.run("bad", int, "not a number")
+    assert await engine.run("good", int, "42") == 42
+    assert engine.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_jobs_in_other_processes():
+    """Test that the default engine converts in reused worker processes."""
+    engine = ConversionEngine(1, max_rss=0)
+    try:
+        pids = [await engine.run(f"pid-{i}", os.getpid) for i in range(2)]
+    finally:
+        engine.shutdown()
+    assert pids[0] == pids[1] != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_workers_over_memory_ceiling_are_replaced():
+    """Test that a worker above the memory ceiling is replaced after its job."""
+    assert resident_memory() > 0
+    engine = ConversionEngine(1, max_rss=1)
+    try:
+        pids = [await engine.run(f"pid-{i}", os.getpid) for i in range(2)]
+    finally:
+        engine.shutdown()
+    assert pids[0] != pids[1]
+    assert engine.stats()["recycled"] == 2
+
+
+@pytest.mark.asyncio
+async def test_check_status_reports_queue_position(monkeypatch):
+    """Test that check_status shows where a waiting conversion is queued."""
+    engine = get_conversion_engine()
+    monkeypatch.setattr(engine, "position", lambda job_id: 3)
+    conversion_statuses["2103.11111"] = ConversionStatus(
+        paper_id="2103.11111", status="converting", started_at=datetime.now()
+    )
+    try:
+        response = await handle_download(
+            {"paper_id": "2103.11111", "check_status": True}
+        )
+    finally:
+        conversion_statuses.pop("2103.11111", None)
+
+    assert json.loads(response[0].text)["queue_position"] == 3
+
+
+def test_split_pages():
+    """Test that pages are split into balanced ranges of a minimum size."""
+    assert split_pages(100, 4, 20) == [(0, 25), (25, 50), (50, 75), (75, 100)]
+    assert split_pages(50, 4, 20) == [(0, 25), (25, 50)]
+    assert split_pages(30, 4, 20) == [(0, 30)]
+    assert split_pages(0, 4, 20) == [(0, 0)]
+
+
+@pytest.mark.asyncio
+async def test_parallel_conversion_matches_single_pass(monkeypatch, tmp_path):
+    """Test that a split conversion stitches pages and headings back in order."""
+    monkeypatch.setattr(conversion.settings, "CONVERSION_MIN_CHUNK_PAGES", 3)
+    pdf_path, md_path = tmp_path / "paper.pdf", tmp_path / "paper.md"
+    _make_pdf(pdf_path, 10)
+    engine = _thread_engine(3)
+
+    await engine.convert("paper", pdf_path, md_path)
+
+    expected = pymupdf4llm.to_markdown(str(pdf_path), show_progress=False)
+    assert md_path.read_text(encoding="utf-8") == expected
+    assert "# Section 3" in expected and "## Subsection 6" in expected
+    # Three ranges, each scanned for font sizes and then converted
+    assert engine.stats()["completed"] == 6
+
+
+@pytest.mark.asyncio
+async def test_heading_levels_hold_across_ranges(monkeypatch, tmp_path):
+    """Test that ranges without top-level headings keep the document's levels."""
+    monkeypatch.setattr(conversion.settings, "CONVERSION_MIN_CHUNK_PAGES", 3)
+    pdf_path, md_path = tmp_path / "paper.pdf", tmp_path / "paper.md"
+    # Only the first range has a section; the others only have subsections
+    _make_pdf(pdf_path, 10, section_every=100)
+
+    await _thread_engine(3).convert("paper", pdf_path, md_path)
+
+    expected = pymupdf4llm.to_markdown(str(pdf_path), show_progress=False)
+    assert md_path.read_text(encoding="utf-8") == expected
+    assert "## Subsection 6" in expected
+    # The part files are gone once joined
+    assert list(tmp_path.glob("paper.md.*")) == []
+
+
+@pytest.mark.asyncio
+async def test_partial_conversion_is_readable(monkeypatch, isolated_storage):
+    """Test that pages converted so far are served while the rest converts."""
+    paper_id = "2103.22222"
+    pdf_path = isolated_storage / f"{paper_id}.pdf"
+    md_path = isolated_storage / f"{paper_id}.md"
+    _make_pdf(pdf_path, 3)
+    release = threading.Event()
+    to_markdown = pymupdf4llm.to_markdown
+
+    def slow_to_markdown(doc, pages, **kwargs):
+        if pages[0] > 0:
+            release.wait(5)
+        return to_markdown(doc, pages=pages, **kwargs)
+
+    monkeypatch.setattr(conversion.pymupdf4llm, "to_markdown", slow_to_markdown)
+    conversion_statuses[paper_id] = ConversionStatus(
+        paper_id=paper_id, status="converting", started_at=datetime.now()
+    )
+    task = asyncio.create_task(
+        get_conversion_engine().convert(paper_id, pdf_path, md_path)
+    )
+    try:
+        await asyncio.wait_for(
+            _until(lambda: PartialMarkdown(md_path).pages_converted == 1), 5
+        )
+
+        read = json.loads((await handle_read_paper({"paper_id": paper_id}))[0].text)
+        assert read["partial"] is True
+        assert (read["pages"], read["page_count"]) == (1, 3)
+        assert "# Section 1" in read["content"] and "Page 1 " not in read["content"]
+
+        status = json.loads(
+            (await handle_download({"paper_id": paper_id, "check_status": True}))[
+                0
+            ].text
+        )
+        assert status["partial"] is True
+        assert (status["pages_converted"], status["page_count"]) == (1, 3)
+    finally:
+        release.set()
+        await task
+        conversion_statuses.pop(paper_id, None)
+
+    read = json.loads((await handle_read_paper({"paper_id": paper_id}))[0].text)
+    assert "partial" not in read
+    assert "Page 2 line 0" in read["content"]
+    assert not PartialMarkdown(md_path)
+
+
+@pytest.mark.asyncio
+async def test_failed_range_waits_for_running_ranges(monkeypatch, tmp_path):
+    """Test that a failed range cancels queued ones and outlasts running ones."""
+    monkeypatch.setattr(conversion.settings, "CONVERSION_MIN_CHUNK_PAGES", 3)
+    pdf_path, md_path = tmp_path / "paper.pdf", tmp_path / "paper.md"
+    _make_pdf(pdf_path, 9)
+    engine = _thread_engine(3)
+    started = []
+
+    def convert_pages(pdf_path, start, end, part_path, marker_path, headers):
+        started.append(start)
+        if start == 0:
+            raise ValueError("Broken page")
+        threading.Event().wait(0.2)
+        part_path.write_text("late")
+        marker_path.write_text("{}")
+        return end - start
+
+    monkeypatch.setattr(conversion, "convert_pages", convert_pages)
+    # Keep one worker busy so that the last range has to wait in the queue
+    release = threading.Event()
+    blocker = asyncio.create_task(engine.run("other", release.wait, 1))
+    await _until(lambda: engine.position("other") == 0)
+    try:
+        with pytest.raises(ValueError):
+            await engine.convert("paper", pdf_path, md_path)
+    finally:
+        release.set()
+        await blocker
+
+    assert sorted(started) == [0, 3]
+    assert list(tmp_path.glob("paper.md*")) == []
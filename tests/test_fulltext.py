@@ -0,0 +1,131 @@
+"""Tests for the full-text index over converted papers."""
+
+import sqlite3
+
+import pytest
+from arxiv_mcp_server.fulltext import FullTextIndex, chunk_markdown
+
+PAPER_A = """# Contrastive Learning of Visual Features
+
+## Abstract
+
+We study contrastive learning for image representations.
+
+## Experiments
+
+We train on ImageNet with a contrastive loss and report linear probe accuracy.
+"""
+
+PAPER_B = """# Graph Networks
+
+## Introduction
+
+Message passing networks operate on graphs.
+
+## Results
+
+Our graph model beats baselines on molecule property prediction.
+"""
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = FullTextIndex(tmp_path / "fulltext.db")
+    index.index_paper("2301.00001", PAPER_A)
+    index.index_paper("2301.00002", PAPER_B)
+    return index
+
+
+def test_chunk_markdown_follows_headings():
+    """Test that passages are split at headings and paragraphs."""
+    chunks = list(chunk_markdown(PAPER_A))
+    assert [heading for heading, _ in chunks] == ["Abstract", "Experiments"]
+
+    long_section = "## Body\n\n" + "\n\n".join(["word " * 50] * 10)
+    assert len(list(chunk_markdown(long_section, max_chars=600))) > 1
+
+
+def test_search_ranks_and_highlights(index):
+    """Test BM25 ranking and highlighted snippets with their section."""
+    hits = index.search('"contrastive loss" OR graph')
+    assert {hit.paper_id for hit in hits} == {"2301.00001", "2301.00002"}
+
+    hits = index.search("contrastive imagenet")
+    assert [hit.paper_id for hit in hits] == ["2301.00001"]
+    assert hits[0].snippets[0].startswith("[Experiments]")
+    assert "**ImageNet**" in hits[0].snippets[0]
+
+
+def test_search_stems_terms(index):
+    """Test that inflected forms match."""
+    assert [hit.paper_id for hit in index.search("predicting")] == ["2301.00002"]
+
+
+def test_andnot_and_invalid_queries(index):
+    """Test exclusion and rejection of unsupported queries."""
+    assert index.search("networks ANDNOT molecule") == []
+    with pytest.raises(ValueError):
+        index.search("ti:graph")
+    with pytest.raises(ValueError):
+        index.search("")
+
+
+def test_reindex_replaces_passages(index):
+    """Test that re-indexing a paper drops its old passages."""
+    index.index_paper("2301.00002", "## Summary\n\nNothing about that topic.")
+    assert index.search("graph") == []
+    assert index.search("contrastive")[0].paper_id == "2301.00001"
+    count = index._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+    assert count == len(list(chunk_markdown(PAPER_A))) + 1
+    # The paper table indexes without storing; deleting left it consistent
+    assert index._conn.execute("SELECT body FROM texts").fetchall() == [(None,)] * 2
+    index._conn.execute("INSERT INTO texts (texts) VALUES ('integrity-check')")
+
+
+def test_deletes_use_rowids(index):
+    """Test that dropping a paper's rows does not scan the whole index."""
+    for statement in ("SELECT section, body FROM", "DELETE FROM"):
+        plan = index._conn.execute(
+            f"EXPLAIN QUERY PLAN {statement} chunks WHERE rowid BETWEEN 1 AND 2"
+        ).fetchall()
+        assert "INDEX 0:" in plan[0][-1]
+
+
+@pytest.mark.parametrize(
+    "documents",
+    [
+        "paper_id TEXT PRIMARY KEY, mtime REAL, chunks INT",
+        "id INTEGER PRIMARY KEY, paper_id TEXT UNIQUE, mtime REAL, chunks INT",
+    ],
+)
+def test_index_in_earlier_layout_is_rebuilt(tmp_path, documents):
+    """Test that indexes keyed by paper ID or storing texts twice are dropped."""
+    conn = sqlite3.connect(tmp_path / "fulltext.db")
+    conn.executescript(
+        f"CREATE TABLE documents ({documents});"
+        "CREATE VIRTUAL TABLE texts USING fts5(paper_id UNINDEXED, headings, body);"
+        "CREATE VIRTUAL TABLE chunks USING fts5(paper_id UNINDEXED, section, body);"
+        "INSERT INTO documents (paper_id, mtime, chunks) VALUES ('2301.00001', 1, 2);"
+    )
+    conn.close()
+
+    index = FullTextIndex(tmp_path / "fulltext.db")
+    index.index_paper("2301.00002", PAPER_B)
+    assert [hit.paper_id for hit in index.search("graph")] == ["2301.00002"]
+    assert index._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0] == 1
+
+
+def test_sync_with_storage(tmp_path):
+    """Test that sync indexes new files and forgets deleted ones."""
+    storage = tmp_path / "papers"
+    storage.mkdir()
+    (storage / "2301.00001.md").write_text(PAPER_A)
+    index = FullTextIndex(tmp_path / "fulltext.db")
+
+    assert index.sync(storage) == 1
+    assert index.sync(storage) == 0
+    assert index.search("imagenet")[0].paper_id == "2301.00001"
+
+    (storage / "2301.00001.md").unlink()
+    index.sync(storage)
+    assert index.search("imagenet") == []
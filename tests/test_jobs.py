@@ -0,0 +1,102 @@
+"""Tests for the durable download and conversion job table."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, call
+
+import pytest
+from arxiv_mcp_server import jobs
+from arxiv_mcp_server.clients import Priority
+from arxiv_mcp_server.jobs import ConversionStatus, JobStore, get_job_store
+from arxiv_mcp_server.tools import download
+
+
+def _status(paper_id: str, state: str) -> ConversionStatus:
+    return ConversionStatus(paper_id=paper_id, status=state, started_at=datetime.now())
+
+
+def test_statuses_survive_reopening(tmp_path):
+    """Test that job state, attempts and errors outlive the process."""
+    store = JobStore(tmp_path / "jobs.db")
+    status = _status("2103.12345", "downloading")
+    store["2103.12345"] = status
+    status.status = "error"
+    status.error = "Connection reset"
+    # Progress is written at most once a second, and when the transfer ends
+    status.update_progress(1024, 2048)
+    status.update_progress(2048, 2048)
+    store.close()
+
+    store = JobStore(tmp_path / "jobs.db")
+    stored = store["2103.12345"]
+    assert (stored.status, stored.error, stored.attempts) == (
+        "error",
+        "Connection reset",
+        1,
+    )
+    assert (stored.bytes_received, stored.bytes_total) == (2048, 2048)
+    assert stored.started_at == status.started_at
+
+    store["2103.12345"] = _status("2103.12345", "downloading")
+    assert store["2103.12345"].attempts == 2
+    assert [s.paper_id for s in store.unfinished()] == ["2103.12345"]
+    del store["2103.12345"]
+    assert "2103.12345" not in store
+    store.close()
+
+
+def test_progress_is_written_at_milestones(tmp_path, mocker):
+    """Test that per-chunk progress updates write only a few rows."""
+    clock = mocker.patch.object(jobs.time, "monotonic", return_value=0.0)
+    store = JobStore(tmp_path / "jobs.db")
+    status = _status("2103.12345", "downloading")
+    store["2103.12345"] = status
+    save = mocker.spy(store, "save")
+
+    total = 1000 * 1024
+    for chunk in range(1, 1001):
+        clock.return_value = chunk * 0.01
+        status.update_progress(chunk * 1024, total)
+
+    # One write per second of transfer, each past a new milestone, plus the last
+    assert 2 <= save.call_count <= 11
+    assert store["2103.12345"].bytes_received == total
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_resume_picks_up_unfinished_jobs(mocker, isolated_storage, pdf_bytes):
+    """Test that a restart resumes jobs and converts orphaned PDFs."""
+    store = get_job_store()
+    for paper_id, state in [
+        ("2401.00001", "converting"),
+        ("2401.00002", "downloading"),
+        ("2401.00003", "converting"),
+        ("2401.00004", "converting"),
+    ]:
+        store[paper_id] = _status(paper_id, state)
+    for _ in range(2):
+        store["2401.00004"] = _status("2401.00004", "converting")
+    for paper_id in ("2401.00001", "2401.00004", "2401.00005"):
+        (isolated_storage / f"{paper_id}.pdf").write_bytes(pdf_bytes)
+    (isolated_storage / "2401.00003.md").write_text("# Done")
+    # Restart with the table left behind
+    store.close()
+    jobs._job_store = None
+
+    convert = mocker.patch.object(download, "convert_pdf_to_markdown", AsyncMock())
+    resume_download = mocker.patch.object(download, "_resume_download", AsyncMock())
+    assert await download.resume_jobs() == 3
+    await asyncio.sleep(0)
+
+    assert sorted(convert.await_args_list) == [
+        call("2401.00001", isolated_storage / "2401.00001.pdf", Priority.BACKGROUND),
+        call("2401.00005", isolated_storage / "2401.00005.pdf", Priority.BACKGROUND),
+    ]
+    resume_download.assert_awaited_once_with("2401.00002")
+    statuses = download.conversion_statuses
+    assert statuses["2401.00001"].attempts == 2
+    assert statuses["2401.00005"].status == "converting"
+    assert statuses["2401.00003"].status == "success"
+    assert statuses["2401.00004"].status == "error"
+    assert "3 attempts" in statuses["2401.00004"].error
@@ -0,0 +1,187 @@
+"""Tests for offline search over the metadata store."""
+
+import json
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from arxiv_mcp_server.clients import ArxivClient
+from arxiv_mcp_server.metadata_store import MetadataStore, get_metadata_store
+from arxiv_mcp_server.query import parse_query
+from arxiv_mcp_server.snapshot import import_snapshot, paper_from_record
+from arxiv_mcp_server.tools import search
+
+
+def _record(paper_id, title, abstract, categories, created, authors):
+    return {
+        "id": paper_id,
+        "authors": ", ".join(" ".join(reversed(a)) for a in authors),
+        "title": title,
+        "comments": "10 pages",
+        "journal-ref": None,
+        "doi": None,
+        "categories": categories,
+        "abstract": f"  {abstract}\n",
+        "versions": [{"version": "v1", "created": created}],
+        "update_date": "2023-06-01",
+        "authors_parsed": [[last, first, ""] for last, first in authors],
+    }
+
+
+RECORDS = [
+    _record(
+        "2301.00001",
+        "Graph Neural Networks for\n  Molecules",
+        "We apply graph neural networks to molecules.",
+        "cs.LG q-bio.BM",
+        "Mon, 2 Jan 2023 10:00:00 GMT",
+        [("Smith", "Alice"), ("Jones", "Bob")],
+    ),
+    _record(
+        "2302.00002",
+        "A Survey of Graph Learning",
+        "A survey of neural approaches to graph learning.",
+        "cs.LG",
+        "Wed, 1 Feb 2023 10:00:00 GMT",
+        [("Jones", "Bob")],
+    ),
+    _record(
+        "hep-th/9901001",
+        "Strings and Branes",
+        "String theory on branes.",
+        "hep-th",
+        "Fri, 1 Jan 1999 10:00:00 GMT",
+        [("Müller", "Carl")],
+    ),
+]
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    path = tmp_path / "snapshot.json"
+    lines = [json.dumps(record) for record in RECORDS]
+    path.write_text("\n".join(lines[:2] + ["not json"] + lines[2:]) + "\n")
+    return path
+
+
+@pytest.fixture
+def store(tmp_path, snapshot_file):
+    store = MetadataStore(tmp_path / "metadata.db")
+    assert import_snapshot(snapshot_file, store, batch_size=2) == 3
+    return store
+
+
+def _ids(papers):
+    return [paper.get_short_id() for paper in papers]
+
+
+def test_paper_from_record():
+    """Test conversion of a snapshot record."""
+    paper = paper_from_record(RECORDS[0])
+    assert paper.get_short_id() == "2301.00001v1"
+    assert paper.title == "Graph Neural Networks for Molecules"
+    assert paper.summary == "We apply graph neural networks to molecules."
+    assert [a.name for a in paper.authors] == ["Alice Smith", "Bob Jones"]
+    assert paper.categories == ["cs.LG", "q-bio.BM"]
+    assert paper.published == datetime(2023, 1, 2, 10, tzinfo=timezone.utc)
+    assert paper.pdf_url == "http://arxiv.org/pdf/2301.00001v1"
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("ti:graph", {"2301.00001v1", "2302.00002v1"}),
+        ('ti:"graph learning"', {"2302.00002v1"}),
+        ("au:jones ANDNOT ti:survey", {"2301.00001v1"}),
+        ("abs:molecules OR abs:branes", {"2301.00001v1", "hep-th/9901001v1"}),
+        ("au:muller", {"hep-th/9901001v1"}),
+        ("cat:hep-th OR cat:q-bio.BM", {"2301.00001v1", "hep-th/9901001v1"}),
+        ("graph AND cat:cs.*", {"2301.00001v1", "2302.00002v1"}),
+        ("submittedDate:[20230201 TO 20231231]", {"2302.00002v1"}),
+        ("id:2302.00002", {"2302.00002v1"}),
+    ],
+)
+def test_query_syntax(store, query, expected):
+    """Test field prefixes, boolean operators, categories and date ranges."""
+    assert set(_ids(store.search(parse_query(query), limit=10))) == expected
+
+
+def test_filters_and_sorting(store):
+    """Test category and date arguments and both sort orders."""
+    query = parse_query("graph")
+    by_date = store.search(query, sort_by="date", limit=10)
+    assert _ids(by_date) == ["2302.00002v1", "2301.00001v1"]
+
+    filtered = store.search(
+        None,
+        categories=["cs"],
+        date_to=datetime(2023, 1, 31, 23, 59, 59, tzinfo=timezone.utc),
+        limit=10,
+    )
+    assert _ids(filtered) == ["2301.00001v1"]
+
+    second_page = store.search(query, sort_by="date", limit=1, offset=1)
+    assert _ids(second_page) == ["2301.00001v1"]
+
+
+def test_date_range_uses_index(store):
+    """Test that date ranges are answered by a range scan on the index."""
+    from arxiv_mcp_server.local_search import compile_search
+
+    sql, params = compile_search(
+        "p.id", None, None, datetime(2023, 1, 1), None, "date", 10
+    )
+    plan = " ".join(
+        row[-1] for row in store._conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    )
+    assert "papers_published" in plan
+
+
+def test_reimport_updates_index(store, snapshot_file):
+    """Test that re-importing keeps the full-text index consistent."""
+    import_snapshot(snapshot_file, store)
+    assert store.count() == 3
+    assert len(store.search(parse_query("ti:graph"), limit=10)) == 2
+
+
+@pytest.mark.asyncio
+async def test_offline_mode(monkeypatch, snapshot_file):
+    """Test that offline mode answers from the store without contacting arXiv."""
+    import_snapshot(snapshot_file, get_metadata_store())
+    monkeypatch.setattr(search.settings, "SEARCH_MODE", "offline")
+    client = MagicMock(spec=ArxivClient)
+    threads = []
+    store_search = MetadataStore.search
+
+    def recording_search(self, *args, **kwargs):
+        threads.append(threading.current_thread())
+        return store_search(self, *args, **kwargs)
+
+    monkeypatch.setattr(MetadataStore, "search", recording_search)
+
+    with patch("arxiv_mcp_server.tools.search.get_arxiv_client", return_value=client):
+        result = await search.handle_search(
+            {"query": "ti:graph", "categories": ["q-bio"]}
+        )
+
+    content = json.loads(result[0].text)
+    assert [p["id"] for p in content["papers"]] == ["2301.00001v1"]
+    client.pages.assert_not_called()
+    # The store is searched off the event loop's thread
+    assert threads and threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_local_first_falls_back_to_remote(monkeypatch, mock_client):
+    """Test that local_first mode queries arXiv when nothing matches locally."""
+    monkeypatch.setattr(search.settings, "SEARCH_MODE", "local_first")
+
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await search.handle_search({"query": "ti:nothing"})
+
+    content = json.loads(result[0].text)
+    assert content["papers"][0]["id"] == "2103.12345"
+    mock_client.pages.assert_called_once()
@@ -0,0 +1,147 @@
+"""Tests for the persistent metadata store."""
+
+import dataclasses
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from arxiv_mcp_server.clients import ArxivClient, parse_feed
+from arxiv_mcp_server.metadata_store import (
+    MetadataStore,
+    get_metadata_store,
+    split_version,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def papers(atom_feed):
+    return parse_feed(atom_feed(0, 3, total=3)).entries
+
+
+def test_split_version():
+    """Test splitting of new- and old-style IDs."""
+    assert split_version("2103.12345v2") == ("2103.12345", 2)
+    assert split_version("2103.12345") == ("2103.12345", None)
+    assert split_version("hep-th/9901001v1") == ("hep-th/9901001", 1)
+
+
+def test_round_trip(tmp_path, papers):
+    """Test that stored papers come back unchanged."""
+    store = MetadataStore(tmp_path / "metadata.db")
+    assert store.upsert_many(papers) == 3
+
+    found = store.get_many(["2301.00000", "2301.00001v1", "2301.99999"])
+    assert found["2301.00000"] == papers[0]
+    assert found["2301.00001v1"] == papers[1]
+    assert "2301.99999" not in found
+    assert store.count() == 3
+
+
+def test_wal_mode_and_persistence(tmp_path, papers):
+    """Test that the database uses WAL and survives reopening."""
+    store = MetadataStore(tmp_path / "metadata.db")
+    store.upsert(papers[0])
+    mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    store.close()
+
+    assert mode == "wal"
+    assert MetadataStore(tmp_path / "metadata.db").get("2301.00000") == papers[0]
+
+
+def test_version_mismatch_is_a_miss(tmp_path, papers):
+    """Test that an explicit version only matches that version."""
+    store = MetadataStore(tmp_path / "metadata.db")
+    store.upsert(papers[0])
+    assert store.get("2301.00000v2") is None
+
+
+@pytest.mark.asyncio
+async def test_older_versions_do_not_replace_newer(tmp_path, papers):
+    """Test that fetching an old version keeps the newer stored metadata."""
+    store = MetadataStore(tmp_path / "metadata.db")
+    v1 = papers[0]
+    v2 = dataclasses.replace(
+        v1, entry_id=v1.entry_id.replace("v1", "v2"), title="Revised title"
+    )
+    store.upsert(v2)
+    client = MagicMock(spec=ArxivClient)
+    client.get_papers = AsyncMock(return_value=[v1])
+
+    found = await store.get_or_fetch(client, ["2301.00000v1"])
+
+    assert found["2301.00000v1"] == v1
+    assert store.get("2301.00000") == v2
+    store.upsert(dataclasses.replace(v2, title="Corrected title"))
+    assert store.get("2301.00000").title == "Corrected title"
+
+
+def test_max_age(tmp_path, papers):
+    """Test that stale entries are treated as missing."""
+    clock = FakeClock()
+    store = MetadataStore(tmp_path / "metadata.db", clock=clock)
+    store.upsert(papers[0])
+
+    clock.now += 100
+    assert store.get("2301.00000", max_age=200) is not None
+    assert store.get("2301.00000", max_age=50) is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_only_fetches_misses(tmp_path, papers):
+    """Test that known IDs are served locally and fetched ones are stored."""
+    store = MetadataStore(tmp_path / "metadata.db")
+    store.upsert(papers[0])
+    client = MagicMock(spec=ArxivClient)
+    client.get_papers = AsyncMock(return_value=[papers[1]])
+
+    found = await store.get_or_fetch(client, ["2301.00000", "2301.00001"])
+
+    assert set(found) == {"2301.00000", "2301.00001"}
+    assert client.get_papers.await_args.args[0] == ["2301.00001"]
+    assert store.get("2301.00001") == papers[1]
+
+    client.get_papers.reset_mock()
+    await store.get_or_fetch(client, ["2301.00000", "2301.00001"])
+    client.get_papers.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_list_papers_reads_store(isolated_storage, papers):
+    """Test that list_papers does not call arXiv for known papers."""
+    from arxiv_mcp_server.tools.list_papers import handle_list_papers
+
+    (isolated_storage / "2301.00000.md").write_text("# Paper 0")
+    get_metadata_store().upsert(papers[0])
+    client = MagicMock(spec=ArxivClient)
+
+    with patch(
+        "arxiv_mcp_server.tools.list_papers.get_arxiv_client", return_value=client
+    ):
+        result = await handle_list_papers()
+
+    content = json.loads(result[0].text)
+    assert content["papers"][0]["title"] == "Paper 0"
+    client.get_papers.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_writes_store(mock_client):
+    """Test that search results are written to the store."""
+    from arxiv_mcp_server.tools.search import handle_search
+
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        await handle_search({"query": "test query"})
+
+    paper = get_metadata_store().get("2103.12345")
+    assert paper.title == "Test Paper"
+    assert [a.name for a in paper.authors] == ["John Doe", "Jane Smith"]
@@ -0,0 +1,64 @@
+"""Tests for output shaping and encoding of paper listings."""
+
+import json
+import pytest
+from arxiv_mcp_server import output
+from arxiv_mcp_server.output import OutputOptions, truncate
+
+FIELDS = ["id", "title", "abstract"]
+RESPONSE = {
+    "total_results": 2,
+    "papers": [
+        {"id": "2301.00001", "title": "Über Graphs", "abstract": "One two three four."},
+        {"id": "2301.00002", "title": "Sets", "abstract": "Short."},
+    ],
+}
+
+
+def test_truncate_cuts_at_word():
+    """Test that truncated text ends at a word boundary with an ellipsis."""
+    assert truncate("alpha beta gamma delta", 13) == "alpha beta…"
+    assert truncate("short", 10) == "short"
+    assert truncate(None, 10) is None
+
+
+def test_projection_and_budget():
+    """Test that only the requested fields are kept and abstracts are cut."""
+    options = OutputOptions(
+        {"fields": ["abstract", "id"], "abstract_chars": 8, "format": "pretty"},
+        FIELDS,
+        "abstract",
+    )
+    content = json.loads(options.render(RESPONSE))
+    assert content["total_results"] == 2
+    assert content["papers"][0] == {"id": "2301.00001", "abstract": "One two…"}
+    assert content["papers"][1] == {"id": "2301.00002", "abstract": "Short."}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_compact_format(monkeypatch, use_orjson):
+    """Test that compact output is minified JSON with or without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(output, "orjson", None)
+    text = OutputOptions({"format": "compact"}, FIELDS, "abstract").render(RESPONSE)
+    assert "\n" not in text and ", " not in text
+    assert "Über" in text
+    assert json.loads(text) == RESPONSE
+
+
+def test_ndjson_format():
+    """Test that ndjson output has a header line and one line per paper."""
+    text = OutputOptions({"format": "ndjson"}, FIELDS, "abstract").render(RESPONSE)
+    lines = [json.loads(line) for line in text.splitlines()]
+    assert lines[0] == {"total_results": 2}
+    assert lines[1:] == RESPONSE["papers"]
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [{"fields": ["doi"]}, {"format": "xml"}, {"abstract_chars": 0}],
+)
+def test_invalid_options(arguments):
+    """Test that unknown fields, formats and budgets are rejected."""
+    with pytest.raises(ValueError):
+        OutputOptions(arguments, FIELDS, "abstract")
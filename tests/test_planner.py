@@ -0,0 +1,33 @@
+"""Tests for OR query splitting and reciprocal-rank fusion."""
+
+import pytest
+from arxiv_mcp_server.planner import reciprocal_rank_fusion, split_or_query
+
+
+def test_split_top_level_alternatives():
+    """Test that only top-level ORs are split."""
+    assert split_or_query('"a b" OR ti:c OR (d AND e)', 8) == [
+        '"a b"',
+        "ti:c",
+        "d AND e",
+    ]
+    assert split_or_query("(a OR b OR c) AND d", 8) is None
+
+
+def test_split_groups_to_budget():
+    """Test that alternatives are grouped when there are too many."""
+    assert split_or_query("a OR b OR c OR d OR e", 2) == ["a OR b OR c", "d OR e"]
+
+
+@pytest.mark.parametrize("query", ["a OR b", "a AND b", "(unbalanced OR x"])
+def test_no_split(query):
+    """Test that short, conjunctive and invalid queries are left alone."""
+    assert split_or_query(query, 8) is None
+
+
+def test_reciprocal_rank_fusion():
+    """Test that shared papers rise and duplicates are removed."""
+    first = [{"id": "x"}, {"id": "shared"}, {"id": "y"}]
+    second = [{"id": "z"}, {"id": "shared"}]
+    fused = reciprocal_rank_fusion([first, second], limit=3)
+    assert [p["id"] for p in fused] == ["shared", "x", "z"]
@@ -0,0 +1,152 @@
+"""Tests for speculative prefetching of search results."""
+
+import asyncio
+import json
+import pytest
+from arxiv_mcp_server import conversion, prefetch
+from arxiv_mcp_server.prefetch import Prefetcher, get_prefetcher
+from arxiv_mcp_server.tools import download, handle_download, handle_search, search
+from arxiv_mcp_server.tools.download import conversion_statuses
+
+
+@pytest.fixture
+def prefetching(monkeypatch, mocker, mock_client, pdf_bytes):
+    """Enable prefetching against the mock client with instant conversion."""
+    for module in (search, download):
+        monkeypatch.setattr(module.settings, "PREFETCH_ENABLED", True)
+    for module in (prefetch, search):
+        mocker.patch(f"{module.__name__}.get_arxiv_client", return_value=mock_client)
+    mocker.patch.object(conversion.pymupdf4llm, "to_markdown", return_value="# Paper")
+
+    async def write_pdf(paper, path, priority=None):
+        await asyncio.sleep(0.01)
+        path.write_bytes(pdf_bytes)
+        return path
+
+    mock_client.download_pdf.side_effect = write_pdf
+    yield mock_client
+    conversion_statuses.clear()
+
+
+@pytest.mark.asyncio
+async def test_search_prefetches_top_hits(prefetching, isolated_storage):
+    """Test that a downloaded top hit is served from the prefetch cache."""
+    await handle_search({"query": "test"})
+    prefetcher = get_prefetcher()
+    await prefetcher.wait()
+    assert prefetcher.completed == 1
+    assert not (isolated_storage / "2103.12345.md").exists()
+
+    response = json.loads((await handle_download({"paper_id": "2103.12345"}))[0].text)
+
+    assert response["status"] == "success"
+    assert (isolated_storage / "2103.12345.md").read_text() == "# Paper"
+    assert prefetching.download_pdf.call_count == 1
+    assert prefetcher.stats()["hit_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_download_joins_prefetch_in_flight(prefetching, isolated_storage):
+    """Test that a download during a prefetch waits for it instead of refetching."""
+    get_prefetcher().schedule(["2103.12345"])
+
+    response = json.loads((await handle_download({"paper_id": "2103.12345"}))[0].text)
+    assert response["status"] == "converting"
+    await get_prefetcher().wait()
+    await asyncio.sleep(0.05)
+
+    assert conversion_statuses["2103.12345"].status == "success"
+    assert (isolated_storage / "2103.12345.md").exists()
+    assert prefetching.download_pdf.call_count == 1
+    assert get_prefetcher().late_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_counts_as_an_attempt(
+    prefetching, isolated_storage, pdf_bytes, mocker
+):
+    """Test that downloading again after a failed prefetch keeps the attempts."""
+    mocker.patch.object(download, "get_arxiv_client", return_value=prefetching)
+    mocker.patch.object(download, "convert_pdf_to_markdown", mocker.AsyncMock())
+    calls = []
+
+    async def write_pdf(paper, path, priority=None, progress=None):
+        calls.append(path)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise ConnectionError("reset")
+        path.write_bytes(pdf_bytes)
+        return path
+
+    prefetching.download_pdf.side_effect = write_pdf
+    get_prefetcher().schedule(["2103.12345"])
+
+    response = json.loads((await handle_download({"paper_id": "2103.12345"}))[0].text)
+    assert response["status"] == "converting"
+    await get_prefetcher().wait()
+    await asyncio.sleep(0.05)
+
+    status = conversion_statuses["2103.12345"]
+    assert (status.status, status.attempts) == ("converting", 2)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_and_disk_budget(
+    prefetching, mock_paper, tmp_path, pdf_bytes
+):
+    """Test that extra prefetches are dropped and old ones evicted."""
+
+    async def get_papers(ids, *args, **kwargs):
+        mock_paper.get_short_id.return_value = ids[0]
+        return [mock_paper]
+
+    prefetching.get_papers.side_effect = get_papers
+    prefetcher = Prefetcher(
+        tmp_path / "cache",
+        top_k=3,
+        max_concurrent=1,
+        max_bytes=len(pdf_bytes) + 100,
+    )
+
+    assert prefetcher.schedule(["2401.00001", "2401.00002", "2401.00003"]) == 1
+    assert prefetcher.dropped == 2
+    await prefetcher.wait()
+    prefetcher.schedule(["2401.00002"])
+    await prefetcher.wait()
+
+    assert prefetcher.evicted == 1
+    assert prefetcher.take("2401.00001") is None
+    assert prefetcher.take("2401.00002") is not None
+
+
+@pytest.mark.asyncio
+async def test_budget_is_reserved_before_prefetching(
+    prefetching, mock_paper, tmp_path, pdf_bytes
+):
+    """Test that concurrent prefetches only start if the budget has room."""
+
+    async def get_papers(ids, *args, **kwargs):
+        mock_paper.get_short_id.return_value = ids[0]
+        return [mock_paper]
+
+    prefetching.get_papers.side_effect = get_papers
+    prefetcher = Prefetcher(
+        tmp_path / "cache",
+        top_k=3,
+        max_concurrent=3,
+        max_bytes=2 * len(pdf_bytes) + 100,
+    )
+
+    # Nothing cached yet: the first prefetch reserves the whole budget
+    assert prefetcher.schedule(["2401.00001", "2401.00002", "2401.00003"]) == 1
+    await prefetcher.wait()
+    # Then room is reserved for papers of the size cached so far
+    prefetcher._claimed.add("2401.00001")
+    assert prefetcher.schedule(["2401.00002", "2401.00003"]) == 1
+    assert prefetcher.dropped == 3
+    await prefetcher.wait()
+
+    cached = sum(p.stat().st_size for p in (tmp_path / "cache").iterdir())
+    assert cached <= prefetcher.max_bytes
+    assert prefetcher.evicted == 0
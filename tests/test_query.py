@@ -0,0 +1,60 @@
+"""Tests for the arXiv query parser."""
+
+from datetime import datetime
+
+import pytest
+from arxiv_mcp_server.query import (
+    BoolOp,
+    DateRange,
+    Term,
+    parse_query,
+    to_query_string,
+)
+
+
+def test_field_terms_and_phrases():
+    """Test field prefixes, quoted phrases and bare words."""
+    assert parse_query('ti:"deep learning"') == Term("ti", "deep learning", True)
+    assert parse_query("au:hinton") == Term("au", "hinton")
+    assert parse_query('"neural networks"') == Term("all", "neural networks", True)
+    assert parse_query("") is None
+
+
+def test_operator_precedence():
+    """Test that AND binds tighter than OR and adjacent terms are ANDed."""
+    assert parse_query("a OR b AND c") == BoolOp(
+        "OR", Term("all", "a"), BoolOp("AND", Term("all", "b"), Term("all", "c"))
+    )
+    assert parse_query("a b") == BoolOp("AND", Term("all", "a"), Term("all", "b"))
+
+
+def test_parentheses_and_andnot():
+    """Test grouping and exclusion as documented in the search tool."""
+    node = parse_query('"deep learning" ANDNOT ("survey" OR "review")')
+    assert node == BoolOp(
+        "ANDNOT",
+        Term("all", "deep learning", True),
+        BoolOp("OR", Term("all", "survey", True), Term("all", "review", True)),
+    )
+
+
+def test_date_range():
+    """Test submittedDate ranges with and without a time."""
+    node = parse_query("submittedDate:[20230101 TO 202312311200]")
+    assert node == DateRange(datetime(2023, 1, 1), datetime(2023, 12, 31, 12, 0, 59))
+
+
+@pytest.mark.parametrize(
+    "query", ["(a OR b", "a AND", "foo:bar", "submittedDate:[2023 TO]"]
+)
+def test_invalid_queries(query):
+    """Test that malformed queries raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_query(query)
+
+
+def test_round_trip():
+    """Test that rendering and re-parsing yields the same tree."""
+    query = 'ti:"graph networks" AND (au:smith OR au:jones) ANDNOT cat:cs.CV'
+    node = parse_query(query)
+    assert parse_query(to_query_string(node)) == node
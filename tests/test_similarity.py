@@ -0,0 +1,92 @@
+"""Tests for the hashed TF-IDF similarity index."""
+
+import numpy as np
+import pytest
+from arxiv_mcp_server.similarity import SimilarityIndex, hashed_tf, tokenize
+
+VISION = "Contrastive learning of visual representations on ImageNet images."
+GRAPHS = "Message passing graph neural networks for molecule property prediction."
+VISION_2 = (
+    "Self-supervised visual representations with contrastive image augmentations."
+)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SimilarityIndex(tmp_path / "similarity", dimensions=1024)
+    index.add("2301.00001", VISION, mtime=1.0)
+    index.add("2301.00002", GRAPHS, mtime=1.0)
+    index.add("2301.00003", VISION_2, mtime=1.0)
+    return index
+
+
+def test_tokenize_drops_stopwords():
+    """Test that stopwords and single letters are removed."""
+    assert tokenize("The model of a Graph and 3D data") == ["model", "graph", "data"]
+
+
+def test_hashed_tf_is_sublinear():
+    """Test that repeated terms grow logarithmically."""
+    once = hashed_tf([("graph", 1)], 64)
+    many = hashed_tf([("graph graph graph graph", 1)], 64)
+    assert np.abs(many).max() == pytest.approx(1.0 + np.log(4))
+    assert np.abs(once).max() == 1.0
+
+
+def test_similar_ranks_by_topic(index):
+    """Test that papers sharing terms rank above unrelated ones."""
+    ranked = index.similar(index.vector_of("2301.00001"), exclude=["2301.00001"])
+    assert [paper_id for paper_id, _ in ranked] == ["2301.00003"]
+    assert 0 < ranked[0][1] < 1
+
+
+def test_free_text_query(index):
+    """Test that free text is matched against stored papers."""
+    ranked = index.similar(index.vectorize("graph networks for molecules"))
+    assert ranked[0][0] == "2301.00002"
+
+
+def test_index_is_persisted_and_updated(index, tmp_path):
+    """Test that vectors survive a reopen and re-adding replaces a row."""
+    index.add("2301.00002", VISION, mtime=2.0)
+
+    reopened = SimilarityIndex(tmp_path / "similarity", dimensions=1024)
+    assert len(reopened) == 3
+    assert not reopened.needs_update("2301.00002", 2.0)
+    ranked = reopened.similar(reopened.vector_of("2301.00001"), limit=1)
+    assert ranked[0][0] in {"2301.00001", "2301.00002"}
+    assert ranked[0][1] == pytest.approx(1.0)
+
+
+def test_dimension_change_rebuilds(index, tmp_path):
+    """Test that a different vector size discards the stored vectors."""
+    reopened = SimilarityIndex(tmp_path / "similarity", dimensions=512)
+    assert len(reopened) == 0
+
+
+def test_sync_saves_once_and_forgets_deleted_papers(tmp_path, mocker):
+    """Test that a sync writes the ID order once and drops deleted papers."""
+    storage = tmp_path / "papers"
+    storage.mkdir()
+    for paper_id, text in [
+        ("2301.00001", VISION),
+        ("2301.00002", GRAPHS),
+        ("2301.00003", VISION_2),
+    ]:
+        (storage / f"{paper_id}.md").write_text(text)
+    index = SimilarityIndex(tmp_path / "similarity", dimensions=1024)
+    save = mocker.spy(index, "_save_meta")
+    assert index.sync(storage) == 3
+    assert save.call_count == 1
+
+    (storage / "2301.00001.md").unlink()
+    assert index.sync(storage) == 0
+    assert sorted(index.ids) == ["2301.00002", "2301.00003"]
+    ranked = index.similar(index.vectorize("visual representations"))
+    assert [paper_id for paper_id, _ in ranked] == ["2301.00003"]
+
+    reopened = SimilarityIndex(tmp_path / "similarity", dimensions=1024)
+    assert sorted(reopened.ids) == ["2301.00002", "2301.00003"]
+    assert reopened.similar(reopened.vector_of("2301.00003"), limit=1) == [
+        ("2301.00003", 1.0)
+    ]
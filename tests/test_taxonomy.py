@@ -0,0 +1,35 @@
+"""Tests for the arXiv category taxonomy."""
+
+import pytest
+from arxiv_mcp_server.taxonomy import CATEGORIES, expand_categories, suggest_categories
+
+
+def test_taxonomy_covers_all_archives():
+    """Test that the table holds categories of every archive."""
+    assert CATEGORIES["cs.LG"] == "Machine Learning"
+    assert "cond-mat.str-el" in CATEGORIES
+    assert "quant-ph" in CATEGORIES
+    assert len(CATEGORIES) > 150
+
+
+def test_expand_normalizes_case():
+    """Test that categories are matched case-insensitively."""
+    assert expand_categories(["cs.ai", "HEP-TH"]) == ["cs.AI", "hep-th"]
+
+
+def test_expand_archives_and_groups():
+    """Test that archives become wildcards and covered categories are dropped."""
+    assert expand_categories(["cs.AI", "cs", "stat.ML"]) == ["cs.*", "stat.ML"]
+    assert expand_categories(["cs.*"]) == ["cs.*"]
+    physics = expand_categories(["physics", "physics.optics"])
+    assert "physics.*" in physics and "hep-th" in physics
+    assert "physics.optics" not in physics
+
+
+def test_unknown_category_suggestions():
+    """Test that typos are rejected with close matches."""
+    assert "cs.LG" in suggest_categories("cs.LGG")
+    with pytest.raises(ValueError, match=r"'cs\.XX' \(did you mean"):
+        expand_categories(["cs.XX"])
+    with pytest.raises(ValueError, match="'nonsense'"):
+        expand_categories(["nonsense"])
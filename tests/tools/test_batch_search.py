@@ -0,0 +1,106 @@
+"""Tests for batch search functionality."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from arxiv_mcp_server.clients import ResultPage
+from arxiv_mcp_server.tools import batch_search_tool, handle_batch_search
+
+
+def _paper(mock_paper, paper_id):
+    paper = MagicMock()
+    paper.get_short_id.return_value = paper_id
+    for attr in ("title", "authors", "summary", "categories", "published", "pdf_url"):
+        setattr(paper, attr, getattr(mock_paper, attr))
+    return paper
+
+
+@pytest.mark.asyncio
+async def test_batch_search_deduplicates_papers(mock_client, mock_paper):
+    """Test that papers shared between queries appear once in the paper table."""
+    hits = {
+        "(alpha)": ["2401.00001", "2401.00002"],
+        "(beta)": ["2401.00002", "2401.00003"],
+    }
+
+    async def pages(search, offset=0, **kwargs):
+        yield ResultPage([_paper(mock_paper, pid) for pid in hits[search.query]])
+
+    mock_client.pages.side_effect = pages
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_batch_search(
+            {"queries": [{"query": "alpha"}, {"query": "beta"}]}
+        )
+
+    content = json.loads(result[0].text)
+    assert content["total_queries"] == 2
+    assert sorted(content["papers"]) == ["2401.00001", "2401.00002", "2401.00003"]
+    assert content["queries"][0]["paper_ids"] == ["2401.00001", "2401.00002"]
+    assert content["queries"][1]["paper_ids"] == ["2401.00002", "2401.00003"]
+
+
+@pytest.mark.asyncio
+async def test_batch_search_runs_concurrently(mock_client, mock_paper):
+    """Test that the queries of a batch overlap instead of running in turn."""
+
+    async def pages(search, offset=0, **kwargs):
+        await asyncio.sleep(0.1)
+        yield ResultPage([mock_paper])
+
+    mock_client.pages.side_effect = pages
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        await handle_batch_search({"queries": [{"query": f"q{i}"} for i in range(5)]})
+
+    assert loop.time() - started < 0.4
+
+
+@pytest.mark.asyncio
+async def test_batch_search_reports_errors_per_query(mock_client):
+    """Test that one invalid query does not fail the whole batch."""
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_batch_search(
+            {
+                "queries": [
+                    {"query": "test"},
+                    {"query": "test", "categories": ["invalid.category"]},
+                ]
+            }
+        )
+
+    content = json.loads(result[0].text)
+    assert content["queries"][0]["paper_ids"] == ["2103.12345"]
+    assert "Invalid category" in content["queries"][1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_batch_search_limits_batch_size():
+    """Test that oversized batches are rejected."""
+    result = await handle_batch_search({"queries": [{"query": "q"}] * 1000})
+    assert result[0].text.startswith("Error: At most")
+
+
+@pytest.mark.asyncio
+async def test_batch_search_rejects_unsupported_options(mock_client):
+    """Test that batch queries only advertise and accept supported options."""
+    items = batch_search_tool.inputSchema["properties"]["queries"]["items"]
+    assert items["required"] == ["query"]
+    assert "cursor" not in items["properties"]
+
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_batch_search(
+            {"queries": [{"query": "test", "cursor": "abc", "split_or": True}]}
+        )
+
+    error = json.loads(result[0].text)["queries"][0]["error"]
+    assert error == "Unsupported options in a batch query: ['cursor', 'split_or']"
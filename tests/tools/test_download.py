@@ -1,8 +1,10 @@
 """Tests for paper download functionality."""
 
+import asyncio
 import pytest
 import json
 from datetime import datetime
+from unittest.mock import AsyncMock
 from arxiv_mcp_server.tools.download import (
     handle_download,
     get_paper_path,
@@ -11,12 +13,13 @@ from arxiv_mcp_server.tools.download import (
 
 
 @pytest.mark.asyncio
-async def test_download_paper_lifecycle(mocker, temp_storage_path):
+async def test_download_paper_lifecycle(mocker, mock_client, temp_storage_path):
     """Test the complete lifecycle of downloading and converting a paper."""
     paper_id = "2103.12345"
     # Mock arxiv client and PDF download
-    mocker.patch("arxiv.Client.results")
-    mocker.patch("arxiv.Result.download_pdf")
+    mocker.patch(
+        "arxiv_mcp_server.tools.download.get_arxiv_client", return_value=mock_client
+    )
 
     # Mock PDF to markdown conversion to happen immediately
     async def mock_convert(paper_id, pdf_path):
@@ -29,7 +32,9 @@ async def test_download_paper_lifecycle(mocker, temp_storage_path):
             status.completed_at = datetime.now()
         pdf_path.unlink()  # Cleanup PDF
 
-    mocker.patch("asyncio.to_thread", side_effect=mock_convert)
+    mocker.patch(
+        "arxiv_mcp_server.tools.download.convert_pdf_to_markdown", new=mock_convert
+    )
 
     # Initial download request
     response = await handle_download({"paper_id": paper_id})
@@ -65,7 +70,8 @@ async def test_download_existing_paper(temp_storage_path):
 @pytest.mark.asyncio
 async def test_download_nonexistent_paper(mocker):
     """Test downloading a paper that doesn't exist."""
-    mocker.patch("arxiv.Client.results", side_effect=StopIteration())
+    client = mocker.patch("arxiv_mcp_server.tools.download.get_arxiv_client")
+    client.return_value.get_papers = AsyncMock(return_value=[])
 
     response = await handle_download({"paper_id": "invalid.12345"})
     status = json.loads(response[0].text)
@@ -79,3 +85,75 @@ async def test_check_unknown_status():
     response = await handle_download({"paper_id": "2103.99999", "check_status": True})
     status = json.loads(response[0].text)
     assert status["status"] == "unknown"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_downloads_are_coalesced(mocker, mock_client, mock_paper):
+    """Test that concurrent requests for one paper share a single download."""
+    paper_id = "2103.54321"
+    get_path = mocker.patch("arxiv_mcp_server.tools.download.get_paper_path")
+    get_path.return_value.exists.return_value = False
+    mocker.patch(
+        "arxiv_mcp_server.tools.download.get_arxiv_client", return_value=mock_client
+    )
+    mocker.patch(
+        "arxiv_mcp_server.tools.download.convert_pdf_to_markdown", new=AsyncMock()
+    )
+
+    mock_paper.get_short_id.return_value = paper_id
+
+    async def slow_lookup(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return [mock_paper]
+
+    mock_client.get_papers.side_effect = slow_lookup
+
+    try:
+        responses = await asyncio.gather(
+            *(handle_download({"paper_id": paper_id}) for _ in range(3))
+        )
+    finally:
+        conversion_statuses.pop(paper_id, None)
+
+    statuses = [json.loads(r[0].text)["status"] for r in responses]
+    assert statuses == ["converting"] * 3
+    assert mock_client.get_papers.call_count == 1
+    assert mock_client.download_pdf.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_check_status_reports_transfer_progress(mocker, mock_client, mock_paper):
+    """Test that check_status shows the bytes received while downloading."""
+    paper_id = "2103.67890"
+    mocker.patch(
+        "arxiv_mcp_server.tools.download.get_arxiv_client", return_value=mock_client
+    )
+    mocker.patch(
+        "arxiv_mcp_server.tools.download.convert_pdf_to_markdown", new=AsyncMock()
+    )
+    halfway = asyncio.Event()
+    resume = asyncio.Event()
+
+    async def download(paper, path, priority=None, progress=None):
+        progress(0, 2048)
+        progress(1024, 2048)
+        halfway.set()
+        await resume.wait()
+        progress(2048, 2048)
+        return path
+
+    mock_paper.get_short_id.return_value = paper_id
+    mock_client.download_pdf.side_effect = download
+    task = asyncio.create_task(handle_download({"paper_id": paper_id}))
+    await asyncio.wait_for(halfway.wait(), timeout=5)
+
+    response = await handle_download({"paper_id": paper_id, "check_status": True})
+    status = json.loads(response[0].text)
+    assert status["status"] == "downloading"
+    assert (status["bytes_received"], status["bytes_total"]) == (1024, 2048)
+
+    resume.set()
+    await task
+    response = await handle_download({"paper_id": paper_id, "check_status": True})
+    assert json.loads(response[0].text)["bytes_received"] == 2048
+    conversion_statuses.pop(paper_id, None)
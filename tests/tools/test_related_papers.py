@@ -0,0 +1,64 @@
+"""Tests for the related papers tool."""
+
+import json
+import pytest
+from arxiv_mcp_server.tools import handle_related_papers
+
+
+@pytest.fixture
+def library(isolated_storage):
+    """Store three converted papers, two of them on the same topic."""
+    papers = {
+        "2301.00001": "## Method\n\nContrastive learning of visual representations.",
+        "2301.00002": "## Method\n\nGraph neural networks for molecules.",
+        "2301.00003": "## Method\n\nContrastive visual pretraining on images.",
+    }
+    for paper_id, markdown in papers.items():
+        (isolated_storage / f"{paper_id}.md").write_text(markdown)
+    return isolated_storage
+
+
+@pytest.mark.asyncio
+async def test_related_to_stored_paper(library):
+    """Test that a stored paper is matched against the rest of the library."""
+    result = await handle_related_papers({"paper_id": "2301.00001"})
+    content = json.loads(result[0].text)
+
+    ids = [p["id"] for p in content["papers"]]
+    assert ids[0] == "2301.00003"
+    assert "2301.00001" not in ids
+    assert content["papers"][0]["resource_uri"] == "arxiv://2301.00003"
+
+
+@pytest.mark.asyncio
+async def test_related_to_remote_paper(library, mocker, mock_client, mock_paper):
+    """Test that a paper outside the library is matched on its abstract."""
+    mock_paper.title = "Graph Networks"
+    mock_paper.summary = "Neural networks on molecule graphs."
+    mocker.patch(
+        "arxiv_mcp_server.tools.related_papers.get_arxiv_client",
+        return_value=mock_client,
+    )
+
+    result = await handle_related_papers({"paper_id": "2103.12345"})
+    content = json.loads(result[0].text)
+
+    assert content["papers"][0]["id"] == "2301.00002"
+
+
+@pytest.mark.asyncio
+async def test_related_requires_input():
+    """Test that a paper ID or text is required."""
+    result = await handle_related_papers({})
+    assert result[0].text.startswith("Error:")
+
+
+@pytest.mark.asyncio
+async def test_library_is_synced_once(mocker, library):
+    """Test that stored files are scanned on the first query only."""
+    from arxiv_mcp_server.similarity import SimilarityIndex
+
+    sync = mocker.spy(SimilarityIndex, "sync")
+    for _ in range(3):
+        await handle_related_papers({"text": "contrastive visual learning"})
+    assert sync.call_count == 1
@@ -3,14 +3,18 @@
 import pytest
 import json
 from unittest.mock import patch, MagicMock
+from arxiv_mcp_server.clients import ResultPage
 from arxiv_mcp_server.tools import handle_search
-from arxiv_mcp_server.tools.search import _validate_categories, _build_date_filter
+from arxiv_mcp_server.taxonomy import expand_categories
+from arxiv_mcp_server.tools.search import _build_date_filter, _encode_cursor
 
 
 @pytest.mark.asyncio
 async def test_basic_search(mock_client):
     """Test basic paper search functionality."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search({"query": "test query", "max_results": 1})
 
         assert len(result) == 1
@@ -25,7 +29,9 @@ async def test_basic_search(mock_client):
 @pytest.mark.asyncio
 async def test_search_with_categories(mock_client):
     """Test paper search with category filtering."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search(
             {"query": "test query", "categories": ["cs.AI", "cs.LG"], "max_results": 1}
         )
@@ -37,7 +43,9 @@ async def test_search_with_categories(mock_client):
 @pytest.mark.asyncio
 async def test_search_with_dates(mock_client):
     """Test paper search with date filtering."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search(
             {
                 "query": "test query",
@@ -55,7 +63,9 @@ async def test_search_with_dates(mock_client):
 @pytest.mark.asyncio
 async def test_search_with_invalid_dates(mock_client):
     """Test search with invalid date formats."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search(
             {"query": "test query", "date_from": "invalid-date", "max_results": 1}
         )
@@ -64,14 +74,16 @@ async def test_search_with_invalid_dates(mock_client):
 
 
 def test_validate_categories():
-    """Test category validation function."""
+    """Test category validation."""
     # Valid categories
-    assert _validate_categories(["cs.AI", "cs.LG"])
-    assert _validate_categories(["math.CO", "physics.gen-ph"])
+    assert expand_categories(["cs.AI", "cs.LG"])
+    assert expand_categories(["math.CO", "physics.gen-ph"])
 
     # Invalid categories
-    assert not _validate_categories(["invalid.category"])
-    assert not _validate_categories(["cs.AI", "invalid.test"])
+    with pytest.raises(ValueError):
+        expand_categories(["invalid.category"])
+    with pytest.raises(ValueError):
+        expand_categories(["cs.AI", "invalid.test"])
 
 
 def test_build_date_filter():
@@ -96,7 +108,9 @@ def test_build_date_filter():
 @pytest.mark.asyncio
 async def test_search_with_invalid_categories(mock_client):
     """Test search with invalid categories."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search(
             {
                 "query": "test query",
@@ -111,7 +125,9 @@ async def test_search_with_invalid_categories(mock_client):
 @pytest.mark.asyncio
 async def test_search_empty_query(mock_client):
     """Test search with empty query but categories."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search(
             {"query": "", "categories": ["cs.AI"], "max_results": 1}
         )
@@ -128,9 +144,11 @@ async def test_search_arxiv_error(mock_client):
 
     # Create proper ArxivError with required parameters
     error = arxiv.ArxivError("http://example.com", retry=3, message="API Error")
-    mock_client.results.side_effect = error
+    mock_client.pages.side_effect = error
 
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search({"query": "test", "max_results": 1})
 
         assert "ArXiv API error" in result[0].text
@@ -139,7 +157,9 @@ async def test_search_arxiv_error(mock_client):
 @pytest.mark.asyncio
 async def test_search_max_results_limiting(mock_client):
     """Test that max_results is properly limited."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         # Test that very large max_results gets capped
         result = await handle_search({"query": "test", "max_results": 1000})
 
@@ -151,7 +171,9 @@ async def test_search_max_results_limiting(mock_client):
 @pytest.mark.asyncio
 async def test_search_sort_by_relevance(mock_client):
     """Test search with relevance sorting (default)."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search({"query": "test", "sort_by": "relevance"})
 
         content = json.loads(result[0].text)
@@ -161,7 +183,9 @@ async def test_search_sort_by_relevance(mock_client):
 @pytest.mark.asyncio
 async def test_search_sort_by_date(mock_client):
     """Test search with date sorting."""
-    with patch("arxiv.Client", return_value=mock_client):
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
         result = await handle_search({"query": "test", "sort_by": "date"})
 
         content = json.loads(result[0].text)
@@ -187,3 +211,297 @@ async def test_search_no_query_optimization(mock_client):
     bool_query = "machine learning AND deep learning"
     optimized = _optimize_query(bool_query)
     assert optimized == bool_query
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_cached(mock_client):
+    """Test that identical searches are served from the result cache."""
+    from arxiv_mcp_server.tools.search import get_search_cache
+
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        first = await handle_search(
+            {"query": "test  query", "categories": ["cs.LG", "cs.AI"]}
+        )
+        second = await handle_search(
+            {"query": "test query", "categories": ["cs.AI", "cs.LG"]}
+        )
+
+    assert first[0].text == second[0].text
+    assert mock_client.pages.call_count == 1
+    stats = get_search_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_search_sends_date_filter_to_arxiv(mock_client):
+    """Test that date ranges are pushed into the arXiv query."""
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        await handle_search(
+            {"query": "test", "date_from": "2022-01-01", "date_to": "2024-01-01"}
+        )
+
+    search = mock_client.pages.call_args.args[0]
+    assert search.query == "(test) AND submittedDate:[202201010000 TO 202401012359]"
+    assert mock_client.pages.call_args.kwargs["max_pages"] > 1
+
+
+@pytest.mark.asyncio
+async def test_search_date_filter_fallback(mock_client, mock_paper):
+    """Test that a failing server-side date filter falls back to client-side."""
+    import arxiv
+
+    queries = []
+
+    async def pages(search, offset=0, **kwargs):
+        queries.append(search.query)
+        if "submittedDate" in search.query:
+            raise arxiv.HTTPError("http://example.com", 0, 500)
+        yield ResultPage([mock_paper])
+
+    mock_client.pages.side_effect = pages
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_search({"query": "test", "date_from": "2022-01-01"})
+
+    content = json.loads(result[0].text)
+    assert content["total_results"] == 1
+    assert queries[-1] == "(test)"
+
+
+@pytest.mark.asyncio
+async def test_search_empty_date_window_is_not_refetched(mock_client):
+    """Test that an empty server-side date filter result is final."""
+    queries = []
+
+    async def pages(search, offset=0, **kwargs):
+        queries.append(search.query)
+        yield ResultPage([], total_results=0)
+
+    mock_client.pages.side_effect = pages
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_search({"query": "test", "date_from": "2022-01-01"})
+
+    assert json.loads(result[0].text)["total_results"] == 0
+    assert len(queries) == 1
+    assert "submittedDate" in queries[0]
+
+
+@pytest.mark.asyncio
+async def test_search_client_side_filter_pages_further(mock_client, mock_paper):
+    """Test that entries dropped by client-side filtering are replaced."""
+    from datetime import datetime, timezone
+
+    old_paper = MagicMock()
+    old_paper.published = datetime(2010, 1, 1, tzinfo=timezone.utc)
+
+    async def pages(search, offset=0, **kwargs):
+        yield ResultPage([old_paper] * 3)
+        yield ResultPage([mock_paper] * 3, start=3)
+
+    mock_client.pages.side_effect = pages
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_search(
+            {"query": "test", "date_from": "2022-01-01", "max_results": 2}
+        )
+
+    content = json.loads(result[0].text)
+    assert content["total_results"] == 2
+    assert all(p["published"].startswith("2023") for p in content["papers"])
+
+
+@pytest.mark.asyncio
+async def test_search_streams_pages_through_progress(mock_client, mock_paper):
+    """Test that each parsed page is sent as a progress notification."""
+    second = MagicMock()
+    second.get_short_id.return_value = "2103.67890"
+    for attr in ("title", "authors", "summary", "categories", "published", "pdf_url"):
+        setattr(second, attr, getattr(mock_paper, attr))
+
+    async def pages(search, offset=0, **kwargs):
+        yield ResultPage([mock_paper])
+        yield ResultPage([second], start=1)
+
+    mock_client.pages.side_effect = pages
+    notifications = []
+
+    async def progress(done, total, message):
+        notifications.append((done, total, json.loads(message)))
+
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_search(
+            {"query": "test", "max_results": 5}, progress=progress
+        )
+
+    assert [(done, total) for done, total, _ in notifications] == [(1, 5), (2, 5)]
+    assert notifications[0][2]["papers"][0]["id"] == "2103.12345"
+    assert notifications[1][2]["papers"][0]["id"] == "2103.67890"
+    assert mock_client.pages.call_args.kwargs["first_page_size"] is not None
+    assert json.loads(result[0].text)["total_results"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_progress_is_shaped_like_the_response(mock_client):
+    """Test that streamed pages, also from the cache, use the output options."""
+    notifications = []
+
+    async def progress(done, total, message):
+        notifications.append(json.loads(message))
+
+    arguments = {"query": "test", "fields": ["id", "abstract"], "abstract_chars": 4}
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        await handle_search(arguments, progress=progress)
+        await handle_search(arguments, progress=progress)
+
+    assert mock_client.pages.call_count == 1
+    assert len(notifications) == 2
+    for message in notifications:
+        assert message["papers"] == [{"id": "2103.12345", "abstract": "Test…"}]
+
+
+@pytest.mark.asyncio
+async def test_search_compact_projection(mock_client):
+    """Test that search results can be projected and returned compactly."""
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_search(
+            {"query": "test query", "fields": ["id", "title"], "format": "compact"}
+        )
+
+        assert "\n" not in result[0].text
+        content = json.loads(result[0].text)
+        assert content["papers"][0] == {"id": "2103.12345", "title": "Test Paper"}
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_unknown_field():
+    """Test that unknown output fields are reported before searching."""
+    result = await handle_search({"query": "test query", "fields": ["doi"]})
+    assert result[0].text.startswith("Error: Unknown field(s) doi")
+
+
+@pytest.mark.asyncio
+async def test_search_cursor_pages_forward_and_back(mock_client, mock_paper):
+    """Test that cursors resume at the arXiv offset and cached pages are reused."""
+    papers = []
+    for i in range(7):
+        paper = MagicMock()
+        paper.get_short_id.return_value = f"2401.0000{i}"
+        for attr in ("title", "authors", "summary", "categories", "published"):
+            setattr(paper, attr, getattr(mock_paper, attr))
+        paper.pdf_url = None
+        papers.append(paper)
+    offsets = []
+
+    async def pages(search, offset=0, **kwargs):
+        offsets.append(offset)
+        yield ResultPage(papers[offset : offset + 8], offset, total_results=7)
+
+    mock_client.pages.side_effect = pages
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        first = json.loads(
+            (await handle_search({"query": "test", "max_results": 3}))[0].text
+        )
+        second = json.loads(
+            (await handle_search({"cursor": first["next_cursor"]}))[0].text
+        )
+        third = json.loads(
+            (await handle_search({"cursor": second["next_cursor"]}))[0].text
+        )
+        back = json.loads(
+            (await handle_search({"cursor": third["prev_cursor"]}))[0].text
+        )
+
+    assert first["total_available"] == 7
+    assert "prev_cursor" not in first
+    assert [p["id"] for p in second["papers"]] == [
+        "2401.00003",
+        "2401.00004",
+        "2401.00005",
+    ]
+    assert [p["id"] for p in third["papers"]] == ["2401.00006"]
+    assert "next_cursor" not in third
+    assert back["papers"] == second["papers"]
+    assert offsets == [0, 3, 6]
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_bad_cursor():
+    """Test that malformed cursors and cursor/query mismatches are errors."""
+    result = await handle_search({"cursor": "not-a-cursor"})
+    assert result[0].text.startswith("Error: Invalid cursor")
+
+    # Well-formed, but without the query to continue
+    cursor = _encode_cursor({"v": 1, "args": {"max_results": 5}, "offset": 10})
+    result = await handle_search({"cursor": cursor})
+    assert result[0].text == "Error: Invalid cursor: missing query"
+
+    result = await handle_search({})
+    assert result[0].text.startswith("Error: Either query or cursor")
+
+
+@pytest.mark.asyncio
+async def test_search_split_or_fuses_and_reuses_sub_queries(mock_client, mock_paper):
+    """Test that OR alternatives run separately, are fused and are cached."""
+    hits = {"(a)": ["1", "shared"], "(b)": ["2", "shared"], "(c)": ["3"]}
+
+    def paper(paper_id):
+        result = MagicMock()
+        result.get_short_id.return_value = f"2401.0000{paper_id}"
+        for attr in ("title", "authors", "summary", "categories", "published"):
+            setattr(result, attr, getattr(mock_paper, attr))
+        result.pdf_url = None
+        return result
+
+    queries = []
+
+    async def pages(search, offset=0, **kwargs):
+        queries.append(search.query)
+        yield ResultPage([paper(pid) for pid in hits[search.query]])
+
+    mock_client.pages.side_effect = pages
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        result = await handle_search({"query": "a OR b OR c", "split_or": True})
+        await handle_search({"query": "c OR b OR a", "split_or": True})
+
+    content = json.loads(result[0].text)
+    ids = [p["id"] for p in content["papers"]]
+    assert ids[0] == "2401.0000shared"
+    assert sorted(ids) == sorted(f"2401.0000{p}" for p in ("1", "2", "3", "shared"))
+    assert "next_cursor" not in content
+    assert sorted(queries) == ["(a)", "(b)", "(c)"]
+
+
+@pytest.mark.asyncio
+async def test_search_expands_categories(mock_client):
+    """Test that archives are sent as wildcards and typos never reach arXiv."""
+    with patch(
+        "arxiv_mcp_server.tools.search.get_arxiv_client", return_value=mock_client
+    ):
+        await handle_search({"query": "test", "categories": ["cs", "cs.AI"]})
+        search = mock_client.pages.call_args.args[0]
+        assert search.query == "(test) AND (cat:cs.*)"
+
+        mock_client.pages.reset_mock()
+        result = await handle_search({"query": "test", "categories": ["cs.XX"]})
+
+    assert "did you mean" in result[0].text
+    mock_client.pages.assert_not_called()
@@ -0,0 +1,57 @@
+"""Tests for the local full-text search tool."""
+
+import json
+import pytest
+from arxiv_mcp_server.tools import handle_search_local
+from arxiv_mcp_server.tools.download import convert_pdf_to_markdown
+
+
+@pytest.mark.asyncio
+async def test_search_local_finds_stored_papers(isolated_storage):
+    """Test that papers already in storage are indexed and searchable."""
+    (isolated_storage / "2301.00001.md").write_text(
+        "## Method\n\nWe use a diffusion model for protein design."
+    )
+
+    result = await handle_search_local({"query": "diffusion protein"})
+    content = json.loads(result[0].text)
+
+    assert content["total_results"] == 1
+    paper = content["papers"][0]
+    assert paper["id"] == "2301.00001"
+    assert "**diffusion**" in paper["snippets"][0]
+
+
+@pytest.mark.asyncio
+async def test_conversion_indexes_paper(mocker, isolated_storage, pdf_bytes):
+    """Test that a finished conversion is indexed immediately."""
+    mocker.patch(
+        "arxiv_mcp_server.conversion.pymupdf4llm.to_markdown",
+        return_value="## Results\n\nSparse attention halves the memory use.",
+    )
+    pdf_path = isolated_storage / "2301.00002.pdf"
+    pdf_path.write_bytes(pdf_bytes)
+    await convert_pdf_to_markdown("2301.00002", pdf_path)
+
+    from arxiv_mcp_server.fulltext import get_fulltext_index
+
+    hits = get_fulltext_index().search("sparse attention")
+    assert [hit.paper_id for hit in hits] == ["2301.00002"]
+
+
+@pytest.mark.asyncio
+async def test_search_local_invalid_query():
+    """Test that unsupported queries return an error."""
+    result = await handle_search_local({"query": "(unbalanced"})
+    assert result[0].text.startswith("Error:")
+
+
+@pytest.mark.asyncio
+async def test_storage_is_synced_once(mocker, isolated_storage):
+    """Test that stored files are scanned on the first query only."""
+    from arxiv_mcp_server.fulltext import FullTextIndex
+
+    sync = mocker.spy(FullTextIndex, "sync")
+    for _ in range(3):
+        await handle_search_local({"query": "diffusion"})
+    assert sync.call_count == 1